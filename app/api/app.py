@@ -9,8 +9,13 @@ import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.endpoints import router, query_router, metrics_router, modeler_router, turbulance_router
+from app.api.endpoints import (
+    router, query_router, metrics_router, modeler_router, turbulance_router,
+    generic_exception_handler
+)
 from app.config.settings import Settings
+from app.turbulance import TurbulanceOrchestrator
+from app.utils.llm_client import close_llm_clients
 
 # Configure logging
 logging.basicConfig(
@@ -49,6 +54,9 @@ def create_app() -> FastAPI:
     app.include_router(modeler_router)
     app.include_router(turbulance_router)
     
+    # Exception handlers
+    app.add_exception_handler(Exception, generic_exception_handler)
+    
     # Startup event
     @app.on_event("startup")
     async def startup_event():
@@ -58,6 +66,8 @@ def create_app() -> FastAPI:
     @app.on_event("shutdown")
     async def shutdown_event():
         logger.info("Shutting down Four-Sided Triangle API")
+        await close_llm_clients()
+        TurbulanceOrchestrator.shutdown_executor()
     
     return app
 
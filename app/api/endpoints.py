@@ -7,6 +7,7 @@ Four-Sided Triangle application.
 
 import logging
 import time
+from dataclasses import fields
 from typing import Dict, Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
@@ -24,6 +25,10 @@ from app.turbulance import TurbulanceParser, TurbulanceCompiler, TurbulanceOrche
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def _field_dict(obj: Any) -> Dict[str, Any]:
+    """Return a dataclass's fields as a shallow dict; slotted results have no __dict__."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
 # Create routers
 router = APIRouter()
 query_router = APIRouter(prefix="/query", tags=["query"])
@@ -343,7 +348,7 @@ async def parse_turbulance_script(request: TurbulanceParseRequest):
                 "computations": len(parsed_script.computations),
                 "variables": len(parsed_script.variables),
                 "dependencies": parsed_script.dependencies,
-                "parsed_script": parsed_script.__dict__
+                "parsed_script": _field_dict(parsed_script)
             },
             processing_time=processing_time,
             metadata={
@@ -387,7 +392,7 @@ async def compile_turbulance_protocol(request: TurbulanceParseRequest):
                 "total_cpu_estimate": compiled_protocol.resource_allocation.get("total_cpu", 0),
                 "total_memory_estimate": compiled_protocol.resource_allocation.get("total_memory", 0),
                 "auxiliary_files": list(compiled_protocol.auxiliary_files.keys()),
-                "compiled_protocol": compiled_protocol.__dict__
+                "compiled_protocol": _field_dict(compiled_protocol)
             },
             processing_time=processing_time,
             metadata={
@@ -433,7 +438,7 @@ async def execute_turbulance_protocol(
                 "steps_failed": len([r for r in result.step_results if not r.success]),
                 "annotated_script": result.annotated_script,
                 "auxiliary_files": result.auxiliary_files,
-                "execution_result": result.__dict__
+                "execution_result": _field_dict(result)
             },
             processing_time=processing_time,
             metadata={
@@ -550,7 +555,7 @@ async def validate_turbulance_script(request: TurbulanceParseRequest):
             }
         )
 
-@router.exception_handler(Exception)
+# APIRouter has no exception handlers; create_app() registers this on the app
 async def generic_exception_handler(request: Request, exc: Exception):
     """Generic exception handler for all routes."""
     logger.error(f"Unhandled exception in {request.url}: {str(exc)}", exc_info=True)
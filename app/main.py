@@ -24,6 +24,7 @@ from backend.distributed.compute_helpers import distributed_apply
 
 from app.api.router import router as api_router
 from app.utils.utils import format_response
+from app.utils.llm_client import close_llm_clients
 
 # Configure logging
 logging.basicConfig(
@@ -218,6 +219,9 @@ async def shutdown_event():
     if hasattr(app.state, "orchestrator"):
         await app.state.orchestrator.cleanup()
     
+    # Release pooled LLM provider connections
+    await close_llm_clients()
+    
     # Shutdown distributed computing
     if hasattr(app.state, "compute_manager"):
         app.state.compute_manager.shutdown()
@@ -3,71 +3,153 @@ Solver Adapters Package for the Four-Sided Triangle system.
 
 This package contains adapters for various optimization solvers that are
 used by the Four-Sided Triangle system to solve different types of problems.
-"""
-
-from app.solver.adapters.base_adapter import BaseSolverAdapter
-from app.solver.adapters.cvxpy_adapter import CVXPYOptimizationSolver
-from app.solver.adapters.pulp_adapter import PuLPOptimizationSolver
-from app.solver.adapters.scipy_adapter import ScipyOptimizationSolver
-from app.solver.adapters.ortools_adapter import ORToolsOptimizationSolver
-from app.solver.adapters.custom_adapter import CustomOptimizationSolver
 
-# Export all adapter classes
-__all__ = [
-    'BaseSolverAdapter',
-    'CVXPYOptimizationSolver',
-    'PuLPOptimizationSolver',
-    'ScipyOptimizationSolver',
-    'ORToolsOptimizationSolver',
-    'CustomOptimizationSolver'
-]
+Adapters are registered by "module:ClassName" spec, so importing this package
+does not import any solver backend. A backend is imported the first time the
+registry selects it, and a backend whose dependencies are missing is marked
+unavailable instead of failing the import of the whole package.
+"""
 
+import importlib
 import logging
-import importlib.util
-import sys
+from typing import Any, Dict, Tuple
+
+from app.solver.registry import solver_registry
 
 logger = logging.getLogger(__name__)
 
-def load_adapters():
+# Adapter class name -> defining module, resolved on attribute access
+_ADAPTER_MODULES = {
+    'BaseSolverAdapter': 'app.solver.adapters.base_adapter',
+    'CVXPYOptimizationSolver': 'app.solver.adapters.cvxpy_adapter',
+    'PuLPOptimizationSolver': 'app.solver.adapters.pulp_adapter',
+    'ScipyOptimizationSolver': 'app.solver.adapters.scipy_adapter',
+    'ORToolsMIPSolver': 'app.solver.adapters.ortools_adapter',
+    'ORToolsCPSolver': 'app.solver.adapters.ortools_adapter',
+    'CustomOptimizationSolver': 'app.solver.adapters.custom_adapter'
+}
+
+# Export all adapter classes
+__all__ = list(_ADAPTER_MODULES) + ['register_builtin_solvers']
+
+# Built-in solvers: (solver_id, "module:ClassName" spec, capabilities)
+_BUILTIN_SOLVERS: Tuple[Tuple[str, str, Dict[str, Any]], ...] = (
+    (
+        "scipy_optimization",
+        "app.solver.adapters.scipy_adapter:ScipyOptimizationSolver",
+        {
+            "problem_types": ["linear", "integer_linear", "mixed_integer", "nonlinear", "constrained", "least_squares", "general"],
+            "variable_types": ["continuous", "integer", "binary"],
+            "max_variables": 10000,
+            "max_constraints": 10000,
+            "algorithms": ["highs", "milp", "SLSQP", "Nelder-Mead", "Powell", "BFGS", "L-BFGS-B", "TNC", "CG", "trust-constr"],
+            "performance_profile": {
+                "speed": 0.8,
+                "robustness": 0.9,
+                "memory_efficiency": 0.7
+            }
+        }
+    ),
+    (
+        "pulp_optimization",
+        "app.solver.adapters.pulp_adapter:PuLPOptimizationSolver",
+        {
+            "problem_types": ["linear", "integer_linear", "mixed_integer"],
+            "variable_types": ["continuous", "integer", "binary"],
+            "max_variables": 100000,
+            "max_constraints": 100000,
+            "algorithms": ["simplex", "branch-and-bound", "branch-and-cut"],
+            "performance_profile": {
+                "speed": 0.7,
+                "robustness": 0.8,
+                "memory_efficiency": 0.8
+            }
+        }
+    ),
+    (
+        "cvxpy_optimization",
+        "app.solver.adapters.cvxpy_adapter:CVXPYOptimizationSolver",
+        {
+            "problem_types": ["convex", "linear", "quadratic", "semidefinite", "geometric"],
+            "variable_types": ["continuous", "integer", "binary", "complex"],
+            "max_variables": 50000,
+            "max_constraints": 50000,
+            "algorithms": ["interior-point", "SOCP", "SDP", "ADMM", "SCS"],
+            "performance_profile": {
+                "speed": 0.8,
+                "robustness": 0.9,
+                "memory_efficiency": 0.7
+            }
+        }
+    ),
+    (
+        "ortools_mip",
+        "app.solver.adapters.ortools_adapter:ORToolsMIPSolver",
+        {
+            "problem_types": ["linear", "integer_linear", "mixed_integer"],
+            "variable_types": ["continuous", "integer", "binary"],
+            "max_variables": 1000000,
+            "max_constraints": 1000000,
+            "algorithms": ["simplex", "branch-and-cut"],
+            "performance_profile": {
+                "speed": 0.8,
+                "robustness": 0.9,
+                "memory_efficiency": 0.8
+            }
+        }
+    ),
+    (
+        "ortools_cp",
+        "app.solver.adapters.ortools_adapter:ORToolsCPSolver",
+        {
+            "problem_types": ["constraint_satisfaction", "integer_programming"],
+            "variable_types": ["integer", "binary"],
+            "max_variables": 100000,
+            "max_constraints": 100000,
+            "algorithms": ["cp-sat", "constraint_programming"],
+            "performance_profile": {
+                "speed": 0.9,
+                "robustness": 0.8,
+                "memory_efficiency": 0.7
+            }
+        }
+    ),
+    (
+        "custom_optimization",
+        "app.solver.adapters.custom_adapter:CustomOptimizationSolver",
+        {
+            "problem_types": ["nonlinear", "combinatorial", "black_box", "heuristic"],
+            "variable_types": ["continuous", "integer", "binary"],
+            "max_variables": 1000,
+            "max_constraints": 100,
+            "algorithms": ["simulated_annealing", "genetic_algorithm", "particle_swarm", "tabu_search"],
+            "performance_profile": {
+                "speed": 0.6,
+                "robustness": 0.7,
+                "memory_efficiency": 0.9
+            }
+        }
+    )
+)
+
+def register_builtin_solvers() -> None:
     """
-    Load all solver adapters dynamically.
-    
-    This function attempts to import all adapter modules and register their
-    solvers with the global registry.
+    Register the built-in solver adapters with the global registry.
+
+    Solvers are registered by spec; no adapter module is imported here.
     """
-    adapter_modules = [
-        "scipy_adapter",
-        "pulp_adapter",
-        "cvxpy_adapter",
-        "ortools_adapter",
-        "custom_adapter"
-    ]
-    
-    successful_imports = 0
-    
-    for module_name in adapter_modules:
-        try:
-            # Construct the full module path
-            full_module_name = f"app.solver.adapters.{module_name}"
-            
-            # Try to import the module
-            if importlib.util.find_spec(full_module_name):
-                importlib.import_module(full_module_name)
-                successful_imports += 1
-                logger.info(f"Successfully loaded solver adapter: {module_name}")
-            else:
-                logger.warning(f"Could not find solver adapter module: {module_name}")
-        
-        except ImportError as e:
-            # Some adapters might have dependencies that aren't installed
-            # We'll log this but continue attempting to load other adapters
-            logger.warning(f"Could not import solver adapter {module_name}: {str(e)}")
-        
-        except Exception as e:
-            # Log any other errors during adapter loading
-            logger.error(f"Error loading solver adapter {module_name}: {str(e)}")
-    
-    logger.info(f"Loaded {successful_imports} out of {len(adapter_modules)} solver adapters")
+    for solver_id, spec, capabilities in _BUILTIN_SOLVERS:
+        solver_registry.register_solver(solver_id, spec, capabilities)
+
+    logger.info(f"Registered {len(_BUILTIN_SOLVERS)} solver adapters")
+
+def __getattr__(name: str) -> Any:
+    # Adapter classes stay importable from this package, but their backend
+    # is only imported when the class is first accessed
+    module_name = _ADAPTER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
 
-# Automatically load all adapters when the package is imported
-load_adapters()
+# Register the built-in adapters when the package is imported
+register_builtin_solvers()
@@ -11,8 +11,6 @@ import time
 import random
 import math
 
-from app.solver.registry import solver_registry
-
 logger = logging.getLogger(__name__)
 
 class CustomOptimizationSolver:
@@ -606,21 +604,3 @@ class CustomOptimizationSolver:
         """
         # Simple hash: concatenate string representations of values
         return ";".join(f"{k}:{v}" for k, v in sorted(solution.items()))
-
-# Register custom solver with the registry
-solver_registry.register_solver(
-    solver_id="custom_optimization",
-    solver_class=CustomOptimizationSolver,
-    capabilities={
-        "problem_types": ["nonlinear", "combinatorial", "black_box", "heuristic"],
-        "variable_types": ["continuous", "integer", "binary"],
-        "max_variables": 1000,
-        "max_constraints": 100,
-        "algorithms": ["simulated_annealing", "genetic_algorithm", "particle_swarm", "tabu_search"],
-        "performance_profile": {
-            "speed": 0.6,
-            "robustness": 0.7,
-            "memory_efficiency": 0.9
-        }
-    }
-)
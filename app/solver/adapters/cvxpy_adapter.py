@@ -15,7 +15,6 @@ try:
 except ImportError:
     raise ImportError("CVXPY is required for this adapter. Install with 'pip install cvxpy'")
 
-from app.solver.registry import solver_registry
 from app.solver.adapters.base_adapter import BaseSolverAdapter
 
 logger = logging.getLogger(__name__)
@@ -369,21 +368,3 @@ class CVXPYOptimizationSolver(BaseSolverAdapter):
                         solution[name] = var.value
         
         return solution
-
-# Register this solver with the registry
-solver_registry.register_solver(
-    solver_id="cvxpy_optimization",
-    solver_class=CVXPYOptimizationSolver,
-    capabilities={
-        "problem_types": ["convex", "linear", "quadratic", "semidefinite", "geometric"],
-        "variable_types": ["continuous", "integer", "binary", "complex"],
-        "max_variables": 50000,
-        "max_constraints": 50000,
-        "algorithms": ["interior-point", "SOCP", "SDP", "ADMM", "SCS"],
-        "performance_profile": {
-            "speed": 0.8,
-            "robustness": 0.9,
-            "memory_efficiency": 0.7
-        }
-    }
-)
@@ -17,8 +17,6 @@ try:
 except ImportError:
     raise ImportError("Google OR-Tools is required for this adapter. Install with 'pip install ortools'")
 
-from app.solver.registry import solver_registry
-
 logger = logging.getLogger(__name__)
 
 class ORToolsMIPSolver:
@@ -548,40 +546,3 @@ class ORToolsCPSolver:
             return "unknown"
         else:
             return f"unknown_status_{status}"
-
-
-# Register MIP solver with the registry
-solver_registry.register_solver(
-    solver_id="ortools_mip",
-    solver_class=ORToolsMIPSolver,
-    capabilities={
-        "problem_types": ["linear", "integer_linear", "mixed_integer"],
-        "variable_types": ["continuous", "integer", "binary"],
-        "max_variables": 1000000,
-        "max_constraints": 1000000,
-        "algorithms": ["simplex", "branch-and-cut"],
-        "performance_profile": {
-            "speed": 0.8,
-            "robustness": 0.9,
-            "memory_efficiency": 0.8
-        }
-    }
-)
-
-# Register CP solver with the registry
-solver_registry.register_solver(
-    solver_id="ortools_cp",
-    solver_class=ORToolsCPSolver,
-    capabilities={
-        "problem_types": ["constraint_satisfaction", "integer_programming"],
-        "variable_types": ["integer", "binary"],
-        "max_variables": 100000,
-        "max_constraints": 100000,
-        "algorithms": ["cp-sat", "constraint_programming"],
-        "performance_profile": {
-            "speed": 0.9,
-            "robustness": 0.8,
-            "memory_efficiency": 0.7
-        }
-    }
-)
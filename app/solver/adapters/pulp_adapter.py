@@ -7,6 +7,7 @@ the system to leverage PuLP for various linear optimization problems.
 
 from typing import Dict, Any, List, Optional, Callable, Tuple
 import logging
+import os
 import time
 
 try:
@@ -14,8 +15,6 @@ try:
 except ImportError:
     raise ImportError("PuLP is required for this adapter. Install with 'pip install pulp'")
 
-from app.solver.registry import solver_registry
-
 logger = logging.getLogger(__name__)
 
 class PuLPOptimizationSolver:
@@ -26,14 +25,32 @@ class PuLPOptimizationSolver:
     Triangle solver interface, supporting various linear problems.
     """
     
+    # Constraint type names mapped to PuLP constraint senses
+    _CONSTRAINT_SENSES = {
+        "eq": pulp.LpConstraintEQ,
+        "equality": pulp.LpConstraintEQ,
+        "leq": pulp.LpConstraintLE,
+        "inequality_leq": pulp.LpConstraintLE,
+        "geq": pulp.LpConstraintGE,
+        "inequality_geq": pulp.LpConstraintGE
+    }
+    
     def __init__(self):
         """Initialize the PuLP optimization adapter."""
         self.config = {
             "timeLimit": 120,  # 2 minutes
             "verbose": False,
             "solver": None,  # Default solver
-            "mip_gap": 0.01   # 1% optimality gap for MIP
+            "mip_gap": 0.01,  # 1% optimality gap for MIP
+            "threads": None,  # Solver threads, defaults to all cores
+            "zero_tol": 1e-14,  # Coefficients at or below this magnitude are dropped
+            "model_cache_size": 32  # Compiled models kept for re-solving
         }
+        # Compiled models keyed by problem structure: (prob, variables, constraints)
+        self._model_cache: Dict[Tuple, Tuple[pulp.LpProblem, Dict[str, pulp.LpVariable], List[pulp.LpConstraint]]] = {}
+        # Solver instance reused across solves while the config is unchanged
+        self._solver_instance: Optional[pulp.LpSolver] = None
+        self._solver_key: Optional[Tuple] = None
         logger.info("PuLP Optimization Solver initialized")
     
     def configure(self, config: Dict[str, Any]) -> None:
@@ -86,7 +103,7 @@ class PuLPOptimizationSolver:
                 "solver_details": {
                     "name": "pulp",
                     "status_code": status,
-                    "solver_used": str(model.solver)
+                    "solver_used": type(model.solver).__name__
                 }
             }
             
@@ -109,6 +126,11 @@ class PuLPOptimizationSolver:
         """
         Create a PuLP model from the problem definition.
         
+        Models are cached by their structure (variable names and types,
+        constraint names, types and variables, objective sense and variables).
+        A structurally identical problem reuses the cached model and only has
+        its coefficients, right-hand sides and bounds updated.
+        
         Args:
             problem_definition: Problem definition
             
@@ -120,6 +142,27 @@ class PuLPOptimizationSolver:
         constraints = problem_definition.get("constraints", [])
         variables_def = problem_definition.get("variables", [])
         
+        # Validate term counts before any model work is done
+        if len(objective.get("coefficients", [])) != len(objective.get("variables", [])):
+            raise ValueError("Objective coefficients and variables must have the same length")
+        for constraint in constraints:
+            if len(constraint.get("coefficients", [])) != len(constraint.get("variables", [])):
+                raise ValueError("Constraint coefficients and variables must have the same length")
+        
+        key = self._structure_key(objective, constraints, variables_def)
+        cached = self._model_cache.get(key)
+        if cached is not None:
+            prob, variables, constraint_refs = cached
+            try:
+                self._update_model(prob, variables, constraint_refs,
+                                   objective, constraints, variables_def)
+                return prob
+            except Exception as e:
+                # A partially updated model must never be reused; drop it
+                # and fall through to building a fresh one
+                logger.warning("Failed to update cached PuLP model, rebuilding: %s", e)
+                self._model_cache.pop(key, None)
+        
         # Determine objective sense
         sense = objective.get("sense", "minimize")
         if sense.lower() == "minimize":
@@ -134,18 +177,7 @@ class PuLPOptimizationSolver:
         variables = {}
         for i, var_def in enumerate(variables_def):
             name = var_def.get("name", f"x{i}")
-            lower_bound = var_def.get("lower_bound", 0)
-            upper_bound = var_def.get("upper_bound", None)
-            
-            var_type = var_def.get("type", "continuous")
-            if var_type == "integer":
-                var_cat = pulp.LpInteger
-            elif var_type == "binary":
-                var_cat = pulp.LpBinary
-                lower_bound = 0
-                upper_bound = 1
-            else:
-                var_cat = pulp.LpContinuous
+            lower_bound, upper_bound, var_cat = self._variable_spec(var_def)
             
             variables[name] = pulp.LpVariable(
                 name, 
@@ -158,15 +190,18 @@ class PuLPOptimizationSolver:
         obj_coeffs = objective.get("coefficients", [])
         obj_vars = objective.get("variables", [])
         
-        if len(obj_coeffs) == len(obj_vars):
-            # Create expression: sum(coeff * var)
-            obj_expr = pulp.lpSum(obj_coeffs[i] * variables[var_name] 
-                                  for i, var_name in enumerate(obj_vars))
-            prob += obj_expr
-        else:
-            raise ValueError("Objective coefficients and variables must have the same length")
+        # Create expression: sum(coeff * var), built in a single constructor
+        # call; zero terms are omitted so they never reach the solver
+        zero_tol = self.config.get("zero_tol", 0.0)
+        obj_var_list = [variables[var_name] for var_name in obj_vars]
+        obj_expr = pulp.LpAffineExpression(
+            [(var, coeff) for var, coeff in zip(obj_var_list, obj_coeffs) if abs(coeff) > zero_tol]
+        )
+        prob += obj_expr
         
         # Add constraints
+        constraint_refs = []
+        var_list_cache = {tuple(obj_vars): obj_var_list}
         for i, constraint in enumerate(constraints):
             name = constraint.get("name", f"constraint{i}")
             constraint_type = constraint.get("type", "leq")
@@ -175,25 +210,122 @@ class PuLPOptimizationSolver:
             coeffs = constraint.get("coefficients", [])
             vars_names = constraint.get("variables", [])
             
-            if len(coeffs) == len(vars_names):
-                # Create expression: sum(coeff * var)
-                expr = pulp.lpSum(coeffs[i] * variables[var_name] 
-                                 for i, var_name in enumerate(vars_names))
-                
-                # Add constraint based on type
-                if constraint_type == "eq" or constraint_type == "equality":
-                    prob += (expr == rhs, name)
-                elif constraint_type == "leq" or constraint_type == "inequality_leq":
-                    prob += (expr <= rhs, name)
-                elif constraint_type == "geq" or constraint_type == "inequality_geq":
-                    prob += (expr >= rhs, name)
-                else:
-                    raise ValueError(f"Unsupported constraint type: {constraint_type}")
-            else:
-                raise ValueError("Constraint coefficients and variables must have the same length")
+            # Create expression: sum(coeff * var); constraints over the
+            # same variable ordering share one resolved variable list
+            vars_key = tuple(vars_names)
+            var_list = var_list_cache.get(vars_key)
+            if var_list is None:
+                var_list = [variables[var_name] for var_name in vars_names]
+                var_list_cache[vars_key] = var_list
+            expr = pulp.LpAffineExpression(
+                [(var, coeff) for var, coeff in zip(var_list, coeffs) if abs(coeff) > zero_tol]
+            )
+            
+            # Add constraint based on type, bypassing LpProblem.__iadd__
+            sense = self._CONSTRAINT_SENSES.get(constraint_type)
+            if sense is None:
+                raise ValueError(f"Unsupported constraint type: {constraint_type}")
+            lp_constraint = pulp.LpConstraint(e=expr, sense=sense, name=name, rhs=rhs)
+            prob.addConstraint(lp_constraint)
+            constraint_refs.append(lp_constraint)
+        
+        # Cache the compiled model, evicting the oldest entry when full
+        cache_size = self.config.get("model_cache_size", 0)
+        if cache_size > 0:
+            if len(self._model_cache) >= cache_size:
+                self._model_cache.pop(next(iter(self._model_cache)))
+            self._model_cache[key] = (prob, variables, constraint_refs)
         
         return prob
     
+    def _structure_key(self, objective: Dict[str, Any], constraints: List[Dict[str, Any]],
+                       variables_def: List[Dict[str, Any]]) -> Tuple:
+        """
+        Compute a hashable key describing the structure of a problem.
+        
+        Args:
+            objective: Objective definition
+            constraints: Constraint definitions
+            variables_def: Variable definitions
+            
+        Returns:
+            Tuple identifying the model structure
+        """
+        return (
+            objective.get("sense", "minimize").lower(),
+            tuple(objective.get("variables", [])),
+            tuple((var_def.get("name", f"x{i}"), var_def.get("type", "continuous"))
+                  for i, var_def in enumerate(variables_def)),
+            tuple((c.get("name", f"constraint{i}"), c.get("type", "leq"), tuple(c.get("variables", [])))
+                  for i, c in enumerate(constraints))
+        )
+    
+    def _variable_spec(self, var_def: Dict[str, Any]) -> Tuple[Optional[float], Optional[float], str]:
+        """
+        Resolve bounds and PuLP category for a variable definition.
+        
+        Args:
+            var_def: Variable definition
+            
+        Returns:
+            Tuple of (lower_bound, upper_bound, category)
+        """
+        lower_bound = var_def.get("lower_bound", 0)
+        upper_bound = var_def.get("upper_bound", None)
+        
+        var_type = var_def.get("type", "continuous")
+        if var_type == "integer":
+            var_cat = pulp.LpInteger
+        elif var_type == "binary":
+            var_cat = pulp.LpBinary
+            lower_bound = 0
+            upper_bound = 1
+        else:
+            var_cat = pulp.LpContinuous
+        
+        return lower_bound, upper_bound, var_cat
+    
+    def _update_model(self, prob: pulp.LpProblem, variables: Dict[str, pulp.LpVariable],
+                      constraint_refs: List[pulp.LpConstraint], objective: Dict[str, Any],
+                      constraints: List[Dict[str, Any]], variables_def: List[Dict[str, Any]]) -> None:
+        """
+        Update a cached model in place with new problem data.
+        
+        Args:
+            prob: Cached PuLP model
+            variables: Cached variables by name
+            constraint_refs: Cached constraints in definition order
+            objective: Objective definition
+            constraints: Constraint definitions
+            variables_def: Variable definitions
+        """
+        for i, var_def in enumerate(variables_def):
+            var = variables[var_def.get("name", f"x{i}")]
+            var.lowBound, var.upBound, _ = self._variable_spec(var_def)
+        
+        zero_tol = self.config.get("zero_tol", 0.0)
+        
+        obj_coeffs = objective.get("coefficients", [])
+        obj_vars = objective.get("variables", [])
+        for coeff, var_name in zip(obj_coeffs, obj_vars):
+            if abs(coeff) > zero_tol:
+                prob.objective[variables[var_name]] = coeff
+            else:
+                prob.objective.pop(variables[var_name], None)
+        
+        for constraint, ref in zip(constraints, constraint_refs):
+            coeffs = constraint.get("coefficients", [])
+            vars_names = constraint.get("variables", [])
+            # PuLP 3.x constraints wrap their expression in ``expr``; on
+            # PuLP 2.x the constraint is itself the expression
+            expr = getattr(ref, "expr", ref)
+            for coeff, var_name in zip(coeffs, vars_names):
+                if abs(coeff) > zero_tol:
+                    expr[variables[var_name]] = coeff
+                else:
+                    expr.pop(variables[var_name], None)
+            ref.changeRHS(constraint.get("rhs", 0))
+    
     def _solve_model(self, model: pulp.LpProblem) -> Tuple[int, Dict[str, Any]]:
         """
         Solve the PuLP model.
@@ -204,22 +336,8 @@ class PuLPOptimizationSolver:
         Returns:
             Tuple of (status, solution_dict)
         """
-        # Select solver
-        solver = self.config.get("solver")
-        if solver == "GLPK":
-            solver = pulp.GLPK(msg=self.config["verbose"], timeLimit=self.config["timeLimit"])
-        elif solver == "CPLEX":
-            solver = pulp.CPLEX(msg=self.config["verbose"], timeLimit=self.config["timeLimit"])
-        elif solver == "GUROBI":
-            solver = pulp.GUROBI(msg=self.config["verbose"], timeLimit=self.config["timeLimit"])
-        elif solver == "CBC":
-            solver = pulp.PULP_CBC_CMD(msg=self.config["verbose"], timeLimit=self.config["timeLimit"])
-        else:
-            # Default to CBC
-            solver = pulp.PULP_CBC_CMD(msg=self.config["verbose"], timeLimit=self.config["timeLimit"])
-        
         # Solve the model
-        status = model.solve(solver)
+        status = model.solve(self._get_solver())
         
         # Extract solution
         solution = {}
@@ -229,6 +347,46 @@ class PuLPOptimizationSolver:
         
         return status, solution
     
+    def _get_solver(self) -> pulp.LpSolver:
+        """
+        Return the configured PuLP solver, reusing it while the config is unchanged.
+        
+        Returns:
+            PuLP solver instance
+        """
+        solver_key = (
+            self.config.get("solver"),
+            self.config["verbose"],
+            self.config["timeLimit"],
+            self.config["mip_gap"],
+            self.config.get("threads")
+        )
+        if self._solver_instance is not None and self._solver_key == solver_key:
+            return self._solver_instance
+        
+        # Select solver
+        solver = self.config.get("solver")
+        threads = self.config.get("threads") or os.cpu_count()
+        gap_rel = self.config["mip_gap"]
+        if solver == "GLPK":
+            solver = pulp.GLPK(msg=self.config["verbose"], timeLimit=self.config["timeLimit"])
+        elif solver == "CPLEX":
+            solver = pulp.CPLEX(msg=self.config["verbose"], timeLimit=self.config["timeLimit"],
+                                gapRel=gap_rel, threads=threads)
+        elif solver == "GUROBI":
+            solver = pulp.GUROBI(msg=self.config["verbose"], timeLimit=self.config["timeLimit"],
+                                 gapRel=gap_rel, Threads=threads)
+        else:
+            # CBC, also the default; warmStart seeds it with the previous
+            # solution of a cached model
+            solver = pulp.PULP_CBC_CMD(msg=self.config["verbose"], timeLimit=self.config["timeLimit"],
+                                       gapRel=gap_rel, threads=threads, presolve=True,
+                                       warmStart=True, keepFiles=False)
+        
+        self._solver_instance = solver
+        self._solver_key = solver_key
+        return solver
+    
     def _get_status_message(self, status: int) -> str:
         """
         Convert PuLP status code to human-readable message.
@@ -248,21 +406,3 @@ class PuLPOptimizationSolver:
         }
         
         return status_messages.get(status, f"Unknown status: {status}")
-
-# Register this solver with the registry
-solver_registry.register_solver(
-    solver_id="pulp_optimization",
-    solver_class=PuLPOptimizationSolver,
-    capabilities={
-        "problem_types": ["linear", "integer_linear", "mixed_integer"],
-        "variable_types": ["continuous", "integer", "binary"],
-        "max_variables": 100000,
-        "max_constraints": 100000,
-        "algorithms": ["simplex", "branch-and-bound", "branch-and-cut"],
-        "performance_profile": {
-            "speed": 0.7,
-            "robustness": 0.8,
-            "memory_efficiency": 0.8
-        }
-    }
-)
@@ -6,18 +6,67 @@ the system to leverage SciPy's solvers for various optimization problems.
 """
 
 from typing import Dict, Any, List, Optional, Callable, Tuple
+import asyncio
 import logging
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 
 try:
-    from scipy import optimize
+    from scipy import optimize, sparse
 except ImportError:
     raise ImportError("SciPy is required for this adapter. Install with 'pip install scipy'")
 
-from app.solver.registry import solver_registry
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _default_quadratic(x):
+        s = 0.0
+        for i in range(x.shape[0]):
+            s += x[i] * x[i]
+        return s
+
+    @njit(cache=True)
+    def _default_quadratic_grad(x):
+        return 2.0 * x
+
+    @njit(cache=True)
+    def _default_residual(x):
+        r = np.empty(2)
+        r[0] = x[0] * x[0] + x[1] * x[1] - 1.0
+        r[1] = x[0] - x[1]
+        return r
+
+    @njit(cache=True)
+    def _default_residual_jac(x):
+        j = np.empty((2, 2))
+        j[0, 0] = 2.0 * x[0]
+        j[0, 1] = 2.0 * x[1]
+        j[1, 0] = 1.0
+        j[1, 1] = -1.0
+        return j
+else:
+    def _default_quadratic(x):
+        return np.sum(x**2)
+
+    def _default_quadratic_grad(x):
+        return 2.0 * x
+
+    def _default_residual(x):
+        return np.array([x[0]**2 + x[1]**2 - 1, x[0] - x[1]])
+
+    def _default_residual_jac(x):
+        return np.array([[2.0 * x[0], 2.0 * x[1]], [1.0, -1.0]])
+
 class ScipyOptimizationSolver:
     """
     Adapter for SciPy optimization solvers.
@@ -31,8 +80,19 @@ class ScipyOptimizationSolver:
         self.config = {
             "max_iterations": 1000,
             "tolerance": 1e-6,
-            "verbose": False
+            "verbose": False,
+            "linprog_method": "highs",
+            "mip_gap": 0.01,  # Relative optimality gap for milp
+            "timeLimit": None,  # milp time limit in seconds
+            "object_cache_size": 64,  # Cached Bounds/constraint objects
+            "large_problem_size": 100  # Variables above which trust-constr is used
         }
+        # Last optimum per problem signature, used to warm-start repeated solves
+        # of problems that opt in with "warm_start": True
+        self._last_x: Dict[Tuple, np.ndarray] = {}
+        # Bounds / NonlinearConstraint objects keyed by their definitions
+        self._bounds_cache: Dict[Tuple, optimize.Bounds] = {}
+        self._constraint_cache: Dict[Tuple, List[optimize.NonlinearConstraint]] = {}
         logger.info("SciPy Optimization Solver initialized")
     
     def configure(self, config: Dict[str, Any]) -> None:
@@ -56,7 +116,7 @@ class ScipyOptimizationSolver:
         Returns:
             Dictionary containing solution and metadata
         """
-        start_time = np.datetime64('now')
+        start_time = time.perf_counter()
         
         try:
             # Extract problem components
@@ -71,13 +131,14 @@ class ScipyOptimizationSolver:
                 result = self._solve_constrained(problem_definition)
             elif problem_type == "least_squares":
                 result = self._solve_least_squares(problem_definition)
+            elif problem_type in ("integer_linear", "mixed_integer"):
+                result = self._solve_mixed_integer(problem_definition)
             else:
                 # Default to general minimize method
                 result = self._solve_general(problem_definition)
             
             # Calculate execution time
-            end_time = np.datetime64('now')
-            execution_time = (end_time - start_time) / np.timedelta64(1, 's')
+            execution_time = time.perf_counter() - start_time
             
             # Prepare solution object
             solution = {
@@ -85,7 +146,7 @@ class ScipyOptimizationSolver:
                 "variables": result.get("variables", {}),
                 "objective_value": result.get("objective_value"),
                 "iterations": result.get("iterations", 0),
-                "execution_time_seconds": float(execution_time),
+                "execution_time_seconds": execution_time,
                 "message": result.get("message", "Optimization successful"),
                 "solver_details": {
                     "name": "scipy",
@@ -109,6 +170,65 @@ class ScipyOptimizationSolver:
                 }
             }
     
+    async def solve_async(self, problem_definition: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Solve an optimization problem in a worker thread.
+        
+        HiGHS and LAPACK release the GIL during their long native calls, so
+        running the solve off the event loop lets other pipeline work proceed.
+        
+        Args:
+            problem_definition: Complete problem definition
+            
+        Returns:
+            Dictionary containing solution and metadata
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.solve, problem_definition)
+    
+    def solve_batch(self, problem_definitions: List[Dict[str, Any]],
+                    max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Solve several independent problems in parallel worker processes.
+        
+        Process-level parallelism is used because the inner loops of methods
+        such as SLSQP and Nelder-Mead run in Python and hold the GIL. Workers
+        receive only this solver's configuration and the problem, and build
+        their own solver. A problem that cannot be pickled (e.g. one with a
+        lambda objective) is solved in this process instead. Warm-start state
+        is not shared with workers.
+        
+        Args:
+            problem_definitions: Problem definitions to solve
+            max_workers: Worker process count, defaults to the CPU count
+            
+        Returns:
+            Solutions in the same order as the problem definitions
+        """
+        if len(problem_definitions) < 2:
+            return [self.solve(problem) for problem in problem_definitions]
+        
+        config = dict(self.config)
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = []
+            for problem in problem_definitions:
+                try:
+                    # The executor pickles in a background thread, so probe here
+                    # to detect unpicklable problems at submit time. Before
+                    # Python 3.14, local objects raise AttributeError and some
+                    # native objects raise TypeError instead of PicklingError.
+                    pickle.dumps(problem)
+                except (pickle.PicklingError, AttributeError, TypeError) as e:
+                    logger.debug(f"Solving unpicklable problem in-process: {str(e)}")
+                    futures.append(None)
+                    continue
+                futures.append(executor.submit(_solve_in_worker, config, problem))
+            
+            return [
+                future.result() if future is not None else self.solve(problem)
+                for future, problem in zip(futures, problem_definitions)
+            ]
+    
     def _solve_linear(self, problem_definition: Dict[str, Any]) -> Dict[str, Any]:
         """
         Solve a linear programming problem using SciPy's linprog.
@@ -126,52 +246,29 @@ class ScipyOptimizationSolver:
         
         # Get coefficients from objective
         c = np.array(objective.get("coefficients", []))
+        n = len(c)
         
-        # Process inequality constraints (Ax <= b)
-        A_ub = []
-        b_ub = []
-        
-        # Process equality constraints (Aeq x = beq)
-        A_eq = []
-        b_eq = []
-        
-        for constraint in constraints:
-            coeffs = np.array(constraint.get("coefficients", []))
-            rhs = constraint.get("rhs", 0)
-            
-            if constraint.get("type") == "equality":
-                A_eq.append(coeffs)
-                b_eq.append(rhs)
-            else:  # Inequality
-                A_ub.append(coeffs)
-                b_ub.append(rhs)
-        
-        # Convert lists to numpy arrays
-        if A_ub:
-            A_ub = np.array(A_ub)
-            b_ub = np.array(b_ub)
-        else:
-            A_ub = None
-            b_ub = None
-            
-        if A_eq:
-            A_eq = np.array(A_eq)
-            b_eq = np.array(b_eq)
-        else:
-            A_eq = None
-            b_eq = None
+        A_ub, b_ub, A_eq, b_eq = self._build_linear_constraints(constraints, n)
         
         # Process bounds
         var_bounds = None
         if bounds:
             var_bounds = [(b.get("lower", 0), b.get("upper", None)) for b in bounds]
         
-        # Set options
-        options = {
-            "maxiter": self.config["max_iterations"],
-            "tol": self.config["tolerance"],
-            "disp": self.config["verbose"]
-        }
+        # Set options; the HiGHS backends reject the legacy "tol" option
+        method = self.config.get("linprog_method", "highs")
+        if method.startswith("highs"):
+            options = {
+                "presolve": True,
+                "dual_feasibility_tolerance": self.config["tolerance"],
+                "disp": self.config["verbose"]
+            }
+        else:
+            options = {
+                "maxiter": self.config["max_iterations"],
+                "tol": self.config["tolerance"],
+                "disp": self.config["verbose"]
+            }
         
         # Solve using linprog
         result = optimize.linprog(
@@ -181,20 +278,156 @@ class ScipyOptimizationSolver:
             A_eq=A_eq, 
             b_eq=b_eq,
             bounds=var_bounds,
-            method='interior-point',
+            method=method,
             options=options
         )
         
         # Extract and return results
         return {
-            "variables": result.x.tolist() if hasattr(result, 'x') else [],
-            "objective_value": float(result.fun) if hasattr(result, 'fun') else None,
-            "iterations": int(result.nit) if hasattr(result, 'nit') else 0,
-            "message": result.message if hasattr(result, 'message') else "",
-            "success": result.success if hasattr(result, 'success') else False,
+            "variables": result.x.tolist() if result.x is not None else [],
+            "objective_value": float(result.fun) if result.fun is not None else None,
+            "iterations": int(result.nit),
+            "message": result.message,
+            "success": result.success,
             "method": "linprog"
         }
     
+    def _build_linear_constraints(self, constraints: List[Dict[str, Any]], n: int) -> Tuple:
+        """
+        Assemble linear constraint matrices from constraint definitions.
+        
+        Args:
+            constraints: Constraint definitions
+            n: Number of variables
+            
+        Returns:
+            Tuple of (A_ub, b_ub, A_eq, b_eq); missing groups are None
+        """
+        ub_constraints = [c for c in constraints if c.get("type") != "equality"]
+        eq_constraints = [c for c in constraints if c.get("type") == "equality"]
+        
+        A_ub, b_ub = self._to_csr(ub_constraints, n)
+        A_eq, b_eq = self._to_csr(eq_constraints, n)
+        
+        return A_ub, b_ub, A_eq, b_eq
+    
+    def _to_csr(self, constraints: List[Dict[str, Any]], n: int) -> Tuple:
+        """
+        Build a CSR constraint matrix and right-hand side for a group of rows.
+        
+        The right-hand side and row pointers are pre-sized; each row's
+        non-zeros are kept as array chunks and concatenated once.
+        
+        Args:
+            constraints: Constraint definitions forming the rows
+            n: Number of variables
+            
+        Returns:
+            Tuple of (matrix, rhs), or (None, None) for an empty group
+        """
+        m = len(constraints)
+        if not m:
+            return None, None
+        
+        b = np.empty(m)
+        indptr = np.zeros(m + 1, dtype=np.int64)
+        data_chunks = []
+        index_chunks = []
+        
+        for row, constraint in enumerate(constraints):
+            b[row] = constraint.get("rhs", 0)
+            
+            if "sparse_coefficients" in constraint:
+                # Explicit (column, value) pairs
+                pairs = constraint["sparse_coefficients"]
+                cols = np.fromiter((col for col, _ in pairs), dtype=np.int64, count=len(pairs))
+                vals = np.fromiter((val for _, val in pairs), dtype=np.float64, count=len(pairs))
+                nonzero = vals != 0
+                cols = cols[nonzero]
+                vals = vals[nonzero]
+            else:
+                coeffs = np.asarray(constraint.get("coefficients", []), dtype=np.float64)
+                cols = np.flatnonzero(coeffs)
+                vals = coeffs[cols]
+            
+            index_chunks.append(cols)
+            data_chunks.append(vals)
+            indptr[row + 1] = indptr[row] + len(cols)
+        
+        matrix = sparse.csr_matrix(
+            (np.concatenate(data_chunks), np.concatenate(index_chunks), indptr),
+            shape=(m, n)
+        )
+        return matrix, b
+    
+    def _solve_mixed_integer(self, problem_definition: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Solve a mixed-integer linear problem using SciPy's milp (HiGHS).
+        
+        Args:
+            problem_definition: Problem definition
+            
+        Returns:
+            Dictionary with solution details
+        """
+        objective = problem_definition.get("objective", {})
+        constraints = problem_definition.get("constraints", [])
+        bounds = problem_definition.get("bounds", [])
+        variables_def = problem_definition.get("variables", [])
+        
+        c = np.array(objective.get("coefficients", []), dtype=float)
+        n = len(c)
+        
+        # Integrality: 1 for integer/binary variables, 0 for continuous ones
+        integrality = np.array(
+            [0 if v.get("type", "continuous") == "continuous" else 1 for v in variables_def],
+            dtype=int
+        ) if variables_def else np.zeros(n, dtype=int)
+        
+        A_ub, b_ub, A_eq, b_eq = self._build_linear_constraints(constraints, n)
+        linear_constraints = []
+        if A_ub is not None:
+            linear_constraints.append(optimize.LinearConstraint(A_ub, -np.inf, b_ub))
+        if A_eq is not None:
+            linear_constraints.append(optimize.LinearConstraint(A_eq, b_eq, b_eq))
+        
+        # Same bound defaults as linprog: lower 0, upper unbounded
+        lb = np.zeros(n)
+        ub = np.full(n, np.inf)
+        for i, b in enumerate(bounds):
+            lower = b.get("lower", 0)
+            upper = b.get("upper")
+            lb[i] = -np.inf if lower is None else lower
+            ub[i] = np.inf if upper is None else upper
+        for i, v in enumerate(variables_def):
+            if v.get("type") == "binary":
+                lb[i] = max(lb[i], 0.0)
+                ub[i] = min(ub[i], 1.0)
+        
+        options = {
+            "disp": self.config["verbose"],
+            "mip_rel_gap": self.config.get("mip_gap", 0.01)
+        }
+        if self.config.get("timeLimit") is not None:
+            options["time_limit"] = self.config["timeLimit"]
+        
+        result = optimize.milp(
+            c=c,
+            constraints=linear_constraints,
+            integrality=integrality,
+            bounds=optimize.Bounds(lb, ub),
+            options=options
+        )
+        
+        return {
+            "variables": result.x.tolist() if result.x is not None else [],
+            "objective_value": float(result.fun) if result.fun is not None else None,
+            "iterations": int(getattr(result, "mip_node_count", 0) or 0),
+            "message": result.message,
+            "success": result.success,
+            "method": "milp"
+        }
+    
     def _solve_nonlinear(self, problem_definition: Dict[str, Any]) -> Dict[str, Any]:
         """
         Solve a nonlinear optimization problem using SciPy's minimize.
@@ -207,69 +440,153 @@ class ScipyOptimizationSolver:
         """
         # Extract objective function components
         objective = problem_definition.get("objective", {})
-        initial_guess = np.array(problem_definition.get("initial_guess", [0.0, 0.0]))
+        initial_guess = np.array(problem_definition.get("initial_guess", [0.0, 0.0]), dtype=float)
         
         # Get objective function
         objective_type = objective.get("type", "custom")
         
         if objective_type == "custom" and "function" in objective:
-            # Use provided function
+            # Use provided function and its gradient, if any
             func = objective["function"]
+            jac = objective.get("jacobian")
+            if not callable(jac):
+                jac = None
         else:
             # Create default quadratic function as fallback
-            func = lambda x: np.sum(x**2)
+            func = _default_quadratic
+            jac = _default_quadratic_grad
         
         # Process constraints
-        constraints = []
-        for constraint in problem_definition.get("constraints", []):
-            if "function" in constraint:
-                # Add constraint using SciPy's NonlinearConstraint
-                constraint_func = constraint["function"]
-                lb = constraint.get("lower_bound", -np.inf)
-                ub = constraint.get("upper_bound", np.inf)
-                
-                constraints.append(
-                    optimize.NonlinearConstraint(constraint_func, lb, ub)
-                )
+        constraints = self._get_nonlinear_constraints(problem_definition.get("constraints", []))
         
         # Process bounds
         bounds = None
         if "bounds" in problem_definition:
-            bounds_list = problem_definition["bounds"]
-            bounds = optimize.Bounds(
-                lb=np.array([b.get("lower", -np.inf) for b in bounds_list]),
-                ub=np.array([b.get("upper", np.inf) for b in bounds_list])
-            )
+            bounds = self._get_bounds(problem_definition["bounds"])
         
-        # Set options
-        options = {
-            "maxiter": self.config["max_iterations"],
-            "disp": self.config["verbose"]
-        }
+        # Determine method based on problem characteristics unless overridden
+        method = problem_definition.get("metadata", {}).get("preferred_method")
+        if method is None:
+            method = self._select_minimize_method(constraints, initial_guess)
+        
+        # Set options; L-BFGS-B has deprecated "disp", so it is only passed to other methods
+        options = {"maxiter": self.config["max_iterations"]}
+        if method.upper() != "L-BFGS-B":
+            options["disp"] = self.config["verbose"]
         
-        # Determine method based on problem characteristics
-        method = problem_definition.get("metadata", {}).get("preferred_method", "SLSQP")
+        # Warm-start from the previous optimum of an equivalent problem
+        signature = self._problem_signature("minimize", problem_definition, initial_guess, (func, jac))
+        x0 = self._warm_start(signature, problem_definition, initial_guess)
         
         # Solve using minimize
         result = optimize.minimize(
             fun=func,
-            x0=initial_guess,
+            x0=x0,
+            jac=jac,
             method=method,
             bounds=bounds,
             constraints=constraints,
             options=options
         )
         
+        if result.success and signature is not None:
+            self._cache_put(self._last_x, signature, result.x.copy())
+        
         # Extract and return results
         return {
-            "variables": result.x.tolist() if hasattr(result, 'x') else [],
-            "objective_value": float(result.fun) if hasattr(result, 'fun') else None,
-            "iterations": int(result.nit) if hasattr(result, 'nit') else 0,
-            "message": result.message if hasattr(result, 'message') else "",
-            "success": result.success if hasattr(result, 'success') else False,
+            "variables": result.x.tolist(),
+            "objective_value": float(result.fun),
+            # Not every minimize method reports an iteration count
+            "iterations": int(result.get("nit", 0)),
+            "message": result.message,
+            "success": result.success,
             "method": method
         }
     
+    def _get_bounds(self, bounds_list: List[Dict[str, Any]]) -> optimize.Bounds:
+        """
+        Return a Bounds object for the given bound definitions, reusing cached ones.
+        
+        The cache key is an immutable snapshot of the bound values, so later
+        mutation of the problem definition cannot affect cached entries.
+        
+        Args:
+            bounds_list: Bound definitions with optional "lower"/"upper" values
+            
+        Returns:
+            SciPy Bounds object
+        """
+        key = tuple((b.get("lower", -np.inf), b.get("upper", np.inf)) for b in bounds_list)
+        bounds = self._bounds_cache.get(key)
+        if bounds is None:
+            bounds = optimize.Bounds(
+                lb=np.array([lower for lower, _ in key]),
+                ub=np.array([upper for _, upper in key])
+            )
+            self._cache_put(self._bounds_cache, key, bounds)
+        return bounds
+    
+    def _get_nonlinear_constraints(self, constraint_defs: List[Dict[str, Any]]) -> List[optimize.NonlinearConstraint]:
+        """
+        Return NonlinearConstraint objects for the given definitions, reusing cached ones.
+        
+        Args:
+            constraint_defs: Constraint definitions
+            
+        Returns:
+            List of SciPy NonlinearConstraint objects
+        """
+        key = tuple(
+            (c["function"], c.get("lower_bound", -np.inf), c.get("upper_bound", np.inf))
+            for c in constraint_defs if "function" in c
+        )
+        try:
+            constraints = self._constraint_cache.get(key)
+        except TypeError:
+            # Array-valued bounds are not hashable; build without caching
+            return [optimize.NonlinearConstraint(func, lb, ub) for func, lb, ub in key]
+        
+        if constraints is None:
+            # Add constraints using SciPy's NonlinearConstraint
+            constraints = [optimize.NonlinearConstraint(func, lb, ub) for func, lb, ub in key]
+            self._cache_put(self._constraint_cache, key, constraints)
+        return list(constraints)
+    
+    def _cache_put(self, cache: Dict[Tuple, Any], key: Tuple, value: Any) -> None:
+        """
+        Insert into a bounded cache, evicting the oldest entry when full.
+        
+        Args:
+            cache: Cache dictionary
+            key: Cache key
+            value: Value to store
+        """
+        if len(cache) >= self.config.get("object_cache_size", 64):
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+    
+    def _select_minimize_method(self, constraints: List[optimize.NonlinearConstraint],
+                                initial_guess: np.ndarray) -> str:
+        """
+        Pick a minimize method from the problem structure.
+        
+        Unconstrained and bound-only problems use L-BFGS-B. Constrained
+        problems use SLSQP, or trust-constr above ``large_problem_size``
+        variables where it scales better.
+        
+        Args:
+            constraints: Nonlinear constraints of the problem
+            initial_guess: Initial guess for the problem variables
+            
+        Returns:
+            Name of the SciPy minimize method
+        """
+        if not constraints:
+            return "L-BFGS-B"
+        if initial_guess.shape[0] > self.config.get("large_problem_size", 100):
+            return "trust-constr"
+        return "SLSQP"
+    
     def _solve_constrained(self, problem_definition: Dict[str, Any]) -> Dict[str, Any]:
         """
         Solve a constrained optimization problem using SciPy's optimize.minimize.
@@ -296,22 +613,20 @@ class ScipyOptimizationSolver:
         """
         # Extract problem components
         residual_function = problem_definition.get("residual_function")
-        initial_guess = np.array(problem_definition.get("initial_guess", [0.0, 0.0]))
+        initial_guess = np.array(problem_definition.get("initial_guess", [0.0, 0.0]), dtype=float)
+        
+        jac = problem_definition.get("jacobian", "2-point")
         
         if not residual_function:
-            # Create a simple default residual function
-            def default_residual(x):
-                return np.array([x[0]**2 + x[1]**2 - 1, x[0] - x[1]])
-            
-            residual_function = default_residual
+            # Use the simple default residual function
+            residual_function = _default_residual
+            jac = _default_residual_jac
         
         # Process bounds if available
         bounds = None
         if "bounds" in problem_definition:
-            bounds_list = problem_definition["bounds"]
-            lower_bounds = np.array([b.get("lower", -np.inf) for b in bounds_list])
-            upper_bounds = np.array([b.get("upper", np.inf) for b in bounds_list])
-            bounds = (lower_bounds, upper_bounds)
+            cached_bounds = self._get_bounds(problem_definition["bounds"])
+            bounds = (cached_bounds.lb, cached_bounds.ub)
         
         # Set options
         options = {}
@@ -320,25 +635,89 @@ class ScipyOptimizationSolver:
         if "verbose" in self.config:
             options["verbose"] = 2 if self.config["verbose"] else 0
         
+        # Warm-start from the previous optimum of an equivalent problem
+        signature = self._problem_signature("least_squares", problem_definition, initial_guess,
+                                            (residual_function, jac))
+        x0 = self._warm_start(signature, problem_definition, initial_guess)
+        
         # Solve using least_squares
         result = optimize.least_squares(
             residual_function,
-            initial_guess,
+            x0,
+            jac=jac,
             bounds=bounds,
             method="trf",
             **options
         )
         
+        if result.success and signature is not None:
+            self._cache_put(self._last_x, signature, result.x.copy())
+        
         # Extract and return results
         return {
-            "variables": result.x.tolist() if hasattr(result, 'x') else [],
-            "objective_value": float(result.cost) if hasattr(result, 'cost') else None,
-            "iterations": int(result.nfev) if hasattr(result, 'nfev') else 0,
-            "message": result.message if hasattr(result, 'message') else "",
-            "success": result.success if hasattr(result, 'success') else False,
+            "variables": result.x.tolist(),
+            "objective_value": float(result.cost),
+            "iterations": int(result.nfev),
+            "message": result.message,
+            "success": result.success,
             "method": "least_squares"
         }
     
+    def _problem_signature(self, kind: str, problem_definition: Dict[str, Any],
+                           initial_guess: np.ndarray, functions: Tuple) -> Optional[Tuple]:
+        """
+        Build a signature identifying equivalent problems for warm-starting.
+        
+        Two problems are equivalent only if they share the objective (or
+        residual) callables, bounds and constraint definitions, so an
+        unrelated problem of the same shape never supplies the start point.
+        
+        Args:
+            kind: Solver routine the signature is used for
+            problem_definition: Problem definition
+            initial_guess: Initial guess for the problem variables
+            functions: Objective/residual function and its jacobian
+            
+        Returns:
+            Hashable problem signature, or None if warm-starting does not apply
+        """
+        if not problem_definition.get("warm_start", False):
+            return None
+        bounds = tuple(
+            (b.get("lower"), b.get("upper")) for b in problem_definition.get("bounds", [])
+        )
+        constraints = tuple(
+            (c.get("function"), c.get("lower_bound"), c.get("upper_bound"))
+            for c in problem_definition.get("constraints", [])
+        )
+        signature = (kind, initial_guess.shape[0], functions, bounds, constraints)
+        try:
+            hash(signature)
+        except TypeError:
+            # Array-valued bounds are not hashable; solve without warm-starting
+            return None
+        return signature
+    
+    def _warm_start(self, signature: Optional[Tuple], problem_definition: Dict[str, Any],
+                    initial_guess: np.ndarray) -> np.ndarray:
+        """
+        Choose the starting point for a solve.
+        
+        Warm-starting is opt-in per problem with ``"warm_start": True`` and
+        never overrides an explicit ``initial_guess``.
+        
+        Args:
+            signature: Problem signature, None when warm-starting does not apply
+            problem_definition: Problem definition
+            initial_guess: Initial guess for the problem variables
+            
+        Returns:
+            The previous optimum for this signature, or the initial guess
+        """
+        if signature is None or "initial_guess" in problem_definition:
+            return initial_guess
+        return self._last_x.get(signature, initial_guess)
+    
     def _solve_general(self, problem_definition: Dict[str, Any]) -> Dict[str, Any]:
         """
         General optimization using SciPy's minimize.
@@ -352,21 +731,17 @@ class ScipyOptimizationSolver:
         # This is a fallback that handles general optimization problems
         return self._solve_nonlinear(problem_definition)
 
-
-# Register this solver with the registry
-solver_registry.register_solver(
-    solver_id="scipy_optimization",
-    solver_class=ScipyOptimizationSolver,
-    capabilities={
-        "problem_types": ["linear", "nonlinear", "constrained", "least_squares", "general"],
-        "variable_types": ["continuous"],
-        "max_variables": 10000,
-        "max_constraints": 10000,
-        "algorithms": ["SLSQP", "Nelder-Mead", "Powell", "BFGS", "L-BFGS-B", "TNC", "CG", "trust-constr"],
-        "performance_profile": {
-            "speed": 0.8,
-            "robustness": 0.9,
-            "memory_efficiency": 0.7
-        }
-    }
-)
+def _solve_in_worker(config: Dict[str, Any], problem_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Solve one problem of a batch in a worker process.
+    
+    Args:
+        config: Configuration of the solver that submitted the batch
+        problem_definition: Problem definition
+        
+    Returns:
+        Dictionary containing solution and metadata
+    """
+    solver = ScipyOptimizationSolver()
+    solver.config.update(config)
+    return solver.solve(problem_definition)
@@ -5,15 +5,42 @@ This module provides functionality for analyzing optimization problems,
 selecting appropriate solvers, and dispatching computation tasks to them.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from array import array
+from collections import OrderedDict
+from types import MappingProxyType
+import asyncio
+import hashlib
+import json
 import logging
-import importlib
 import time
 
 from app.solver.registry import solver_registry
 
 logger = logging.getLogger(__name__)
 
+# Canonical read-only characteristics, shared by all problems of the same shape
+_CHAR_INTERN: Dict[tuple, MappingProxyType] = {}
+_CHAR_INTERN_SIZE = 4096
+
+def _plain_characteristics(value: Any) -> Any:
+    """
+    Convert characteristics to plain JSON-serializable data for results.
+    
+    Read-only mappings become dicts and sets become sorted lists.
+    
+    Args:
+        value: Characteristics, or a value nested in them
+        
+    Returns:
+        Plain copy of the value
+    """
+    if isinstance(value, Mapping):
+        return {key: _plain_characteristics(item) for key, item in value.items()}
+    if isinstance(value, (frozenset, set)):
+        return sorted(value, key=str)
+    return value
+
 class SolverDispatcher:
     """
     Dispatcher for mathematical optimization solvers.
@@ -25,7 +52,19 @@ class SolverDispatcher:
     
     def __init__(self):
         """Initialize the solver dispatcher."""
-        self._performance_cache = {}  # Cache of solver performance metrics
+        # Solver performance counters: "solver_id:problem_type" -> [attempts, successes]
+        self._performance_cache: Dict[str, array] = {}
+        # LRU of structural fingerprint -> (problem_type, characteristics)
+        self._analysis_cache: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._analysis_cache_size = 1024
+        # Semaphores bounding raced solves, keyed by max_concurrent_solves
+        self._race_semaphores: Dict[int, asyncio.Semaphore] = {}
+        # Idle solver instances per solver_id; the event loop is single-threaded,
+        # so plain lists are enough
+        self._solver_pool: Dict[str, List[Any]] = {}
+        self._solver_pool_size = 4
+        # Ranked candidates kept per solve: the primary solver plus fallbacks
+        self._max_candidates = 3
         logger.info("Solver Dispatcher initialized")
     
     async def solve(self, 
@@ -41,7 +80,7 @@ class SolverDispatcher:
         Returns:
             Dictionary containing solution and metadata
         """
-        start_time = time.time()
+        start_time = time.monotonic_ns()
         
         # Extract problem type and characteristics
         problem_type, characteristics = self._analyze_problem(problem_definition)
@@ -52,18 +91,99 @@ class SolverDispatcher:
         )
         
         if not solver_candidates:
-            logger.warning(f"No suitable solvers found for problem type: {problem_type}")
+            logger.warning("No suitable solvers found for problem type: %s", problem_type)
             return {
                 "status": "error",
                 "message": f"No suitable solvers found for problem type: {problem_type}",
                 "problem_type": problem_type,
-                "characteristics": characteristics
+                "characteristics": _plain_characteristics(characteristics)
             }
         
+        # Blend observed success rates into the static compatibility ranking,
+        # truncating only afterwards so any match can be promoted
+        solver_candidates = self._rank_candidates(solver_candidates, problem_type)[:self._max_candidates]
+        
+        return await self._solve_with_candidates(
+            solver_candidates, problem_definition, context, problem_type, start_time
+        )
+    
+    async def solve_many(self,
+                        problems: List[Dict[str, Any]],
+                        context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Solve a batch of problems, sharing analysis across identical structures.
+        
+        Problems with the same structural fingerprint and metadata as the
+        first one reuse its analysis and ranked solver candidates and are
+        solved concurrently, bounded by ``max_concurrent_solves`` in the
+        context (default 4). Any other problem goes through ``solve()``.
+        
+        Args:
+            problems: Problem definitions
+            context: Additional context for solver selection
+            
+        Returns:
+            Results in the same order as the problems
+        """
+        if not problems:
+            return []
+        
+        context = context or {}
+        first = problems[0]
+        key = self._structural_fingerprint(first)
+        metadata = first.get("metadata")
+        
+        problem_type, characteristics = self._analyze_problem(first)
+        solver_candidates = solver_registry.find_solvers_for_problem(
+            problem_type, characteristics
+        )
+        if solver_candidates:
+            solver_candidates = self._rank_candidates(solver_candidates, problem_type)[:self._max_candidates]
+        
+        semaphore = asyncio.Semaphore(context.get("max_concurrent_solves", 4))
+        
+        async def bounded_solve(problem_definition):
+            async with semaphore:
+                if (solver_candidates
+                        and problem_definition.get("metadata") == metadata
+                        and self._structural_fingerprint(problem_definition) == key):
+                    return await self._solve_with_candidates(
+                        solver_candidates, problem_definition, context,
+                        problem_type, time.monotonic_ns()
+                    )
+                return await self.solve(problem_definition, context)
+        
+        return list(await asyncio.gather(*(bounded_solve(p) for p in problems)))
+    
+    async def _solve_with_candidates(self,
+                                     solver_candidates: List[Dict[str, Any]],
+                                     problem_definition: Dict[str, Any],
+                                     context: Optional[Dict[str, Any]],
+                                     problem_type: str,
+                                     start_time: int) -> Dict[str, Any]:
+        """
+        Solve with the top-ranked candidate, falling back to the next ones on failure.
+        
+        Args:
+            solver_candidates: Candidates in dispatch order
+            problem_definition: Complete problem definition
+            context: Additional context for solving
+            problem_type: Type of problem
+            start_time: time.monotonic_ns() value when the solve started
+            
+        Returns:
+            Dictionary containing solution and metadata
+        """
         # Select primary solver and fallbacks
         primary_solver = solver_candidates[0]
         fallback_solvers = solver_candidates[1:2]  # Take up to 2 fallbacks
         
+        if context and context.get("race_fallbacks"):
+            return await self._race_solvers(
+                [primary_solver] + fallback_solvers,
+                problem_definition, context, problem_type, start_time
+            )
+        
         # Attempt to solve with primary solver
         solution, status = await self._attempt_solve(
             primary_solver, problem_definition, context
@@ -71,16 +191,16 @@ class SolverDispatcher:
         
         # If primary solver fails, try fallbacks
         if status != "success" and fallback_solvers:
-            logger.info(f"Primary solver {primary_solver['solver_id']} failed, trying fallbacks")
+            logger.info("Primary solver %s failed, trying fallbacks", primary_solver['solver_id'])
             
             for fallback in fallback_solvers:
-                logger.info(f"Attempting fallback solver: {fallback['solver_id']}")
+                logger.info("Attempting fallback solver: %s", fallback['solver_id'])
                 solution, status = await self._attempt_solve(
                     fallback, problem_definition, context
                 )
                 
                 if status == "success":
-                    logger.info(f"Fallback solver {fallback['solver_id']} succeeded")
+                    logger.info("Fallback solver %s succeeded", fallback['solver_id'])
                     # Update solver performance cache
                     self._update_performance_metrics(fallback['solver_id'], problem_type, True)
                     break
@@ -93,7 +213,7 @@ class SolverDispatcher:
         )
         
         # Calculate total solving time
-        total_time = time.time() - start_time
+        total_time = (time.monotonic_ns() - start_time) / 1e9
         
         # Prepare result
         result = {
@@ -107,6 +227,95 @@ class SolverDispatcher:
         
         return result
     
+    def _rank_candidates(self,
+                         solver_candidates: List[Dict[str, Any]],
+                         problem_type: str) -> List[Dict[str, Any]]:
+        """
+        Re-rank solver candidates using their observed success rates.
+        
+        Each candidate is weighted by ``0.5 + success_rate``; solvers without
+        history are treated as fully successful so they still get tried. The
+        raw compatibility score breaks ties.
+        
+        Args:
+            solver_candidates: Candidates sorted by compatibility score
+            problem_type: Type of problem
+            
+        Returns:
+            Candidates in dispatch order
+        """
+        def rank(candidate):
+            rate = self.get_success_rate(candidate["solver_id"], problem_type)
+            score = candidate["compatibility_score"]
+            return (score * (0.5 + (1.0 if rate is None else rate)), score)
+        
+        return sorted(solver_candidates, key=rank, reverse=True)
+    
+    async def _race_solvers(self,
+                            candidates: List[Dict[str, Any]],
+                            problem_definition: Dict[str, Any],
+                            context: Dict[str, Any],
+                            problem_type: str,
+                            start_time: int) -> Dict[str, Any]:
+        """
+        Run the primary and fallback solvers concurrently, keeping the first success.
+        
+        Enabled with ``race_fallbacks`` in the context. Remaining attempts are
+        cancelled once one succeeds. Concurrency across all raced solves that
+        use the same ``max_concurrent_solves`` (default 4) is bounded by it.
+        
+        Args:
+            candidates: Primary solver followed by its fallbacks
+            problem_definition: Complete problem definition
+            context: Additional context for solving
+            problem_type: Type of problem
+            start_time: time.monotonic_ns() value when the solve started
+            
+        Returns:
+            Dictionary containing solution and metadata
+        """
+        limit = context.get("max_concurrent_solves", 4)
+        semaphore = self._race_semaphores.get(limit)
+        if semaphore is None:
+            semaphore = self._race_semaphores[limit] = asyncio.Semaphore(limit)
+        
+        async def bounded_attempt(solver_info):
+            async with semaphore:
+                return await self._attempt_solve(solver_info, problem_definition, context)
+        
+        tasks = {
+            asyncio.ensure_future(bounded_attempt(candidate)): candidate
+            for candidate in candidates
+        }
+        pending = set(tasks)
+        solution, status, winner = {"error": "No solver attempts completed"}, "error", None
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    solution, status = task.result()
+                    self._update_performance_metrics(
+                        tasks[task]['solver_id'], problem_type, status == "success"
+                    )
+                    if status == "success":
+                        winner = tasks[task]
+                        break
+                if winner:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        return {
+            "solution": solution,
+            "status": status,
+            "solver_id": winner['solver_id'] if winner else None,
+            "problem_type": problem_type,
+            "total_time_seconds": (time.monotonic_ns() - start_time) / 1e9,
+            "fallbacks_attempted": len(candidates) - 1 if status != "success" else 0
+        }
+    
     async def _attempt_solve(self, 
                             solver_info: Dict[str, Any],
                             problem_definition: Dict[str, Any],
@@ -124,27 +333,79 @@ class SolverDispatcher:
         """
         solver_id = solver_info["solver_id"]
         solver_class = solver_info["solver_class"]
+        solver = None
+        configured = False
+        cancelled = False
         
         try:
-            # Instantiate the solver
-            solver = solver_class()
+            # Take a pooled instance or construct a new one
+            solver = self._acquire_solver(solver_id, solver_class)
             
             # Configure the solver with any context
-            if hasattr(solver, "configure") and context:
+            if solver_info["has_configure"] and context:
                 solver.configure(context)
+                configured = True
             
             # Solve the problem
-            if hasattr(solver, "solve_async"):
+            if solver_info["has_async"]:
                 solution = await solver.solve_async(problem_definition)
             else:
                 solution = solver.solve(problem_definition)
             
-            logger.info(f"Solver {solver_id} successfully solved the problem")
+            logger.info("Solver %s successfully solved the problem", solver_id)
             return solution, "success"
             
+        except asyncio.CancelledError:
+            # A cancelled race loser may still be running in an executor
+            # thread, so its instance is discarded rather than pooled
+            cancelled = True
+            raise
+        
         except Exception as e:
-            logger.error(f"Solver {solver_id} failed: {str(e)}")
+            logger.error("Solver %s failed: %s", solver_id, e)
             return {"error": str(e)}, "error"
+        
+        finally:
+            if solver is not None and not cancelled:
+                self._release_solver(solver_info, solver, configured)
+    
+    def _acquire_solver(self, solver_id: str, solver_class: Any) -> Any:
+        """
+        Get a solver instance from the pool, constructing one if none is idle.
+        
+        Args:
+            solver_id: Solver identifier
+            solver_class: Class implementing the solver
+            
+        Returns:
+            Solver instance
+        """
+        pool = self._solver_pool.get(solver_id)
+        if pool:
+            return pool.pop()
+        return solver_class()
+    
+    def _release_solver(self, solver_info: Dict[str, Any], solver: Any, configured: bool) -> None:
+        """
+        Return a solver instance to the pool.
+        
+        Solvers are reset with their ``reset()`` hook when they have one.
+        Instances configured from a request context without such a hook are
+        discarded so their settings cannot leak into later requests.
+        
+        Args:
+            solver_info: Information about the solver
+            solver: Solver instance
+            configured: Whether the instance was configured from a context
+        """
+        if solver_info["has_reset"]:
+            solver.reset()
+        elif configured:
+            return
+        
+        pool = self._solver_pool.setdefault(solver_info["solver_id"], [])
+        if len(pool) < self._solver_pool_size:
+            pool.append(solver)
     
     def _analyze_problem(self, 
                         problem_definition: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
@@ -160,22 +421,57 @@ class SolverDispatcher:
         # Extract problem metadata if available
         metadata = problem_definition.get("metadata", {})
         
-        # Try to get problem type directly from metadata
+        # Try to get problem type and characteristics directly from metadata
         problem_type = metadata.get("problem_type")
-        
-        if not problem_type:
-            # Infer problem type based on problem structure
-            problem_type = self._infer_problem_type(problem_definition)
-        
-        # Extract or infer problem characteristics
         characteristics = metadata.get("characteristics", {})
         
-        if not characteristics:
-            characteristics = self._extract_characteristics(problem_definition)
+        if not problem_type or not characteristics:
+            # Infer from problem structure; structurally identical problems
+            # share the cached analysis
+            key = self._structural_fingerprint(problem_definition)
+            analysis = self._analysis_cache.get(key)
+            if analysis is None:
+                analysis = (
+                    self._infer_problem_type(problem_definition),
+                    self._extract_characteristics(problem_definition)
+                )
+                self._analysis_cache[key] = analysis
+                if len(self._analysis_cache) > self._analysis_cache_size:
+                    self._analysis_cache.popitem(last=False)
+            else:
+                self._analysis_cache.move_to_end(key)
+            
+            problem_type = problem_type or analysis[0]
+            characteristics = characteristics or analysis[1]
         
-        logger.info(f"Analyzed problem: type={problem_type}, characteristics={characteristics}")
+        logger.info("Analyzed problem: type=%s, characteristics=%s", problem_type, characteristics)
         return problem_type, characteristics
     
+    def _structural_fingerprint(self, problem_definition: Dict[str, Any]) -> str:
+        """
+        Fingerprint the parts of a problem that its analysis depends on.
+        
+        Only types are included, not coefficients or bounds, so re-submitted
+        or templated problems map to the same fingerprint.
+        
+        Args:
+            problem_definition: Problem definition
+            
+        Returns:
+            Hex digest identifying the problem structure
+        """
+        objective = problem_definition.get("objective", {})
+        structure = (
+            bool(objective),
+            objective.get("type") if objective else None,
+            [c.get("type") for c in problem_definition.get("constraints", [])],
+            [v.get("type") for v in problem_definition.get("variables", [])]
+        )
+        return hashlib.blake2b(
+            json.dumps(structure, separators=(",", ":")).encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+    
     def _infer_problem_type(self, problem_definition: Dict[str, Any]) -> str:
         """
         Infer the problem type based on its structure.
@@ -191,11 +487,14 @@ class SolverDispatcher:
         constraints = problem_definition.get("constraints", [])
         objective = problem_definition.get("objective", {})
         
+        linear = self._is_linear(objective, constraints)
+        
         # Check if it's a linear programming problem
-        if self._is_linear(objective, constraints):
-            if all(var.get("type") == "integer" for var in variables):
+        if linear:
+            integer_count = sum(1 for var in variables if var.get("type") == "integer")
+            if integer_count == len(variables):
                 return "integer_linear"
-            elif any(var.get("type") == "integer" for var in variables):
+            elif integer_count:
                 return "mixed_integer"
             else:
                 return "linear"
@@ -205,7 +504,7 @@ class SolverDispatcher:
             return "constraint_satisfaction"
         
         # Check if it's a nonlinear problem
-        if not self._is_linear(objective, constraints):
+        if not linear:
             return "nonlinear"
         
         # Default to generic optimization
@@ -224,16 +523,9 @@ class SolverDispatcher:
         Returns:
             True if the problem is linear, False otherwise
         """
-        # Check if objective function is linear
-        if objective.get("type") != "linear":
-            return False
-        
-        # Check if all constraints are linear
-        for constraint in constraints:
-            if constraint.get("type") != "linear":
-                return False
-        
-        return True
+        # Objective first, so non-linear objectives skip the constraint scan
+        return (objective.get("type") == "linear"
+                and all(constraint.get("type") == "linear" for constraint in constraints))
     
     def _extract_characteristics(self, problem_definition: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -243,26 +535,41 @@ class SolverDispatcher:
             problem_definition: Problem definition
             
         Returns:
-            Dictionary of problem characteristics
+            Read-only mapping of problem characteristics; type collections are
+            frozensets. Problems of the same shape share one interned mapping.
         """
         variables = problem_definition.get("variables", [])
         constraints = problem_definition.get("constraints", [])
         objective = problem_definition.get("objective", {})
         
-        characteristics = {
-            "size": {
-                "variables": len(variables),
-                "constraints": len(constraints)
-            },
-            "constraints": {
-                "types": list(set(c.get("type", "unknown") for c in constraints))
-            },
-            "objective": {
-                "type": objective.get("type", "unknown") if objective else "none"
-            },
-            "variable_types": list(set(v.get("type", "continuous") for v in variables))
-        }
-        
+        key = (
+            len(variables),
+            len(constraints),
+            frozenset({c.get("type", "unknown") for c in constraints}),
+            objective.get("type", "unknown") if objective else "none",
+            frozenset({v.get("type", "continuous") for v in variables})
+        )
+        characteristics = _CHAR_INTERN.get(key)
+        if characteristics is not None:
+            return characteristics
+        
+        n_variables, n_constraints, constraint_types, objective_type, variable_types = key
+        characteristics = MappingProxyType({
+            "size": MappingProxyType({
+                "variables": n_variables,
+                "constraints": n_constraints
+            }),
+            "constraints": MappingProxyType({
+                "types": constraint_types
+            }),
+            "objective": MappingProxyType({
+                "type": objective_type
+            }),
+            "variable_types": variable_types
+        })
+        
+        if len(_CHAR_INTERN) < _CHAR_INTERN_SIZE:
+            _CHAR_INTERN[key] = characteristics
         return characteristics
     
     def _update_performance_metrics(self, 
@@ -279,20 +586,28 @@ class SolverDispatcher:
         """
         key = f"{solver_id}:{problem_type}"
         
-        if key not in self._performance_cache:
-            self._performance_cache[key] = {
-                "attempts": 0,
-                "successes": 0,
-                "success_rate": 0.0
-            }
-        
-        metrics = self._performance_cache[key]
-        metrics["attempts"] += 1
-        
-        if success:
-            metrics["successes"] += 1
+        # The success rate is derived on read, so an update is two increments
+        counters = self._performance_cache.get(key)
+        if counters is None:
+            counters = self._performance_cache.setdefault(key, array("Q", [0, 0]))
+        counters[0] += 1
+        counters[1] += success
+    
+    def get_success_rate(self, solver_id: str, problem_type: str) -> Optional[float]:
+        """
+        Get the observed success rate of a solver for a problem type.
         
-        metrics["success_rate"] = metrics["successes"] / metrics["attempts"]
+        Args:
+            solver_id: Solver identifier
+            problem_type: Type of problem
+            
+        Returns:
+            Fraction of successful attempts, or None if never attempted
+        """
+        counters = self._performance_cache.get(f"{solver_id}:{problem_type}")
+        if counters is None or not counters[0]:
+            return None
+        return counters[1] / counters[0]
 
 # Global solver dispatcher instance
 solver_dispatcher = SolverDispatcher()
@@ -6,11 +6,51 @@ allowing dynamic registration and retrieval of solvers based on problem
 characteristics and capabilities.
 """
 
-from typing import Dict, Any, List, Optional, Callable, Type
+from typing import Dict, Any, List, Optional, Callable, Type, FrozenSet, Union
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+import asyncio
+import heapq
+import importlib
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Solver classes materialized from "pkg.mod:ClassName" specs
+_RESOLVED_CLASSES: Dict[str, Type] = {}
+
+def _resolve(spec: str) -> Type:
+    """
+    Import the class named by a "pkg.mod:ClassName" spec, memoizing the result.
+    
+    Args:
+        spec: Module path and class name separated by a colon
+        
+    Returns:
+        The resolved class
+    """
+    solver_class = _RESOLVED_CLASSES.get(spec)
+    if solver_class is None:
+        module_name, _, class_name = spec.partition(":")
+        solver_class = getattr(importlib.import_module(module_name), class_name)
+        _RESOLVED_CLASSES[spec] = solver_class
+    return solver_class
+
+@dataclass(frozen=True)
+class RequiredCaps:
+    """
+    Solver capabilities required by a problem.
+    
+    Fields left as None impose no requirement. Instances are immutable and
+    hashable, so they double as memoization keys for solver lookup.
+    """
+    problem_type: str
+    max_variables: Optional[int] = None
+    max_constraints: Optional[int] = None
+    constraint_types: Optional[FrozenSet[str]] = None
+    objective_types: Optional[FrozenSet[str]] = None
+
 class SolverRegistry:
     """
     Registry for mathematical optimization solvers.
@@ -24,26 +64,52 @@ class SolverRegistry:
         """Initialize the solver registry."""
         self._solvers = {}
         self._capabilities = {}
+        # Interface flags per solver, probed once at registration
+        self._interfaces: Dict[str, Dict[str, bool]] = {}
+        # Spec-registered solvers whose import failed, with the error; they
+        # are skipped until registered again
+        self._unavailable: Dict[str, str] = {}
+        # Capabilities with list values normalized to frozensets, used for scoring
+        self._capability_sets: Dict[str, Dict[str, Any]] = {}
+        # Inverted indexes maintained on (un)registration. Buckets are dicts
+        # used as ordered sets so lookups keep registration order.
+        self._by_problem_type: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._by_capability: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._untyped_solvers: Dict[str, None] = {}  # Solvers without problem_types
+        # Per-instance memo of (solver_id, score) results per requirement set
+        self._find_solvers_cached = lru_cache(maxsize=512)(self._score_solvers)
         logger.info("Solver Registry initialized")
     
     def register_solver(self, 
                          solver_id: str, 
-                         solver_class: Type, 
+                         solver_class: Union[Type, str], 
                          capabilities: Dict[str, Any]) -> None:
         """
         Register a solver with the registry.
         
         Args:
             solver_id: Unique identifier for the solver
-            solver_class: Class implementing the solver
+            solver_class: Class implementing the solver, or a "pkg.mod:ClassName"
+                spec that is imported the first time the solver is needed
             capabilities: Dictionary describing solver capabilities
         """
         if solver_id in self._solvers:
-            logger.warning(f"Solver {solver_id} already registered, overwriting")
+            logger.warning("Solver %s already registered, overwriting", solver_id)
+            self._remove_from_index(solver_id)
         
         self._solvers[solver_id] = solver_class
         self._capabilities[solver_id] = capabilities
-        logger.info(f"Registered solver: {solver_id}")
+        self._capability_sets[solver_id] = {
+            key: frozenset(value) if isinstance(value, list) else value
+            for key, value in capabilities.items()
+        }
+        self._interfaces.pop(solver_id, None)
+        self._unavailable.pop(solver_id, None)
+        if not isinstance(solver_class, str):
+            self._probe_interfaces(solver_id, solver_class)
+        self._add_to_index(solver_id, capabilities)
+        self._find_solvers_cached.cache_clear()
+        logger.info("Registered solver: %s", solver_id)
     
     def unregister_solver(self, solver_id: str) -> bool:
         """
@@ -56,23 +122,56 @@ class SolverRegistry:
             True if the solver was removed, False if not found
         """
         if solver_id in self._solvers:
+            self._remove_from_index(solver_id)
             del self._solvers[solver_id]
             del self._capabilities[solver_id]
-            logger.info(f"Unregistered solver: {solver_id}")
+            del self._capability_sets[solver_id]
+            self._interfaces.pop(solver_id, None)
+            self._unavailable.pop(solver_id, None)
+            self._find_solvers_cached.cache_clear()
+            logger.info("Unregistered solver: %s", solver_id)
             return True
         return False
     
     def get_solver(self, solver_id: str) -> Optional[Type]:
         """
-        Retrieve a solver by ID.
+        Retrieve a solver by ID, importing it first if registered by spec.
+        
+        A failed import is attempted only once; the solver then stays
+        unavailable until it is registered again.
         
         Args:
             solver_id: Identifier of the solver to retrieve
             
         Returns:
-            Solver class if found, None otherwise
+            Solver class if found and importable, None otherwise
         """
-        return self._solvers.get(solver_id)
+        if solver_id in self._unavailable:
+            return None
+        solver_class = self._solvers.get(solver_id)
+        if isinstance(solver_class, str):
+            try:
+                solver_class = _resolve(solver_class)
+            except ImportError as e:
+                # Usually an optional backend that is not installed
+                logger.warning("Solver %s is unavailable: %s", solver_id, e)
+                self._unavailable[solver_id] = str(e)
+                return None
+            except AttributeError as e:
+                logger.error("Failed to import solver %s, marking it unavailable: %s", solver_id, e)
+                self._unavailable[solver_id] = str(e)
+                return None
+            self._solvers[solver_id] = solver_class
+            self._probe_interfaces(solver_id, solver_class)
+        return solver_class
+    
+    def _probe_interfaces(self, solver_id: str, solver_class: Type) -> None:
+        """Record which optional solver methods a class provides."""
+        self._interfaces[solver_id] = {
+            "has_async": asyncio.iscoroutinefunction(getattr(solver_class, "solve_async", None)),
+            "has_configure": hasattr(solver_class, "configure"),
+            "has_reset": hasattr(solver_class, "reset")
+        }
     
     def get_solver_capabilities(self, solver_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -101,59 +200,95 @@ class SolverRegistry:
         """
         matching_solvers = []
         
-        for solver_id, capabilities in self._capabilities.items():
-            if capability in capabilities:
-                if min_value is not None:
-                    # Handle numerical capability thresholds
-                    if capabilities[capability] >= min_value:
-                        matching_solvers.append(solver_id)
-                else:
+        for solver_id in self._by_capability.get(capability, ()):
+            if min_value is not None:
+                # Handle numerical capability thresholds
+                if self._capabilities[solver_id][capability] >= min_value:
                     matching_solvers.append(solver_id)
+            else:
+                matching_solvers.append(solver_id)
         
         return matching_solvers
     
     def find_solvers_for_problem(self, 
                                 problem_type: str, 
-                                problem_characteristics: Dict[str, Any]) -> List[Dict[str, Any]]:
+                                problem_characteristics: Dict[str, Any],
+                                limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Find suitable solvers for a specific problem.
         
         Args:
             problem_type: Type of problem (e.g., 'linear', 'nonlinear', 'combinatorial')
             problem_characteristics: Dictionary of problem characteristics
+            limit: Maximum number of solvers to return, or None for all of them
             
         Returns:
             List of dictionaries with solver information, sorted by suitability
         """
-        suitable_solvers = []
-        
         # Determine required capabilities based on problem characteristics
         required_capabilities = self._map_problem_to_capabilities(
             problem_type, problem_characteristics
         )
         
-        for solver_id, capabilities in self._capabilities.items():
+        scored = self._find_solvers_cached(required_capabilities, limit)
+        
+        solvers = []
+        for solver_id, compatibility_score in scored:
+            # Solvers registered by spec are imported here, on first match
+            solver_class = self.get_solver(solver_id)
+            if solver_class is None:
+                continue
+            solvers.append({
+                "solver_id": solver_id,
+                "solver_class": solver_class,
+                "compatibility_score": compatibility_score,
+                "capabilities": self._capabilities[solver_id],
+                **self._interfaces[solver_id]
+            })
+        
+        return solvers
+    
+    def _score_solvers(self, required: RequiredCaps, limit: Optional[int]) -> tuple:
+        """
+        Score candidate solvers against a set of required capabilities.
+        
+        Results are memoized by _find_solvers_cached and hold only solver IDs
+        and scores; the cache is cleared whenever the registry changes.
+        
+        Args:
+            required: Required capabilities
+            limit: Maximum number of solvers to return, or None for all of them
+            
+        Returns:
+            Tuple of (solver_id, compatibility_score), sorted by suitability
+        """
+        suitable_solvers = []
+        
+        # Only solvers indexed under this problem type (or declaring no
+        # problem types at all) can be compatible
+        candidate_ids = list(self._by_problem_type.get(required.problem_type, ()))
+        candidate_ids.extend(self._untyped_solvers)
+        
+        for solver_id in candidate_ids:
             compatibility_score = self._calculate_compatibility(
-                required_capabilities, capabilities
+                required, self._capability_sets[solver_id]
             )
             
             if compatibility_score > 0:
-                suitable_solvers.append({
-                    "solver_id": solver_id,
-                    "solver_class": self._solvers[solver_id],
-                    "compatibility_score": compatibility_score,
-                    "capabilities": capabilities
-                })
-        
-        # Sort by compatibility score, highest first
-        return sorted(suitable_solvers, 
-                      key=lambda s: s["compatibility_score"], 
-                      reverse=True)
+                suitable_solvers.append((solver_id, compatibility_score))
+        
+        # Highest compatibility first; a bounded heap avoids sorting every match
+        if limit is None:
+            return tuple(sorted(suitable_solvers, key=lambda s: s[1], reverse=True))
+        return tuple(heapq.nlargest(limit, suitable_solvers, key=lambda s: s[1]))
     
     def list_all_solvers(self) -> List[Dict[str, Any]]:
         """
         List all registered solvers and their capabilities.
         
+        Solvers registered by spec and not yet used are listed with the spec
+        string as their solver_class; listing does not import them.
+        
         Returns:
             List of dictionaries with solver information
         """
@@ -166,9 +301,40 @@ class SolverRegistry:
             for solver_id in self._solvers
         ]
     
+    def _add_to_index(self, solver_id: str, capabilities: Dict[str, Any]) -> None:
+        """
+        Add a solver to the inverted capability indexes.
+        
+        Args:
+            solver_id: Solver identifier
+            capabilities: Capabilities of the solver
+        """
+        for capability in capabilities:
+            self._by_capability[capability][solver_id] = None
+        
+        if "problem_types" in capabilities:
+            for problem_type in capabilities["problem_types"]:
+                self._by_problem_type[problem_type][solver_id] = None
+        else:
+            self._untyped_solvers[solver_id] = None
+    
+    def _remove_from_index(self, solver_id: str) -> None:
+        """
+        Remove a solver from the inverted capability indexes.
+        
+        Args:
+            solver_id: Solver identifier
+        """
+        for index in (self._by_capability, self._by_problem_type):
+            for key in list(index):
+                index[key].pop(solver_id, None)
+                if not index[key]:
+                    del index[key]
+        self._untyped_solvers.pop(solver_id, None)
+    
     def _map_problem_to_capabilities(self, 
                                     problem_type: str, 
-                                    characteristics: Dict[str, Any]) -> Dict[str, Any]:
+                                    characteristics: Dict[str, Any]) -> RequiredCaps:
         """
         Map problem characteristics to required solver capabilities.
         
@@ -177,74 +343,96 @@ class SolverRegistry:
             characteristics: Problem characteristics
             
         Returns:
-            Dictionary of required capabilities
+            Required capabilities
         """
-        required_capabilities = {
-            "problem_types": [problem_type],
-        }
+        max_variables = max_constraints = None
+        constraint_types = objective_types = None
         
         # Map problem size to capability requirements
         if "size" in characteristics:
             size = characteristics["size"]
-            required_capabilities["max_variables"] = size.get("variables", 0)
-            required_capabilities["max_constraints"] = size.get("constraints", 0)
+            max_variables = size.get("variables", 0)
+            max_constraints = size.get("constraints", 0)
         
         # Map other characteristics
         if "constraints" in characteristics:
-            constraint_types = characteristics["constraints"].get("types", [])
-            required_capabilities["constraint_types"] = constraint_types
+            constraint_types = frozenset(characteristics["constraints"].get("types", []))
         
         if "objective" in characteristics:
             objective_type = characteristics["objective"].get("type")
             if objective_type:
-                required_capabilities["objective_types"] = [objective_type]
+                objective_types = frozenset((objective_type,))
         
-        return required_capabilities
+        return RequiredCaps(
+            problem_type=problem_type,
+            max_variables=max_variables,
+            max_constraints=max_constraints,
+            constraint_types=constraint_types,
+            objective_types=objective_types
+        )
     
     def _calculate_compatibility(self, 
-                                required: Dict[str, Any], 
+                                required: RequiredCaps, 
                                 available: Dict[str, Any]) -> float:
         """
         Calculate compatibility score between required and available capabilities.
         
         Args:
-            required: Dictionary of required capabilities
-            available: Dictionary of available capabilities
+            required: Required capabilities
+            available: Dictionary of available capabilities, list values as frozensets
             
         Returns:
             Compatibility score between 0 and 1
         """
-        if "problem_types" in required and "problem_types" in available:
-            # If the solver doesn't support any of the required problem types, it's incompatible
-            if not any(pt in available["problem_types"] for pt in required["problem_types"]):
-                return 0.0
+        problem_types = available.get("problem_types")
+        if problem_types is not None and required.problem_type not in problem_types:
+            # If the solver doesn't support the required problem type, it's incompatible
+            return 0.0
         
-        # Count matching capabilities
-        matches = 0
-        total_requirements = 0
+        # Each check returns None when the solver declares no such capability
+        scores = (
+            None if problem_types is None else True,
+            self._score_size(required.max_variables, available.get("max_variables")),
+            self._score_size(required.max_constraints, available.get("max_constraints")),
+            self._score_types(required.constraint_types, available.get("constraint_types")),
+            self._score_types(required.objective_types, available.get("objective_types"))
+        )
         
-        for key, req_value in required.items():
-            total_requirements += 1
-            
-            if key not in available:
-                continue
-            
-            avail_value = available[key]
+        # Calculate score based on proportion of matched requirements
+        applicable = [score for score in scores if score is not None]
+        return sum(applicable) / len(applicable) if applicable else 0.0
+    
+    @staticmethod
+    def _score_size(required: Optional[int], available: Any) -> Optional[bool]:
+        """
+        Check a size requirement against a solver's limit.
+        
+        Args:
+            required: Required size, or None if not required
+            available: Solver limit, or None if not declared
             
-            if isinstance(req_value, list) and isinstance(avail_value, list):
-                # For list values, check if any required item is in available
-                if any(item in avail_value for item in req_value):
-                    matches += 1
-            elif isinstance(req_value, (int, float)) and isinstance(avail_value, (int, float)):
-                # For numeric values, check if available meets or exceeds required
-                if avail_value >= req_value:
-                    matches += 1
-            elif req_value == avail_value:
-                # For exact matches (strings, booleans, etc.)
-                matches += 1
+        Returns:
+            Whether the limit is sufficient, or None if not applicable
+        """
+        if required is None or available is None:
+            return None
+        return available >= required
+    
+    @staticmethod
+    def _score_types(required: Optional[FrozenSet[str]], available: Any) -> Optional[bool]:
+        """
+        Check whether a solver supports any of the required types.
         
-        # Calculate score based on proportion of matched requirements
-        return matches / total_requirements if total_requirements > 0 else 0.0
+        Args:
+            required: Required types, or None if not required
+            available: Supported types, or None if not declared
+            
+        Returns:
+            Whether any required type is supported, or None if not applicable
+        """
+        if required is None or available is None:
+            return None
+        return not required.isdisjoint(available)
 
 # Global solver registry instance
 solver_registry = SolverRegistry()
@@ -10,30 +10,82 @@ System outputs: executed pipeline with annotated results
 Supports Python-native implementation with optional Rust acceleration.
 """
 
+import copy
+import functools
+import hashlib
 import json
 import logging
-from typing import Dict, Any, Optional
+import weakref
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Dict, Any, Optional, Tuple
 
-from .parser import TurbulanceParser
+from .parser import TurbulanceParser, parse_scripts_batch
 from .compiler import TurbulanceCompiler
-from .orchestrator import TurbulanceOrchestrator
 
-# Try to import Rust acceleration functions
 try:
-    import four_sided_triangle_core as rust_core
-    RUST_AVAILABLE = True
-    logger = logging.getLogger(__name__)
-    logger.info("Rust acceleration available for Turbulance DSL")
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    RUST_AVAILABLE = False
-    rust_core = None
-    logger = logging.getLogger(__name__)
-    logger.warning("Rust acceleration not available, using Python implementation")
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=1)
+def _rust_core():
+    """
+    Import the Rust acceleration module on first use.
+    
+    Returns:
+        The ``four_sided_triangle_core`` module, or None if it is not installed
+    """
+    try:
+        import four_sided_triangle_core
+        logger.info("Rust acceleration available for Turbulance DSL")
+        return four_sided_triangle_core
+    except ImportError:
+        logger.warning("Rust acceleration not available, using Python implementation")
+        return None
+
+def __getattr__(name: str) -> Any:
+    # RUST_AVAILABLE and rust_core stay importable, but resolving them
+    # triggers the Rust import probe only when first accessed
+    if name == "RUST_AVAILABLE":
+        return _rust_core() is not None
+    if name == "rust_core":
+        return _rust_core()
+    # The orchestrator pulls in every pipeline stage, so parsing and compiling
+    # do not import it until it is needed
+    if name == "TurbulanceOrchestrator":
+        from .orchestrator import TurbulanceOrchestrator
+        return TurbulanceOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Rust processor configuration, serialized once at import time
+_RUST_PROCESSOR_CONFIG_JSON = json.dumps({
+    "enable_rust_acceleration": True,
+    "enable_fuzzy_inference": True,
+    "enable_bayesian_evaluation": True,
+    "enable_evidence_networks": True,
+    "enable_metacognitive_optimization": True,
+    "max_execution_time_seconds": 300.0,
+    "confidence_threshold": 0.8
+})
+
+def _remove_rust_processor(core, processor_id: str) -> None:
+    """Release a Rust processor; used as a weakref finalizer."""
+    try:
+        core.py_remove_processor(processor_id)
+    except Exception as e:
+        logger.error(f"Failed to clean up Rust processor: {e}")
 
 class TurbulanceProcessor:
     """
     High-level processor that coordinates parsing, compilation, and execution
     with optional Rust acceleration.
+    
+    Use as a (async) context manager or call ``close()`` to release the Rust
+    processor deterministically; otherwise it is released on garbage collection.
     """
     
     def __init__(self, use_rust_acceleration: bool = True):
@@ -43,31 +95,45 @@ class TurbulanceProcessor:
         Args:
             use_rust_acceleration: Whether to use Rust implementation when available
         """
-        self.use_rust = use_rust_acceleration and RUST_AVAILABLE
+        rust_core = _rust_core() if use_rust_acceleration else None
+        self.use_rust = rust_core is not None
         self.processor_id = None
+        self._finalizer = None
+        
+        # LRU cache of compile results keyed by (content hash, protocol name).
+        # Parse results are not cached: copying a cached parse tree costs as
+        # much as parsing the script again.
+        self._compile_cache: "OrderedDict[Tuple[bytes, str], Dict[str, Any]]" = OrderedDict()
+        self._cache_size = 256
         
         if self.use_rust:
+            rust_core = _rust_core()
             try:
                 # Create Rust processor
-                config = {
-                    "enable_rust_acceleration": True,
-                    "enable_fuzzy_inference": True,
-                    "enable_bayesian_evaluation": True,
-                    "enable_evidence_networks": True,
-                    "enable_metacognitive_optimization": True,
-                    "max_execution_time_seconds": 300.0,
-                    "confidence_threshold": 0.8
-                }
-                self.processor_id = rust_core.py_create_turbulance_processor(json.dumps(config))
+                self.processor_id = rust_core.py_create_turbulance_processor(_RUST_PROCESSOR_CONFIG_JSON)
+                # The finalizer holds its own reference to rust_core, so cleanup
+                # does not depend on module globals surviving interpreter shutdown
+                self._finalizer = weakref.finalize(
+                    self, _remove_rust_processor, rust_core, self.processor_id
+                )
                 logger.info(f"Created Rust Turbulance processor: {self.processor_id}")
             except Exception as e:
                 logger.warning(f"Failed to create Rust processor, falling back to Python: {e}")
                 self.use_rust = False
         
-        # Always create Python components as fallback
+        # Always create Python components as fallback; the orchestrator is
+        # created on first use
         self.python_parser = TurbulanceParser()
         self.python_compiler = TurbulanceCompiler()
-        self.python_orchestrator = TurbulanceOrchestrator()
+        self._python_orchestrator = None
+    
+    @property
+    def python_orchestrator(self):
+        """The Python TurbulanceOrchestrator, created on first access."""
+        if self._python_orchestrator is None:
+            from .orchestrator import TurbulanceOrchestrator
+            self._python_orchestrator = TurbulanceOrchestrator()
+        return self._python_orchestrator
     
     async def process_script(self, script_content: str, protocol_name: str) -> Dict[str, Any]:
         """
@@ -81,12 +147,18 @@ class TurbulanceProcessor:
             Complete processing result with annotated script
         """
         if self.use_rust and self.processor_id:
+            rust_core = _rust_core()
             try:
-                # Use Rust implementation
+                # Use Rust implementation, preferring the binding that returns
+                # a dict directly over the JSON string round-trip
+                if hasattr(rust_core, "py_process_turbulance_script_pyobj"):
+                    return rust_core.py_process_turbulance_script_pyobj(
+                        self.processor_id, script_content, protocol_name
+                    )
                 result_json = rust_core.py_process_turbulance_script(
                     self.processor_id, script_content, protocol_name
                 )
-                return json.loads(result_json)
+                return _json_loads(result_json)
             except Exception as e:
                 logger.error(f"Rust processing failed, falling back to Python: {e}")
                 # Fall through to Python implementation
@@ -106,15 +178,17 @@ class TurbulanceProcessor:
             Parsed script structure
         """
         if self.use_rust:
+            rust_core = _rust_core()
             try:
                 result_json = rust_core.py_parse_turbulance_script(script_content, protocol_name)
-                return json.loads(result_json)
+                return _json_loads(result_json)
             except Exception as e:
                 logger.error(f"Rust parsing failed, falling back to Python: {e}")
         
         # Use Python implementation
         parsed_script = self.python_parser.parse_script(script_content, protocol_name)
-        return parsed_script.__dict__
+        # Shallow field copy; TurbulanceScript has no __dict__ when slotted
+        return {f.name: getattr(parsed_script, f.name) for f in fields(parsed_script)}
     
     def compile_script(self, script_content: str, protocol_name: str) -> Dict[str, Any]:
         """
@@ -127,20 +201,55 @@ class TurbulanceProcessor:
         Returns:
             Compiled protocol
         """
+        key = self._cache_key(script_content, protocol_name)
+        cached = self._cache_get(self._compile_cache, key)
+        if cached is not None:
+            return cached
+        
+        result = None
         if self.use_rust:
+            rust_core = _rust_core()
             try:
                 # First parse with Rust
                 parsed_json = rust_core.py_parse_turbulance_script(script_content, protocol_name)
                 # Then compile
                 compiled_json = rust_core.py_compile_turbulance_protocol(parsed_json)
-                return json.loads(compiled_json)
+                result = _json_loads(compiled_json)
             except Exception as e:
                 logger.error(f"Rust compilation failed, falling back to Python: {e}")
         
-        # Use Python implementation
-        parsed_script = self.python_parser.parse_script(script_content, protocol_name)
-        compiled_protocol = self.python_compiler.compile_protocol(parsed_script)
-        return compiled_protocol.__dict__
+        if result is None:
+            # Use Python implementation
+            parsed_script = self.python_parser.parse_script(script_content, protocol_name)
+            compiled_protocol = self.python_compiler.compile_protocol(parsed_script)
+            # Shallow field copy; CompiledProtocol has no __dict__ when slotted
+            result = {f.name: getattr(compiled_protocol, f.name) for f in fields(compiled_protocol)}
+        
+        self._cache_put(self._compile_cache, key, result)
+        return copy.deepcopy(result)
+    
+    @staticmethod
+    def _cache_key(script_content: str, protocol_name: str) -> Tuple[bytes, str]:
+        """Build the compile cache key for a script."""
+        digest = hashlib.blake2b(script_content.encode("utf-8"), digest_size=16).digest()
+        return digest, protocol_name
+    
+    def _cache_get(self, cache: OrderedDict, key: Tuple[bytes, str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result, returning a deep copy so callers cannot
+        modify any part of the cached structure, including nested nodes and steps.
+        """
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        cache.move_to_end(key)
+        return copy.deepcopy(cached)
+    
+    def _cache_put(self, cache: OrderedDict, key: Tuple[bytes, str], value: Dict[str, Any]) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        cache[key] = value
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -155,9 +264,10 @@ class TurbulanceProcessor:
         }
         
         if self.use_rust and self.processor_id:
+            rust_core = _rust_core()
             try:
                 rust_stats_json = rust_core.py_get_processor_statistics(self.processor_id)
-                rust_stats = json.loads(rust_stats_json)
+                rust_stats = _json_loads(rust_stats_json)
                 stats.update(rust_stats)
             except Exception as e:
                 logger.error(f"Failed to get Rust statistics: {e}")
@@ -168,47 +278,60 @@ class TurbulanceProcessor:
         
         return stats
     
-    def __del__(self):
-        """Clean up Rust processor when object is destroyed."""
-        if self.use_rust and self.processor_id:
-            try:
-                rust_core.py_remove_processor(self.processor_id)
-            except Exception as e:
-                logger.error(f"Failed to clean up Rust processor: {e}")
+    def close(self) -> None:
+        """Release the Rust processor, if one was created. Safe to call twice."""
+        if self._finalizer is not None:
+            self._finalizer()
+        self.processor_id = None
+    
+    def __enter__(self) -> "TurbulanceProcessor":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> "TurbulanceProcessor":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
 
 # Convenience functions for direct access to Rust functions
 def parse_with_rust(script_content: str, protocol_name: str) -> Optional[Dict[str, Any]]:
     """Parse script using Rust implementation directly."""
-    if not RUST_AVAILABLE:
+    rust_core = _rust_core()
+    if rust_core is None:
         return None
     
     try:
         result_json = rust_core.py_parse_turbulance_script(script_content, protocol_name)
-        return json.loads(result_json)
+        return _json_loads(result_json)
     except Exception as e:
         logger.error(f"Rust parsing error: {e}")
         return None
 
 def get_rust_parser_statistics() -> Optional[Dict[str, Any]]:
     """Get parser statistics from Rust implementation."""
-    if not RUST_AVAILABLE:
+    rust_core = _rust_core()
+    if rust_core is None:
         return None
     
     try:
         stats_json = rust_core.py_get_parser_statistics()
-        return json.loads(stats_json)
+        return _json_loads(stats_json)
     except Exception as e:
         logger.error(f"Failed to get Rust parser statistics: {e}")
         return None
 
 def get_rust_orchestrator_statistics() -> Optional[Dict[str, Any]]:
     """Get orchestrator statistics from Rust implementation."""
-    if not RUST_AVAILABLE:
+    rust_core = _rust_core()
+    if rust_core is None:
         return None
     
     try:
         stats_json = rust_core.py_get_orchestrator_statistics()
-        return json.loads(stats_json)
+        return _json_loads(stats_json)
     except Exception as e:
         logger.error(f"Failed to get Rust orchestrator statistics: {e}")
         return None
@@ -219,6 +342,7 @@ __all__ = [
     "TurbulanceCompiler", 
     "TurbulanceOrchestrator",
     "TurbulanceProcessor",
+    "parse_scripts_batch",
     "parse_with_rust",
     "get_rust_parser_statistics", 
     "get_rust_orchestrator_statistics",
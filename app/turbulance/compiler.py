@@ -11,15 +11,26 @@ pipeline sequences. It handles:
 """
 
 import logging
+import sys
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+import io
 import json
 
-from .parser import TurbulanceScript, TurbulanceNode, TurbulanceNodeType
+from .parser import TurbulanceParser, TurbulanceScript, TurbulanceNode, TurbulanceNodeType
+from ..utils.errors import CycleDetectedError
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Resource requirements for stages without an estimate, as frozen (name, value) pairs
+_DEFAULT_RESOURCE_REQUIREMENTS = (("cpu", 1), ("memory", 2), ("gpu", 0), ("time", 10))
+
 class ExecutionMode(Enum):
     """Execution modes for compiled protocols"""
     SEQUENTIAL = "sequential"
@@ -33,7 +44,7 @@ class ResourcePriority(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExecutionStep:
     """Represents a single execution step in the compiled pipeline"""
     step_id: str
@@ -45,7 +56,7 @@ class ExecutionStep:
     line_number: int
     annotation_target: str  # Where to inject results in the script
 
-@dataclass
+@dataclass(**_SLOTS)
 class CompiledProtocol:
     """Represents a compiled Turbulance protocol ready for execution"""
     protocol_name: str
@@ -55,6 +66,7 @@ class CompiledProtocol:
     dependency_graph: Dict[str, List[str]]
     annotation_map: Dict[str, str]  # Maps execution results to script locations
     auxiliary_files: Dict[str, str]  # .fs, .ghd, .hre file contents
+    topological_order: List[str] = field(default_factory=list)  # Step IDs, dependencies first
 
 class TurbulanceCompiler:
     """Compiles Turbulance scripts into executable Four-Sided Triangle pipelines"""
@@ -82,15 +94,23 @@ class TurbulanceCompiler:
             "stage7_verification": {"cpu": 1, "memory": 2, "gpu": 0, "time": 5}
         }
         
-    def compile_protocol(self, script: TurbulanceScript) -> CompiledProtocol:
-        """Compile a parsed Turbulance script into executable protocol"""
+        # Reused across compiles to generate auxiliary files
+        self._parser = TurbulanceParser()
+        
+        # Memoized stage name -> (actual stage, frozen requirements); clear it
+        # with self._resolve_stage.cache_clear() after changing the tables above
+        self._resolve_stage = lru_cache(maxsize=64)(self._lookup_stage)
+        
+    def compile_protocol(self, script: TurbulanceScript, annotate: bool = True) -> CompiledProtocol:
+        """Compile a parsed Turbulance script into executable protocol; annotate=False leaves the annotation map empty"""
         logger.info(f"Compiling Turbulance protocol: {script.protocol_name}")
         
         # Create execution steps from pipeline calls
         execution_steps = self._create_execution_steps(script)
         
-        # Resolve dependencies
+        # Resolve dependencies and reject cyclic protocols up front
         dependency_graph = self._resolve_dependencies(execution_steps)
+        topological_order = self._topological_order(dependency_graph)
         
         # Determine execution mode
         execution_mode = self._determine_execution_mode(execution_steps, dependency_graph)
@@ -99,12 +119,10 @@ class TurbulanceCompiler:
         resource_allocation = self._allocate_resources(execution_steps, execution_mode)
         
         # Create annotation map for result injection
-        annotation_map = self._create_annotation_map(script, execution_steps)
+        annotation_map = self._create_annotation_map(script, execution_steps) if annotate else {}
         
         # Generate auxiliary files
-        from .parser import TurbulanceParser
-        parser = TurbulanceParser()
-        auxiliary_files = parser.generate_auxiliary_files(script)
+        auxiliary_files = self._parser.generate_auxiliary_files(script)
         
         compiled_protocol = CompiledProtocol(
             protocol_name=script.protocol_name,
@@ -113,29 +131,37 @@ class TurbulanceCompiler:
             resource_allocation=resource_allocation,
             dependency_graph=dependency_graph,
             annotation_map=annotation_map,
-            auxiliary_files=auxiliary_files
+            auxiliary_files=auxiliary_files,
+            topological_order=topological_order
         )
         
         logger.info(f"Compiled protocol with {len(execution_steps)} steps")
         return compiled_protocol
     
+    def _lookup_stage(self, stage_name: str) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+        """Map a script stage name to its pipeline stage and frozen resource requirements"""
+        actual_stage = self.stage_mappings.get(stage_name, stage_name)
+        estimates = self.default_resource_estimates.get(actual_stage)
+        if estimates is None:
+            return actual_stage, _DEFAULT_RESOURCE_REQUIREMENTS
+        return actual_stage, tuple(estimates.items())
+    
     def _create_execution_steps(self, script: TurbulanceScript) -> List[ExecutionStep]:
         """Create execution steps from pipeline calls"""
         steps = []
+        # Requirement dicts built once per distinct stage in this script
+        requirements_by_stage = {}
         
         for call in script.pipeline_calls:
             stage_name = call.parsed_data.get('stage', 'unknown')
             variable_name = call.parsed_data.get('variable', f'step_{call.line_number}')
             parameters = call.parsed_data.get('parameters', {})
             
-            # Map to actual stage names
-            actual_stage = self.stage_mappings.get(stage_name, stage_name)
-            
-            # Get resource requirements
-            resource_requirements = self.default_resource_estimates.get(
-                actual_stage, 
-                {"cpu": 1, "memory": 2, "gpu": 0, "time": 10}
-            )
+            # Map to actual stage names and resource requirements
+            actual_stage, frozen_requirements = self._resolve_stage(stage_name)
+            resource_requirements = requirements_by_stage.get(actual_stage)
+            if resource_requirements is None:
+                resource_requirements = requirements_by_stage[actual_stage] = dict(frozen_requirements)
             
             # Create execution step
             step = ExecutionStep(
@@ -172,6 +198,31 @@ class TurbulanceCompiler:
         
         return dependency_graph
     
+    def _topological_order(self, dependency_graph: Dict[str, List[str]]) -> List[str]:
+        """Order step IDs so each follows its dependencies, raising CycleDetectedError if impossible"""
+        # Kahn's algorithm
+        in_degree = {step_id: len(dependencies) for step_id, dependencies in dependency_graph.items()}
+        dependents = {step_id: [] for step_id in dependency_graph}
+        for step_id, dependencies in dependency_graph.items():
+            for dep in dependencies:
+                dependents[dep].append(step_id)
+        
+        queue = deque(step_id for step_id, degree in in_degree.items() if degree == 0)
+        order = []
+        while queue:
+            step_id = queue.popleft()
+            order.append(step_id)
+            for dependent_id in dependents[step_id]:
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    queue.append(dependent_id)
+        
+        if len(order) < len(dependency_graph):
+            cyclic = [step_id for step_id, degree in in_degree.items() if degree > 0]
+            raise CycleDetectedError(f"Circular dependency between steps: {', '.join(cyclic)}", cyclic)
+        
+        return order
+    
     def _determine_execution_mode(self, steps: List[ExecutionStep], dependency_graph: Dict[str, List[str]]) -> ExecutionMode:
         """Determine the best execution mode for the protocol"""
         
@@ -188,17 +239,28 @@ class TurbulanceCompiler:
     
     def _allocate_resources(self, steps: List[ExecutionStep], execution_mode: ExecutionMode) -> Dict[str, Any]:
         """Allocate resources for execution"""
-        total_cpu = sum(step.resource_requirements.get('cpu', 1) for step in steps)
-        total_memory = sum(step.resource_requirements.get('memory', 2) for step in steps)
-        total_gpu = sum(step.resource_requirements.get('gpu', 0) for step in steps)
+        # Totals and peaks of every resource in a single pass over the steps
+        total_cpu = total_memory = total_gpu = total_time = 0
+        max_cpu = max_memory = max_gpu = 0
+        for step in steps:
+            requirements = step.resource_requirements
+            cpu = requirements.get('cpu', 1)
+            memory = requirements.get('memory', 2)
+            gpu = requirements.get('gpu', 0)
+            total_cpu += cpu
+            total_memory += memory
+            total_gpu += gpu
+            total_time += requirements.get('time', 10)
+            if cpu > max_cpu:
+                max_cpu = cpu
+            if memory > max_memory:
+                max_memory = memory
+            if gpu > max_gpu:
+                max_gpu = gpu
         
         # Adjust for execution mode
         if execution_mode == ExecutionMode.PARALLEL:
             # All steps run simultaneously
-            max_cpu = max(step.resource_requirements.get('cpu', 1) for step in steps)
-            max_memory = max(step.resource_requirements.get('memory', 2) for step in steps)
-            max_gpu = max(step.resource_requirements.get('gpu', 0) for step in steps)
-            
             allocation = {
                 "cpu_cores": max_cpu,
                 "memory_gb": max_memory,
@@ -214,7 +276,7 @@ class TurbulanceCompiler:
         
         allocation.update({
             "execution_mode": execution_mode.value,
-            "estimated_time_seconds": sum(step.resource_requirements.get('time', 10) for step in steps),
+            "estimated_time_seconds": total_time,
             "step_count": len(steps)
         })
         
@@ -224,49 +286,71 @@ class TurbulanceCompiler:
         """Create mapping for result annotation back to script"""
         annotation_map = {}
         
+        # Index pipeline call nodes by line, keeping the first node on each line
+        call_nodes_by_line = {}
+        for node in script.nodes:
+            if node.node_type == TurbulanceNodeType.PIPELINE_CALL:
+                call_nodes_by_line.setdefault(node.line_number, node)
+        
         for step in steps:
             # Find the original line in the script
-            original_line = None
-            for node in script.nodes:
-                if (node.node_type == TurbulanceNodeType.PIPELINE_CALL and 
-                    node.line_number == step.line_number):
-                    original_line = node.content
-                    break
+            node = call_nodes_by_line.get(step.line_number)
+            original_line = node.content if node is not None else None
             
             if original_line:
                 annotation_map[step.step_id] = {
                     "original_line": original_line,
                     "line_number": step.line_number,
                     "variable_name": step.variable_name,
-                    "annotation_pattern": f"// RESULT: {step.variable_name} = {{result}}"
+                    # Result text is appended directly, no template to format
+                    "annotation_prefix": step.annotation_target
                 }
         
         return annotation_map
     
     def annotate_script_with_results(self, script_content: str, results: Dict[str, Any], annotation_map: Dict[str, str]) -> str:
         """Annotate the original script with execution results"""
-        lines = script_content.split('\n')
-        annotated_lines = []
+        if not annotation_map:
+            return script_content
+        
+        annotations = {}
+        for step_id, (line_number, annotation_info) in self.annotation_targets(annotation_map).items():
+            annotation = self.format_annotation(annotation_info, results.get(step_id))
+            if annotation is not None:
+                annotations[line_number] = annotation
         
-        for i, line in enumerate(lines):
-            annotated_lines.append(line)
+        return self.render_annotated_script(script_content, annotations)
+    
+    def annotation_targets(self, annotation_map: Dict[str, Any]) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+        """Map each annotated step to its (line_number, annotation_info); the first step mapped to a line wins"""
+        owners = {}
+        for step_id, annotation_info in annotation_map.items():
+            owners.setdefault(annotation_info["line_number"], step_id)
+        return {
+            step_id: (line_number, annotation_map[step_id])
+            for line_number, step_id in owners.items()
+        }
+    
+    def format_annotation(self, annotation_info: Dict[str, Any], result: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Format the annotation line for one step's result, or None if there is no result"""
+        if not result:
+            return None
+        return "    " + annotation_info["annotation_prefix"] + self._format_result_for_annotation(result)
+    
+    def render_annotated_script(self, script_content: str, annotations_by_line: Dict[int, str]) -> str:
+        """Write the script with each annotation inserted after its line, in a single pass"""
+        output = io.StringIO()
+        for line_number, line in enumerate(script_content.split('\n'), 1):
+            if line_number > 1:
+                output.write('\n')
+            output.write(line)
             
-            # Check if this line needs annotation
-            line_number = i + 1
-            for step_id, annotation_info in annotation_map.items():
-                if annotation_info["line_number"] == line_number:
-                    # Get the result for this step
-                    result = results.get(step_id, {})
-                    
-                    # Format the result annotation
-                    if result:
-                        result_summary = self._format_result_for_annotation(result)
-                        annotation = annotation_info["annotation_pattern"].format(result=result_summary)
-                        annotated_lines.append(f"    {annotation}")
-                    
-                    break
-        
-        return '\n'.join(annotated_lines)
+            annotation = annotations_by_line.get(line_number)
+            if annotation is not None:
+                output.write('\n')
+                output.write(annotation)
+        
+        return output.getvalue()
     
     def _format_result_for_annotation(self, result: Dict[str, Any]) -> str:
         """Format a result for script annotation"""
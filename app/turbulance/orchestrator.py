@@ -11,16 +11,22 @@ the Four-Sided Triangle pipeline system. It handles:
 """
 
 import logging
+import sys
 import asyncio
-from typing import Dict, List, Any, Optional, Tuple
+import functools
+from typing import TYPE_CHECKING, Awaitable, Callable, ClassVar, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+import hashlib
+import heapq
 import json
+import os
+import threading
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .parser import TurbulanceParser, TurbulanceScript
 from .compiler import TurbulanceCompiler, CompiledProtocol, ExecutionStep
-from ..orchestrator.metacognitive_orchestrator import MetacognitiveOrchestrator
 from ..core.stages.stage0_query_processor.query_processor_service import QueryProcessorService
 from ..core.stages.stage1_semantic_atdb.semantic_atdb_service import SemanticAtdbService
 from ..core.stages.stage2_domain_knowledge.domain_knowledge_service import DomainKnowledgeService
@@ -30,9 +36,16 @@ from ..core.stages.stage5_scoring.response_scoring_service import ResponseScorin
 from ..core.stages.stage6_comparison.response_comparison_service import ResponseComparisonService
 from ..core.stages.stage7_verification.threshold_verification_service import ThresholdVerificationService
 
+if TYPE_CHECKING:
+    # app.orchestrator imports app.turbulance, so it is imported lazily at runtime
+    from ..orchestrator.metacognitive_orchestrator import MetacognitiveOrchestrator
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class ExecutionResult:
     """Result of a single execution step"""
     step_id: str
@@ -41,7 +54,7 @@ class ExecutionResult:
     execution_time: float
     error_message: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProtocolExecutionResult:
     """Result of complete protocol execution"""
     protocol_name: str
@@ -55,22 +68,33 @@ class ProtocolExecutionResult:
 class TurbulanceOrchestrator:
     """Orchestrates Turbulance protocol execution through Four-Sided Triangle pipeline"""
     
-    def __init__(self, orchestrator: Optional[MetacognitiveOrchestrator] = None):
+    # Stage services and the default metacognitive orchestrator are expensive to
+    # build, so they are created once and shared by all instances
+    _shared_services: ClassVar[Optional[Dict[str, Any]]] = None
+    _shared_orchestrator: ClassVar[Optional["MetacognitiveOrchestrator"]] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    # Synchronous services run on one thread pool shared by all instances, so
+    # per-request orchestrators do not each leave idle threads behind
+    _shared_executor: ClassVar[Optional[ThreadPoolExecutor]] = None
+    
+    def __init__(self, orchestrator: Optional["MetacognitiveOrchestrator"] = None):
         self.parser = TurbulanceParser()
         self.compiler = TurbulanceCompiler()
-        self.orchestrator = orchestrator or MetacognitiveOrchestrator()
-        
-        # Initialize pipeline services
-        self.services = {
-            "stage0_query_processor": QueryProcessorService(),
-            "stage1_semantic_atdb": SemanticAtdbService(),
-            "stage2_domain_knowledge": DomainKnowledgeService(),
-            "stage3_reasoning_optimization": ReasoningOptimizationService(),
-            "stage4_solution": SolutionGenerationService(),
-            "stage5_scoring": ResponseScoringService(),
-            "stage6_comparison": ResponseComparisonService(),
-            "stage7_verification": ThresholdVerificationService()
-        }
+        self.orchestrator = orchestrator or self._get_default_orchestrator()
+        
+        # Pipeline services; the dict is per instance so replacing a stage here
+        # does not affect other orchestrators, but the service objects are shared
+        self.services = dict(self._get_services())
+        
+        # Stage name -> (service, awaitable entry point), filled lazily by
+        # _get_invoker so a service without an entry point only fails its steps
+        self._invokers: Dict[str, Tuple[Any, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]]] = {}
+        
+        # LRU of (script digest, protocol name, annotate) -> compiled protocol; compiling
+        # is deterministic, so re-submitted scripts skip parse and compile
+        self._compiled_cache: "OrderedDict[Tuple[bytes, str, bool], CompiledProtocol]" = OrderedDict()
+        self._compiled_cache_size = 128
         
         # Execution statistics
         self.execution_stats = {
@@ -80,29 +104,84 @@ class TurbulanceOrchestrator:
             "average_execution_time": 0.0
         }
         
-    async def execute_protocol(self, script_content: str, protocol_name: str = "research_protocol") -> ProtocolExecutionResult:
-        """Execute a complete Turbulance protocol"""
+    @classmethod
+    def _get_services(cls) -> Dict[str, Any]:
+        """Get the shared stage services, creating them on first use"""
+        if cls._shared_services is None:
+            with cls._shared_lock:
+                if cls._shared_services is None:
+                    cls._shared_services = {
+                        "stage0_query_processor": QueryProcessorService(),
+                        "stage1_semantic_atdb": SemanticAtdbService(),
+                        "stage2_domain_knowledge": DomainKnowledgeService(),
+                        "stage3_reasoning_optimization": ReasoningOptimizationService(),
+                        "stage4_solution": SolutionGenerationService(),
+                        "stage5_scoring": ResponseScoringService(),
+                        "stage6_comparison": ResponseComparisonService(),
+                        "stage7_verification": ThresholdVerificationService()
+                    }
+        return cls._shared_services
+    
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared thread pool for synchronous services, creating it on first use"""
+        if cls._shared_executor is None:
+            with cls._shared_lock:
+                if cls._shared_executor is None:
+                    cls._shared_executor = ThreadPoolExecutor(max_workers=8)
+        return cls._shared_executor
+    
+    @classmethod
+    def shutdown_executor(cls, wait: bool = True) -> None:
+        """Shut down the shared thread pool; it is recreated if an orchestrator is used again"""
+        with cls._shared_lock:
+            executor, cls._shared_executor = cls._shared_executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    @classmethod
+    def _get_default_orchestrator(cls) -> "MetacognitiveOrchestrator":
+        """Get the shared default MetacognitiveOrchestrator, creating it on first use"""
+        if cls._shared_orchestrator is None:
+            with cls._shared_lock:
+                if cls._shared_orchestrator is None:
+                    from ..orchestrator.metacognitive_orchestrator import MetacognitiveOrchestrator
+                    cls._shared_orchestrator = MetacognitiveOrchestrator()
+        return cls._shared_orchestrator
+    
+    async def execute_protocol(self, script_content: str, protocol_name: str = "research_protocol",
+                               annotate: bool = True) -> ProtocolExecutionResult:
+        """Execute a complete Turbulance protocol; with annotate=False the script is returned without result annotations"""
         start_time = time.time()
         
         try:
             logger.info(f"Starting execution of protocol: {protocol_name}")
             
-            # Parse the script
-            script = self.parser.parse_script(script_content, protocol_name)
+            # Parse and compile the script, reusing a cached compilation when possible
+            compiled_protocol = self._compile(script_content, protocol_name, annotate)
             
-            # Compile the protocol
-            compiled_protocol = self.compiler.compile_protocol(script)
-            
-            # Execute the compiled protocol
-            step_results = await self._execute_compiled_protocol(compiled_protocol)
-            
-            # Collect results
-            results_dict = {result.step_id: result.result for result in step_results}
-            
-            # Annotate the script with results
-            annotated_script = self.compiler.annotate_script_with_results(
-                script_content, results_dict, compiled_protocol.annotation_map
-            )
+            if compiled_protocol.annotation_map:
+                # Format each step's annotation as soon as the step finishes
+                targets = self.compiler.annotation_targets(compiled_protocol.annotation_map)
+                annotations = {}
+                
+                def annotate_step(step_result: ExecutionResult) -> None:
+                    target = targets.get(step_result.step_id)
+                    if target is not None:
+                        line_number, annotation_info = target
+                        annotation = self.compiler.format_annotation(annotation_info, step_result.result)
+                        if annotation is not None:
+                            annotations[line_number] = annotation
+                
+                # Execute the compiled protocol
+                step_results = await self._execute_compiled_protocol(compiled_protocol, annotate_step)
+                
+                # Annotate the script with results
+                annotated_script = self.compiler.render_annotated_script(script_content, annotations)
+            else:
+                # Nothing to annotate, so skip formatting and rendering
+                step_results = await self._execute_compiled_protocol(compiled_protocol)
+                annotated_script = script_content
             
             # Calculate execution time
             execution_time = time.time() - start_time
@@ -141,54 +220,79 @@ class TurbulanceOrchestrator:
                 error_message=str(e)
             )
     
-    async def _execute_compiled_protocol(self, compiled_protocol: CompiledProtocol) -> List[ExecutionResult]:
-        """Execute a compiled protocol through the pipeline"""
+    def _compile(self, script_content: str, protocol_name: str, annotate: bool = True) -> CompiledProtocol:
+        """Parse and compile a script, memoized by content hash, protocol name and annotate flag"""
+        key = (hashlib.blake2b(script_content.encode("utf-8"), digest_size=16).digest(), protocol_name, annotate)
+        compiled_protocol = self._compiled_cache.get(key)
+        if compiled_protocol is not None:
+            self._compiled_cache.move_to_end(key)
+            return compiled_protocol
+        
+        script = self.parser.parse_script(script_content, protocol_name)
+        compiled_protocol = self.compiler.compile_protocol(script, annotate)
+        
+        self._compiled_cache[key] = compiled_protocol
+        if len(self._compiled_cache) > self._compiled_cache_size:
+            self._compiled_cache.popitem(last=False)
+        return compiled_protocol
+    
+    async def _execute_compiled_protocol(self, compiled_protocol: CompiledProtocol,
+                                         on_result: Optional[Callable[[ExecutionResult], None]] = None) -> List[ExecutionResult]:
+        """Execute a compiled protocol through the pipeline, reporting each step result to on_result as it completes"""
         results = []
         
         if compiled_protocol.execution_mode.value == "parallel":
-            # Execute all steps in parallel
-            results = await self._execute_parallel(compiled_protocol.execution_steps)
+            # Execute all steps in parallel; in this mode the compiler's
+            # cpu_cores is the largest per-step requirement, not a budget,
+            # so concurrency is bounded by the machine instead
+            results = await self._execute_parallel(
+                compiled_protocol.execution_steps,
+                on_result=on_result
+            )
         elif compiled_protocol.execution_mode.value == "sequential":
             # Execute steps sequentially
-            results = await self._execute_sequential(compiled_protocol.execution_steps)
+            results = await self._execute_sequential(compiled_protocol.execution_steps, on_result)
         else:
             # Adaptive execution based on dependencies
-            results = await self._execute_adaptive(compiled_protocol.execution_steps, compiled_protocol.dependency_graph)
+            results = await self._execute_adaptive(
+                compiled_protocol.execution_steps,
+                compiled_protocol.dependency_graph,
+                compiled_protocol.resource_allocation.get("cpu_cores"),
+                on_result,
+                compiled_protocol.topological_order
+            )
         
         return results
     
-    async def _execute_parallel(self, steps: List[ExecutionStep]) -> List[ExecutionResult]:
-        """Execute steps in parallel"""
+    async def _execute_parallel(self, steps: List[ExecutionStep],
+                                max_concurrency: Optional[int] = None,
+                                on_result: Optional[Callable[[ExecutionResult], None]] = None) -> List[ExecutionResult]:
+        """Execute steps in parallel, at most max_concurrency (default: CPU count) at a time"""
+        # Bound concurrency by the total CPU budget instead of launching every stage at once
+        if not max_concurrency or max_concurrency <= 0:
+            max_concurrency = os.cpu_count() or max(len(steps), 1)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded_step(step):
+            async with semaphore:
+                return await self._execute_step(step, on_result)
+        
         tasks = []
         
         for step in steps:
-            task = asyncio.create_task(self._execute_step(step))
+            task = asyncio.create_task(bounded_step(step))
             tasks.append(task)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Convert exceptions to failed results
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                final_results.append(ExecutionResult(
-                    step_id=steps[i].step_id,
-                    success=False,
-                    result={},
-                    execution_time=0.0,
-                    error_message=str(result)
-                ))
-            else:
-                final_results.append(result)
-        
-        return final_results
+        # _execute_step turns failures into unsuccessful ExecutionResults
+        return list(await asyncio.gather(*tasks))
     
-    async def _execute_sequential(self, steps: List[ExecutionStep]) -> List[ExecutionResult]:
+    async def _execute_sequential(self, steps: List[ExecutionStep],
+                                  on_result: Optional[Callable[[ExecutionResult], None]] = None) -> List[ExecutionResult]:
         """Execute steps sequentially"""
         results = []
         
         for step in steps:
-            result = await self._execute_step(step)
+            result = await self._execute_step(step, on_result)
             results.append(result)
             
             # Stop if a step fails (optional - could be configurable)
@@ -197,87 +301,125 @@ class TurbulanceOrchestrator:
         
         return results
     
-    async def _execute_adaptive(self, steps: List[ExecutionStep], dependency_graph: Dict[str, List[str]]) -> List[ExecutionResult]:
-        """Execute steps adaptively based on dependencies"""
+    async def _execute_adaptive(self, steps: List[ExecutionStep], dependency_graph: Dict[str, List[str]],
+                                max_parallelism: Optional[int] = None,
+                                on_result: Optional[Callable[[ExecutionResult], None]] = None,
+                                topological_order: Optional[List[str]] = None) -> List[ExecutionResult]:
+        """Execute steps adaptively based on dependencies, longest critical path first"""
         results = {}
-        completed_steps = set()
+        order = {step.step_id: i for i, step in enumerate(steps)}
         
-        while len(completed_steps) < len(steps):
-            # Find steps that can be executed now
-            ready_steps = []
-            for step in steps:
-                if step.step_id not in completed_steps:
-                    dependencies = dependency_graph.get(step.step_id, [])
-                    if all(dep in completed_steps for dep in dependencies):
-                        ready_steps.append(step)
-            
-            if not ready_steps:
-                # No progress possible - circular dependency or other issue
-                remaining_steps = [step for step in steps if step.step_id not in completed_steps]
-                for step in remaining_steps:
-                    results[step.step_id] = ExecutionResult(
-                        step_id=step.step_id,
-                        success=False,
-                        result={},
-                        execution_time=0.0,
-                        error_message="Dependency deadlock or circular dependency"
-                    )
-                    completed_steps.add(step.step_id)
-                break
-            
-            # Execute ready steps in parallel
-            tasks = []
-            for step in ready_steps:
-                task = asyncio.create_task(self._execute_step(step))
-                tasks.append(task)
-            
-            step_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Kahn's algorithm: count unmet dependencies per step and invert the
+        # graph so a completed step only touches its own dependents
+        in_degree = {}
+        dependents = {step.step_id: [] for step in steps}
+        for step in steps:
+            dependencies = dependency_graph.get(step.step_id, [])
+            in_degree[step.step_id] = len(dependencies)
+            for dep in dependencies:
+                dependents.setdefault(dep, []).append(step.step_id)
+        
+        # Ready steps are popped by descending remaining critical path, so long
+        # branches start before short ones; ties keep script order
+        critical_path = self._compute_critical_path(steps, dependents, topological_order)
+        ready = [(-critical_path[step.step_id], order[step.step_id])
+                 for step in steps if in_degree[step.step_id] == 0]
+        heapq.heapify(ready)
+        limit = max_parallelism if max_parallelism and max_parallelism > 0 else len(steps)
+        running = {}
+        
+        def launch_ready():
+            # Start the most critical ready steps while there is spare capacity
+            while ready and len(running) < limit:
+                step = steps[heapq.heappop(ready)[1]]
+                running[asyncio.create_task(self._execute_step(step, on_result))] = step
+        
+        launch_ready()
+        while running:
+            # Handle steps as they finish, so dependents start as soon as their
+            # last dependency completes rather than after the whole wave
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
             
-            # Process results
-            for i, result in enumerate(step_results):
-                step = ready_steps[i]
+            for task in done:
+                # _execute_step turns failures into unsuccessful ExecutionResults
+                step = running.pop(task)
+                results[step.step_id] = task.result()
                 
-                if isinstance(result, Exception):
+                for dependent_id in dependents[step.step_id]:
+                    in_degree[dependent_id] -= 1
+                    if in_degree[dependent_id] == 0:
+                        heapq.heappush(ready, (-critical_path[dependent_id], order[dependent_id]))
+            
+            launch_ready()
+        
+        if len(results) < len(steps):
+            # No progress possible - circular dependency or other issue. Compiled
+            # protocols are checked for cycles up front, so only graphs passed in
+            # directly can get here
+            for step in steps:
+                if step.step_id not in results:
                     results[step.step_id] = ExecutionResult(
                         step_id=step.step_id,
                         success=False,
                         result={},
                         execution_time=0.0,
-                        error_message=str(result)
+                        error_message="Dependency deadlock or circular dependency"
                     )
-                else:
-                    results[step.step_id] = result
-                
-                completed_steps.add(step.step_id)
         
         # Return results in original order
         return [results[step.step_id] for step in steps]
     
-    async def _execute_step(self, step: ExecutionStep) -> ExecutionResult:
-        """Execute a single pipeline step"""
+    def _compute_critical_path(self, steps: List[ExecutionStep], dependents: Dict[str, List[str]],
+                               topological_order: Optional[List[str]] = None) -> Dict[str, float]:
+        """Compute each step's remaining critical path: its estimated time plus the longest downstream chain"""
+        topo_order = topological_order
+        if not topo_order:
+            # No order from the compiler; derive one with a throwaway Kahn pass
+            in_degree = {step.step_id: 0 for step in steps}
+            for step in steps:
+                for dependent_id in dependents.get(step.step_id, []):
+                    in_degree[dependent_id] += 1
+            frontier = [step.step_id for step in steps if in_degree[step.step_id] == 0]
+            topo_order = []
+            while frontier:
+                step_id = frontier.pop()
+                topo_order.append(step_id)
+                for dependent_id in dependents.get(step_id, []):
+                    in_degree[dependent_id] -= 1
+                    if in_degree[dependent_id] == 0:
+                        frontier.append(dependent_id)
+        
+        # Steps on a cycle never reach the topological order; they keep their own time
+        critical_path = {
+            step.step_id: step.resource_requirements.get('time', 10) for step in steps
+        }
+        for step_id in reversed(topo_order):
+            downstream = [critical_path[d] for d in dependents.get(step_id, [])]
+            if downstream:
+                critical_path[step_id] += max(downstream)
+        
+        return critical_path
+    
+    async def _execute_step(self, step: ExecutionStep,
+                            on_result: Optional[Callable[[ExecutionResult], None]] = None) -> ExecutionResult:
+        """Execute a single pipeline step, passing its result to on_result if given"""
         start_time = time.time()
         
         try:
             logger.info(f"Executing step: {step.step_id} (stage: {step.stage_name})")
             
             # Get the appropriate service
-            service = self.services.get(step.stage_name)
-            if not service:
-                raise ValueError(f"Unknown stage: {step.stage_name}")
+            invoke = self._get_invoker(step.stage_name)
             
             # Prepare the input for the stage
             stage_input = self._prepare_stage_input(step)
             
             # Execute the stage
-            if hasattr(service, 'process_async'):
-                stage_result = await service.process_async(stage_input)
-            else:
-                # Fallback to synchronous execution
-                stage_result = service.process(stage_input)
+            stage_result = await invoke(stage_input)
             
             execution_time = time.time() - start_time
             
-            return ExecutionResult(
+            result = ExecutionResult(
                 step_id=step.step_id,
                 success=True,
                 result=stage_result,
@@ -288,13 +430,47 @@ class TurbulanceOrchestrator:
             execution_time = time.time() - start_time
             logger.error(f"Step execution failed: {step.step_id} - {str(e)}")
             
-            return ExecutionResult(
+            result = ExecutionResult(
                 step_id=step.step_id,
                 success=False,
                 result={},
                 execution_time=execution_time,
                 error_message=str(e)
             )
+        
+        if on_result is not None:
+            on_result(result)
+        return result
+    
+    def _get_invoker(self, stage_name: str) -> Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]:
+        """Get the awaitable entry point for a stage's service, probing each service only once"""
+        service = self.services.get(stage_name)
+        if not service:
+            raise ValueError(f"Unknown stage: {stage_name}")
+        
+        # Re-probe only if the service registered for the stage was replaced
+        cached = self._invokers.get(stage_name)
+        if cached is not None and cached[0] is service:
+            return cached[1]
+        
+        if hasattr(service, 'process_async'):
+            invoke = service.process_async
+        elif not hasattr(service, 'process'):
+            raise ValueError(f"Service for stage {stage_name} has no process or process_async method")
+        elif asyncio.iscoroutinefunction(service.process):
+            invoke = service.process
+        else:
+            # Fallback to synchronous execution, off the event loop so
+            # other steps keep running
+            invoke = functools.partial(self._run_sync_service, service)
+        
+        self._invokers[stage_name] = (service, invoke)
+        return invoke
+    
+    async def _run_sync_service(self, service: Any, stage_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a synchronous service in a worker thread so it does not block the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), service.process, stage_input)
     
     def _prepare_stage_input(self, step: ExecutionStep) -> Dict[str, Any]:
         """Prepare input for a pipeline stage"""
@@ -329,18 +505,13 @@ class TurbulanceOrchestrator:
     
     def _update_execution_stats(self, success: bool, execution_time: float):
         """Update execution statistics"""
-        self.execution_stats["total_protocols"] += 1
-        
-        if success:
-            self.execution_stats["successful_protocols"] += 1
-        else:
-            self.execution_stats["failed_protocols"] += 1
+        stats = self.execution_stats
+        stats["total_protocols"] = total = stats["total_protocols"] + 1
+        stats["successful_protocols" if success else "failed_protocols"] += 1
         
         # Update average execution time
-        total = self.execution_stats["total_protocols"]
-        current_avg = self.execution_stats["average_execution_time"]
-        self.execution_stats["average_execution_time"] = (
-            (current_avg * (total - 1) + execution_time) / total
+        stats["average_execution_time"] = (
+            (stats["average_execution_time"] * (total - 1) + execution_time) / total
         )
     
     def get_execution_stats(self) -> Dict[str, Any]:
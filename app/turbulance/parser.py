@@ -13,15 +13,144 @@ It also generates the three auxiliary files:
 - .hre files (metacognitive decision memory)
 """
 
+import copy
+import io
 import re
+import sys
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+def _dumps_indented(data: Any) -> str:
+    """Serialize auxiliary file data as 2-space indented JSON"""
+    return json.dumps(data, indent=2)
+
+def _dump_indented(data: Any, path: str) -> None:
+    """Write auxiliary file data to ``path`` in the same format as _dumps_indented"""
+    # json.dump streams encoder chunks to the file instead of joining them first
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Leading keywords of the import, condition and loop line forms
+_KEYWORD_PREFIXES = ('from', 'if', 'for')
+
+# _parse_line result for lines that match no form
+_NO_NODE = (None, None)
+
+# Scalar parameter values recognised without going through json.loads
+_INT_RE = re.compile(r'-?(?:0|[1-9][0-9]*)\Z')
+_FLOAT_RE = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?\Z')
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_]\w*\Z')
+_JSON_CONSTANTS = {
+    'true': True, 'false': False, 'null': None,
+    'NaN': float('nan'), 'Infinity': float('inf'),
+}
+
+_OPENERS = frozenset('([{')
+_CLOSERS = frozenset(')]}')
+
+def _split_top_level(text: str, sep: str = ','):
+    """Yield the pieces of ``text`` separated by ``sep`` outside brackets and quotes.
+
+    Unlike ``str.split``, separators nested inside (), [], {} or a quoted
+    string are kept, so ``a=[1, 2], b="x,y"`` yields two pieces.
+    """
+    depth = 0
+    quote = None
+    escaped = False
+    start = 0
+    for i, c in enumerate(text):
+        if quote:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == quote:
+                quote = None
+        elif c == '"' or c == "'":
+            quote = c
+        elif c in _OPENERS:
+            depth += 1
+        elif c in _CLOSERS:
+            if depth:
+                depth -= 1
+        elif c == sep and not depth:
+            yield text[start:i]
+            start = i + 1
+    yield text[start:]
+
+def _parse_parameter_value(value: str) -> Any:
+    """Parse a parameter value as JSON, falling back to the raw (unquoted) string.
+
+    Bare identifiers and plain numbers are by far the most common values, so
+    they are decoded directly instead of raising and catching JSONDecodeError.
+    """
+    if _IDENTIFIER_RE.match(value):
+        return _JSON_CONSTANTS.get(value, value)
+    if _INT_RE.match(value):
+        return int(value)
+    if _FLOAT_RE.match(value):
+        return float(value)
+    if value.startswith("'") and value.endswith("'"):
+        return value[1:-1]
+    
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        # Remove quotes if present
+        if value.startswith('"') and value.endswith('"'):
+            return value[1:-1]
+        return value
+
+# Consciousness level of each pipeline stage in the .fs network graph
+_CONSCIOUSNESS_LEVELS = MappingProxyType({
+    "query_processor": 0.8,
+    "context_analyzer": 0.7,
+    "domain_expert": 0.9,
+    "evidence_synthesizer": 0.85,
+    "uncertainty_quantifier": 0.6,
+    "result_interpreter": 0.75,
+    "quality_assessor": 0.7,
+    "response_generator": 0.8
+})
+
+# Default resource estimates per pipeline stage for the .ghd plan. The inner
+# dicts are embedded as-is in the generated data and must not be mutated.
+_RESOURCE_ESTIMATES = MappingProxyType({
+    "query_processor": {"cpu": 1, "memory": 2, "gpu": 0},
+    "context_analyzer": {"cpu": 2, "memory": 4, "gpu": 0},
+    "domain_expert": {"cpu": 4, "memory": 8, "gpu": 1},
+    "evidence_synthesizer": {"cpu": 3, "memory": 6, "gpu": 0},
+    "uncertainty_quantifier": {"cpu": 2, "memory": 4, "gpu": 0},
+    "result_interpreter": {"cpu": 2, "memory": 4, "gpu": 0},
+    "quality_assessor": {"cpu": 1, "memory": 2, "gpu": 0},
+    "response_generator": {"cpu": 2, "memory": 4, "gpu": 0}
+})
+_DEFAULT_RESOURCE_ESTIMATE = {"cpu": 1, "memory": 2, "gpu": 0}
+
+# Per-stage .hre strategy skeletons; entries are shallow copies with "stage"
+# filled in, so the shared nested values must not be mutated.
+_HRE_MONITORING_TEMPLATE = {
+    "stage": None,
+    "metrics": ("execution_time", "quality_score", "confidence_level"),
+    "thresholds": {"min_quality": 0.7, "max_time": 60.0}
+}
+_HRE_CONTROL_TEMPLATE = {
+    "stage": None,
+    "controls": ("adaptive_timeout", "quality_gating", "resource_throttling")
+}
+
 class TurbulanceNodeType(Enum):
     """Types of nodes in a Turbulance script"""
     PIPELINE_CALL = "pipeline_call"
@@ -32,7 +161,7 @@ class TurbulanceNodeType(Enum):
     COMMENT = "comment"
     IMPORT = "import"
 
-@dataclass
+@dataclass(**_SLOTS)
 class TurbulanceNode:
     """Represents a parsed node in a Turbulance script"""
     node_type: TurbulanceNodeType
@@ -42,7 +171,7 @@ class TurbulanceNode:
     dependencies: List[str] = field(default_factory=list)
     outputs: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_SLOTS)
 class TurbulanceScript:
     """Represents a complete parsed Turbulance script"""
     protocol_name: str
@@ -56,58 +185,88 @@ class TurbulanceParser:
     """Parser for Turbulance DSL scripts"""
     
     def __init__(self):
-        self.pipeline_stages = [
+        # Kept in pipeline order; consumers iterate it
+        self.pipeline_stages = list(map(sys.intern, (
             "query_processor", "context_analyzer", "domain_expert", 
             "evidence_synthesizer", "uncertainty_quantifier", 
             "result_interpreter", "quality_assessor", "response_generator"
-        ]
+        )))
         
-        # Regex patterns for parsing
-        self.patterns = {
-            'pipeline_call': re.compile(r'(\w+)\s*=\s*pipeline_stage\(\s*"([^"]+)"\s*,?\s*([^)]*)\)'),
-            'computation': re.compile(r'(\w+)\s*=\s*compute\(\s*([^)]+)\)'),
-            'variable': re.compile(r'(\w+)\s*=\s*(.+)'),
-            'condition': re.compile(r'if\s+(.+):'),
-            'loop': re.compile(r'for\s+(\w+)\s+in\s+(.+):'),
-            'comment': re.compile(r'#.*'),
-            'import': re.compile(r'from\s+(\w+)\s+import\s+(.+)')
+        # All non-comment line forms fused into one alternation, tried in priority
+        # order; the matching alternative is reported by ``lastgroup`` and its
+        # fields are captured through prefixed named subgroups. Comments are
+        # recognised with startswith('#') before any regex runs.
+        line_patterns = (
+            ('import', r'from\s+(?P<import_module>\w+)\s+import\s+(?P<import_names>.+)\Z'),
+            ('pipeline_call', r'(?P<pipeline_variable>\w+)\s*=\s*pipeline_stage\(\s*"(?P<pipeline_stage>[^"]+)"\s*,?\s*(?P<pipeline_params>[^)]*)\)'),
+            ('computation', r'(?P<computation_variable>\w+)\s*=\s*compute\(\s*(?P<computation_expr>[^)]+)\)'),
+            ('condition', r'if\s+(?P<condition_expr>.+):'),
+            ('loop', r'for\s+(?P<loop_variable>\w+)\s+in\s+(?P<loop_iterable>.+):'),
+            ('variable', r'(?P<variable_name>\w+)\s*=\s*(?P<variable_value>.+)\Z'),
+        )
+        self._re_line = re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in line_patterns))
+        # Plain assignments are the common case and skip the fused pattern
+        self._re_variable = re.compile(dict(line_patterns)['variable'])
+        # Templated scripts repeat the same parameter strings across calls
+        self._parse_parameter_items = lru_cache(maxsize=512)(self._decode_parameters)
+        self._node_builders = {
+            'import': self._build_import_node,
+            'pipeline_call': self._build_pipeline_node,
+            'computation': self._build_computation_node,
+            'condition': self._build_condition_node,
+            'loop': self._build_loop_node,
+            'variable': self._build_variable_node,
         }
     
     def parse_script(self, script_content: str, protocol_name: str = "research_protocol") -> TurbulanceScript:
         """Parse a complete Turbulance script"""
         logger.info(f"Parsing Turbulance script: {protocol_name}")
         
-        lines = script_content.strip().split('\n')
         nodes = []
         variables = {}
         pipeline_calls = []
         computations = []
         dependencies = {}
+        parse_line = self._parse_line
+        append_node = nodes.append
+        
+        def track_pipeline_call(node: TurbulanceNode) -> None:
+            pipeline_calls.append(node)
+            # Extract dependencies
+            stage_name = node.parsed_data.get('stage')
+            dependencies[node.parsed_data.get('variable', f'stage_{node.line_number}')] = [stage_name]
         
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
+        def track_variable(node: TurbulanceNode) -> None:
+            var_name = node.parsed_data.get('variable')
+            var_value = node.parsed_data.get('value')
+            if var_name:
+                variables[var_name] = var_value
+        
+        # Track different types of nodes, keyed by the line form _parse_line matched
+        trackers = {
+            'pipeline_call': track_pipeline_call,
+            'computation': computations.append,
+            'variable': track_variable,
+        }
+        
+        # Stream lines instead of materialising a list of them. Numbering starts
+        # at the first non-blank line, as it did when the script was stripped
+        # before splitting.
+        line_num = 0
+        for raw_line in io.StringIO(script_content):
+            line = raw_line.strip()
             if not line:
+                if line_num:
+                    line_num += 1
                 continue
-                
-            node = self._parse_line(line, line_num)
+            line_num += 1
+            
+            node, kind = parse_line(line, line_num)
             if node:
-                nodes.append(node)
-                
-                # Track different types of nodes
-                if node.node_type == TurbulanceNodeType.PIPELINE_CALL:
-                    pipeline_calls.append(node)
-                    # Extract dependencies
-                    stage_name = node.parsed_data.get('stage')
-                    dependencies[node.parsed_data.get('variable', f'stage_{line_num}')] = [stage_name]
-                    
-                elif node.node_type == TurbulanceNodeType.COMPUTATION:
-                    computations.append(node)
-                    
-                elif node.node_type == TurbulanceNodeType.VARIABLE_ASSIGNMENT:
-                    var_name = node.parsed_data.get('variable')
-                    var_value = node.parsed_data.get('value')
-                    if var_name:
-                        variables[var_name] = var_value
+                append_node(node)
+                track = trackers.get(kind)
+                if track is not None:
+                    track(node)
         
         script = TurbulanceScript(
             protocol_name=protocol_name,
@@ -120,152 +279,164 @@ class TurbulanceParser:
         
         return script
     
-    def _parse_line(self, line: str, line_num: int) -> Optional[TurbulanceNode]:
-        """Parse a single line of Turbulance script"""
-        
-        # Check for comments
-        if self.patterns['comment'].match(line):
-            return TurbulanceNode(
-                node_type=TurbulanceNodeType.COMMENT,
-                line_number=line_num,
-                content=line,
-                parsed_data={'text': line[1:].strip()}
-            )
-        
-        # Check for imports
-        import_match = self.patterns['import'].match(line)
-        if import_match:
-            return TurbulanceNode(
-                node_type=TurbulanceNodeType.IMPORT,
-                line_number=line_num,
-                content=line,
-                parsed_data={
-                    'module': import_match.group(1),
-                    'imports': import_match.group(2).strip()
-                }
-            )
-        
-        # Check for pipeline calls
-        pipeline_match = self.patterns['pipeline_call'].match(line)
-        if pipeline_match:
-            variable = pipeline_match.group(1)
-            stage = pipeline_match.group(2)
-            params_str = pipeline_match.group(3).strip() if pipeline_match.group(3) else ""
-            
-            # Parse parameters
-            params = self._parse_parameters(params_str)
-            
-            return TurbulanceNode(
-                node_type=TurbulanceNodeType.PIPELINE_CALL,
-                line_number=line_num,
-                content=line,
-                parsed_data={
-                    'variable': variable,
-                    'stage': stage,
-                    'parameters': params
-                },
-                outputs=[variable]
-            )
-        
-        # Check for computations
-        compute_match = self.patterns['computation'].match(line)
-        if compute_match:
-            variable = compute_match.group(1)
-            computation_str = compute_match.group(2).strip()
-            
-            return TurbulanceNode(
-                node_type=TurbulanceNodeType.COMPUTATION,
-                line_number=line_num,
-                content=line,
-                parsed_data={
-                    'variable': variable,
-                    'computation': computation_str
-                },
-                outputs=[variable]
-            )
-        
-        # Check for conditions
-        condition_match = self.patterns['condition'].match(line)
-        if condition_match:
-            return TurbulanceNode(
-                node_type=TurbulanceNodeType.CONDITION,
-                line_number=line_num,
-                content=line,
-                parsed_data={'condition': condition_match.group(1)}
-            )
-        
-        # Check for loops
-        loop_match = self.patterns['loop'].match(line)
-        if loop_match:
-            return TurbulanceNode(
-                node_type=TurbulanceNodeType.LOOP,
-                line_number=line_num,
-                content=line,
-                parsed_data={
-                    'variable': loop_match.group(1),
-                    'iterable': loop_match.group(2)
-                }
-            )
-        
-        # Check for variable assignments
-        var_match = self.patterns['variable'].match(line)
-        if var_match:
-            return TurbulanceNode(
-                node_type=TurbulanceNodeType.VARIABLE_ASSIGNMENT,
-                line_number=line_num,
-                content=line,
-                parsed_data={
-                    'variable': var_match.group(1),
-                    'value': var_match.group(2).strip()
-                },
-                outputs=[var_match.group(1)]
-            )
-        
-        return None
+    def _parse_line(self, line: str, line_num: int) -> Tuple[Optional[TurbulanceNode], Optional[str]]:
+        """Parse a single line of Turbulance script
+        
+        Returns:
+            The parsed node (or None) and the name of the line form it matched
+        """
+        if not line:
+            return _NO_NODE
+        if line[0] == '#':
+            return self._build_comment_node(line, line_num), 'comment'
+        
+        # Only pipeline calls, computations and assignments contain '=', and
+        # only imports, conditions and loops start with a keyword, so cheap
+        # substring checks decide which patterns can possibly match.
+        keyword = line.startswith(_KEYWORD_PREFIXES)
+        if '=' not in line:
+            if not keyword:
+                return _NO_NODE
+        elif not keyword and 'pipeline_stage(' not in line and 'compute(' not in line:
+            match = self._re_variable.match(line)
+            if match is None:
+                return _NO_NODE
+            return self._build_variable_node(match, line, line_num), 'variable'
+        
+        match = self._re_line.match(line)
+        if match is None:
+            return _NO_NODE
+        kind = match.lastgroup
+        return self._node_builders[kind](match, line, line_num), kind
+    
+    def _build_comment_node(self, line: str, line_num: int) -> TurbulanceNode:
+        return TurbulanceNode(
+            node_type=TurbulanceNodeType.COMMENT,
+            line_number=line_num,
+            content=line,
+            parsed_data={'text': line[1:].strip()}
+        )
+    
+    def _build_import_node(self, match: re.Match, line: str, line_num: int) -> TurbulanceNode:
+        return TurbulanceNode(
+            node_type=TurbulanceNodeType.IMPORT,
+            line_number=line_num,
+            content=line,
+            parsed_data={
+                'module': match.group('import_module'),
+                'imports': match.group('import_names').strip()
+            }
+        )
+    
+    def _build_pipeline_node(self, match: re.Match, line: str, line_num: int) -> TurbulanceNode:
+        # Stage and variable names are repeated across nodes, dependency maps
+        # and the stage lookup tables; interning lets those lookups short-circuit
+        # on identity and lets every node share one string object.
+        variable = sys.intern(match.group('pipeline_variable'))
+        params_str = match.group('pipeline_params').strip()
+        
+        return TurbulanceNode(
+            node_type=TurbulanceNodeType.PIPELINE_CALL,
+            line_number=line_num,
+            content=line,
+            parsed_data={
+                'variable': variable,
+                'stage': sys.intern(match.group('pipeline_stage')),
+                'parameters': self._parse_parameters(params_str)
+            },
+            outputs=[variable]
+        )
+    
+    def _build_computation_node(self, match: re.Match, line: str, line_num: int) -> TurbulanceNode:
+        variable = match.group('computation_variable')
+        
+        return TurbulanceNode(
+            node_type=TurbulanceNodeType.COMPUTATION,
+            line_number=line_num,
+            content=line,
+            parsed_data={
+                'variable': variable,
+                'computation': match.group('computation_expr').strip()
+            },
+            outputs=[variable]
+        )
+    
+    def _build_condition_node(self, match: re.Match, line: str, line_num: int) -> TurbulanceNode:
+        return TurbulanceNode(
+            node_type=TurbulanceNodeType.CONDITION,
+            line_number=line_num,
+            content=line,
+            parsed_data={'condition': match.group('condition_expr')}
+        )
+    
+    def _build_loop_node(self, match: re.Match, line: str, line_num: int) -> TurbulanceNode:
+        return TurbulanceNode(
+            node_type=TurbulanceNodeType.LOOP,
+            line_number=line_num,
+            content=line,
+            parsed_data={
+                'variable': match.group('loop_variable'),
+                'iterable': match.group('loop_iterable')
+            }
+        )
+    
+    def _build_variable_node(self, match: re.Match, line: str, line_num: int) -> TurbulanceNode:
+        variable = match.group('variable_name')
+        
+        return TurbulanceNode(
+            node_type=TurbulanceNodeType.VARIABLE_ASSIGNMENT,
+            line_number=line_num,
+            content=line,
+            parsed_data={
+                'variable': variable,
+                'value': match.group('variable_value').strip()
+            },
+            outputs=[variable]
+        )
     
     def _parse_parameters(self, params_str: str) -> Dict[str, Any]:
         """Parse parameter string from pipeline calls"""
         if not params_str:
             return {}
         
+        items, has_containers = self._parse_parameter_items(params_str)
+        params = dict(items)
+        # List and dict values are shared with the cache; hand out private copies
+        return copy.deepcopy(params) if has_containers else params
+    
+    def _decode_parameters(self, params_str: str) -> Tuple[Tuple[Tuple[str, Any], ...], bool]:
+        """Decode a parameter string into frozen (key, value) pairs
+        
+        Returns:
+            The pairs, and whether any value is a mutable list or dict
+        """
         params = {}
         # Simple parameter parsing - can be enhanced
         try:
-            # Remove leading/trailing whitespace and split by commas
-            param_pairs = [p.strip() for p in params_str.split(',') if p.strip()]
+            # Split on top-level commas so list, dict and quoted values stay whole
+            param_pairs = [p.strip() for p in _split_top_level(params_str) if p.strip()]
             
             for pair in param_pairs:
                 if '=' in pair:
                     key, value = pair.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Try to parse as JSON for complex values
-                    try:
-                        params[key] = json.loads(value)
-                    except json.JSONDecodeError:
-                        # Remove quotes if present
-                        if value.startswith('"') and value.endswith('"'):
-                            value = value[1:-1]
-                        elif value.startswith("'") and value.endswith("'"):
-                            value = value[1:-1]
-                        params[key] = value
+                    params[key.strip()] = _parse_parameter_value(value.strip())
         except Exception as e:
             logger.warning(f"Error parsing parameters '{params_str}': {e}")
         
-        return params
+        has_containers = any(isinstance(value, (list, dict)) for value in params.values())
+        return tuple(params.items()), has_containers
     
     def generate_auxiliary_files(self, script: TurbulanceScript) -> Dict[str, str]:
         """Generate the three auxiliary files for a Turbulance script"""
         
         # Generate .fs file (network graph consciousness state)
-        fs_content = self._generate_fs_file(script)
+        fs_content = _dumps_indented(self._build_fs_data(script))
         
         # Generate .ghd file (resource orchestration dependencies)
-        ghd_content = self._generate_ghd_file(script)
+        ghd_content = _dumps_indented(self._build_ghd_data(script))
         
         # Generate .hre file (metacognitive decision memory)
-        hre_content = self._generate_hre_file(script)
+        hre_content = _dumps_indented(self._build_hre_data(script))
         
         return {
             'fs': fs_content,
@@ -273,8 +444,19 @@ class TurbulanceParser:
             'hre': hre_content
         }
     
-    def _generate_fs_file(self, script: TurbulanceScript) -> str:
-        """Generate .fs file (network graph consciousness state)"""
+    def generate_auxiliary_files_to_paths(self, script: TurbulanceScript, fs_path: str,
+                                          ghd_path: str, hre_path: str) -> None:
+        """Write the three auxiliary files for a Turbulance script straight to disk
+        
+        Unlike generate_auxiliary_files, no intermediate str is built for each
+        file, which keeps peak memory down for protocols with many stages.
+        """
+        _dump_indented(self._build_fs_data(script), fs_path)
+        _dump_indented(self._build_ghd_data(script), ghd_path)
+        _dump_indented(self._build_hre_data(script), hre_path)
+    
+    def _build_fs_data(self, script: TurbulanceScript) -> Dict[str, Any]:
+        """Build .fs file data (network graph consciousness state)"""
         fs_data = {
             "protocol_name": script.protocol_name,
             "network_topology": {
@@ -290,46 +472,38 @@ class TurbulanceParser:
             }
         }
         
+        topology = fs_data["network_topology"]
+        consciousness_levels = topology["consciousness_levels"]
+        
         # Add nodes for each pipeline call
-        for call in script.pipeline_calls:
+        pipeline_calls = script.pipeline_calls
+        nodes = topology["nodes"] = [None] * len(pipeline_calls)
+        for i, call in enumerate(pipeline_calls):
             node_id = call.parsed_data.get('variable', f'node_{call.line_number}')
             stage = call.parsed_data.get('stage', 'unknown')
             
-            fs_data["network_topology"]["nodes"].append({
+            nodes[i] = {
                 "id": node_id,
                 "type": "pipeline_stage",
                 "stage": stage,
                 "line": call.line_number,
                 "parameters": call.parsed_data.get('parameters', {})
-            })
+            }
             
             # Set consciousness level based on stage
-            consciousness_map = {
-                "query_processor": 0.8,
-                "context_analyzer": 0.7,
-                "domain_expert": 0.9,
-                "evidence_synthesizer": 0.85,
-                "uncertainty_quantifier": 0.6,
-                "result_interpreter": 0.75,
-                "quality_assessor": 0.7,
-                "response_generator": 0.8
-            }
-            fs_data["network_topology"]["consciousness_levels"][node_id] = consciousness_map.get(stage, 0.5)
+            consciousness_levels[node_id] = _CONSCIOUSNESS_LEVELS.get(stage, 0.5)
         
         # Add edges based on dependencies
-        for var, deps in script.dependencies.items():
-            for dep in deps:
-                fs_data["network_topology"]["edges"].append({
-                    "from": dep,
-                    "to": var,
-                    "weight": 1.0,
-                    "type": "data_flow"
-                })
-        
-        return json.dumps(fs_data, indent=2)
+        topology["edges"] = [
+            {"from": dep, "to": var, "weight": 1.0, "type": "data_flow"}
+            for var, deps in script.dependencies.items()
+            for dep in deps
+        ]
+        
+        return fs_data
     
-    def _generate_ghd_file(self, script: TurbulanceScript) -> str:
-        """Generate .ghd file (resource orchestration dependencies)"""
+    def _build_ghd_data(self, script: TurbulanceScript) -> Dict[str, Any]:
+        """Build .ghd file data (resource orchestration dependencies)"""
         ghd_data = {
             "protocol_name": script.protocol_name,
             "resource_requirements": {
@@ -352,41 +526,36 @@ class TurbulanceParser:
             }
         }
         
+        allocation = ghd_data["resource_allocation"]
+        cpu_cores = allocation["cpu_cores"]
+        memory_gb = allocation["memory_gb"]
+        gpu_units = allocation["gpu_units"]
+        
         # Estimate resource requirements for each stage
-        for call in script.pipeline_calls:
+        pipeline_calls = script.pipeline_calls
+        stages = ghd_data["orchestration_plan"]["stages"] = [None] * len(pipeline_calls)
+        for i, call in enumerate(pipeline_calls):
             stage = call.parsed_data.get('stage', 'unknown')
             var_name = call.parsed_data.get('variable', f'stage_{call.line_number}')
             
-            # Default resource estimates
-            resource_estimates = {
-                "query_processor": {"cpu": 1, "memory": 2, "gpu": 0},
-                "context_analyzer": {"cpu": 2, "memory": 4, "gpu": 0},
-                "domain_expert": {"cpu": 4, "memory": 8, "gpu": 1},
-                "evidence_synthesizer": {"cpu": 3, "memory": 6, "gpu": 0},
-                "uncertainty_quantifier": {"cpu": 2, "memory": 4, "gpu": 0},
-                "result_interpreter": {"cpu": 2, "memory": 4, "gpu": 0},
-                "quality_assessor": {"cpu": 1, "memory": 2, "gpu": 0},
-                "response_generator": {"cpu": 2, "memory": 4, "gpu": 0}
-            }
+            estimates = _RESOURCE_ESTIMATES.get(stage, _DEFAULT_RESOURCE_ESTIMATE)
             
-            estimates = resource_estimates.get(stage, {"cpu": 1, "memory": 2, "gpu": 0})
-            
-            ghd_data["orchestration_plan"]["stages"].append({
+            stages[i] = {
                 "stage": stage,
                 "variable": var_name,
                 "line": call.line_number,
                 "estimated_duration": 30.0,  # seconds
                 "resource_requirements": estimates
-            })
+            }
             
-            ghd_data["resource_allocation"]["cpu_cores"][var_name] = estimates["cpu"]
-            ghd_data["resource_allocation"]["memory_gb"][var_name] = estimates["memory"]
-            ghd_data["resource_allocation"]["gpu_units"][var_name] = estimates["gpu"]
+            cpu_cores[var_name] = estimates["cpu"]
+            memory_gb[var_name] = estimates["memory"]
+            gpu_units[var_name] = estimates["gpu"]
         
-        return json.dumps(ghd_data, indent=2)
+        return ghd_data
     
-    def _generate_hre_file(self, script: TurbulanceScript) -> str:
-        """Generate .hre file (metacognitive decision memory)"""
+    def _build_hre_data(self, script: TurbulanceScript) -> Dict[str, Any]:
+        """Build .hre file data (metacognitive decision memory)"""
         hre_data = {
             "protocol_name": script.protocol_name,
             "decision_tree": {
@@ -411,13 +580,19 @@ class TurbulanceParser:
             }
         }
         
+        decision_nodes = hre_data["decision_tree"]["nodes"]
+        strategies = hre_data["metacognitive_strategies"]
+        
         # Build decision tree from script structure
-        for i, call in enumerate(script.pipeline_calls):
+        pipeline_calls = script.pipeline_calls
+        monitoring = strategies["monitoring"] = [None] * len(pipeline_calls)
+        control = strategies["control"] = [None] * len(pipeline_calls)
+        for i, call in enumerate(pipeline_calls):
             stage = call.parsed_data.get('stage', 'unknown')
             var_name = call.parsed_data.get('variable', f'stage_{call.line_number}')
             
             node_id = f"decision_{i}"
-            hre_data["decision_tree"]["nodes"][node_id] = {
+            decision_nodes[node_id] = {
                 "stage": stage,
                 "variable": var_name,
                 "decision_type": "pipeline_execution",
@@ -426,19 +601,14 @@ class TurbulanceParser:
             }
             
             # Add metacognitive strategies
-            hre_data["metacognitive_strategies"]["monitoring"].append({
-                "stage": stage,
-                "metrics": ["execution_time", "quality_score", "confidence_level"],
-                "thresholds": {"min_quality": 0.7, "max_time": 60.0}
-            })
+            monitoring[i] = entry = _HRE_MONITORING_TEMPLATE.copy()
+            entry["stage"] = stage
             
-            hre_data["metacognitive_strategies"]["control"].append({
-                "stage": stage,
-                "controls": ["adaptive_timeout", "quality_gating", "resource_throttling"]
-            })
+            control[i] = entry = _HRE_CONTROL_TEMPLATE.copy()
+            entry["stage"] = stage
         
         # Add planning strategies
-        hre_data["metacognitive_strategies"]["planning"] = [
+        strategies["planning"] = [
             {
                 "strategy": "sequential_execution",
                 "description": "Execute stages in order with dependency checking"
@@ -453,19 +623,56 @@ class TurbulanceParser:
             }
         ]
         
-        return json.dumps(hre_data, indent=2)
+        return hre_data
     
     def extract_pipeline_sequence(self, script: TurbulanceScript) -> List[Dict[str, Any]]:
         """Extract the sequence of pipeline stage calls for execution"""
-        sequence = []
+        sequence = [None] * len(script.pipeline_calls)
         
-        for call in script.pipeline_calls:
-            sequence.append({
-                'variable': call.parsed_data.get('variable'),
-                'stage': call.parsed_data.get('stage'),
-                'parameters': call.parsed_data.get('parameters', {}),
+        for i, call in enumerate(script.pipeline_calls):
+            parsed_data = call.parsed_data
+            sequence[i] = {
+                'variable': parsed_data.get('variable'),
+                'stage': parsed_data.get('stage'),
+                'parameters': parsed_data.get('parameters', {}),
                 'line_number': call.line_number,
                 'dependencies': call.dependencies
-            })
+            }
         
-        return sequence 
\ No newline at end of file
+        return sequence
+
+# Per-process parser for parse_scripts_batch workers, built by the pool initializer
+_worker_parser: Optional[TurbulanceParser] = None
+
+def _init_worker_parser() -> None:
+    global _worker_parser
+    _worker_parser = TurbulanceParser()
+
+def _parse_in_worker(item: Tuple[str, str]) -> TurbulanceScript:
+    script_content, protocol_name = item
+    return _worker_parser.parse_script(script_content, protocol_name)
+
+def parse_scripts_batch(items: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[TurbulanceScript]:
+    """Parse independent Turbulance scripts in parallel across processes.
+    
+    Parsing is CPU-bound regex work, so threads would serialize on the GIL;
+    each worker process builds one parser (and its compiled patterns) up front
+    and reuses it for every script it receives.
+    
+    Args:
+        items: (script_content, protocol_name) pairs
+        max_workers: Worker process count (defaults to the CPU count)
+        
+    Returns:
+        Parsed scripts in the same order as ``items``
+    """
+    items = list(items)
+    if len(items) < 2:
+        parser = TurbulanceParser()
+        return [parser.parse_script(content, name) for content, name in items]
+    
+    workers = max_workers or os.cpu_count() or 1
+    # A few chunks per worker amortises IPC without leaving one worker a long tail
+    chunksize = max(1, len(items) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_parser) as executor:
+        return list(executor.map(_parse_in_worker, items, chunksize=chunksize))
@@ -14,15 +14,23 @@ class TriangleBaseError(Exception):
         self.message = message
         self.error_code = error_code
         self.details = details or {}
+        self._cached_dict: Optional[Dict[str, Any]] = None
         super().__init__(self.message)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert the exception to a dictionary representation."""
-        return {
-            "error_code": self.error_code,
-            "message": self.message,
-            "details": self.details
-        }
+        """Convert the exception to a dictionary representation.
+        
+        The dictionary is built on first use and returned as-is afterwards, since
+        the same error is often serialized several times (logs, responses, traces).
+        Treat it as read-only.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "error_code": self.error_code,
+                "message": self.message,
+                "details": self.details
+            }
+        return self._cached_dict
 
 
 # Configuration errors
@@ -54,6 +62,14 @@ class StageExecutionError(PipelineError):
         super().__init__(message, "STAGE_EXECUTION_ERROR", stage_details)
 
 
+class CycleDetectedError(PipelineError):
+    """Raised when pipeline steps depend on each other in a cycle."""
+    def __init__(self, message: str, step_ids: List[str], details: Optional[Dict[str, Any]] = None):
+        cycle_details = details or {}
+        cycle_details["step_ids"] = step_ids
+        super().__init__(message, "CYCLE_DETECTED", cycle_details)
+
+
 # Data and validation errors
 class ValidationError(TriangleBaseError):
     """Raised when data validation fails."""
@@ -116,13 +132,18 @@ class ResourceNotFoundError(TriangleBaseError):
 
 # Utility functions for error handling
 def format_error_response(error: Exception) -> Dict[str, Any]:
-    """Format an exception into a consistent error response structure."""
-    if isinstance(error, TriangleBaseError):
-        return error.to_dict()
+    """Format an exception into a consistent error response structure.
+    
+    Any exception exposing ``to_dict`` (every TriangleBaseError does) is asked
+    to serialize itself; everything else is reported as a system error.
+    """
+    to_dict = getattr(error, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
     
     # Handle non-custom exceptions
     return {
         "error_code": "SYSTEM_ERROR",
         "message": str(error),
-        "details": {"exception_type": error.__class__.__name__}
+        "details": {"exception_type": type(error).__name__}
     } 
\ No newline at end of file
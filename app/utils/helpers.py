@@ -6,13 +6,45 @@ used throughout the system.
 """
 
 import time
+import json
 import logging
 import functools
 import asyncio
-from typing import Callable, Any, Dict, Optional
+from typing import Callable, Any, Dict, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON, using orjson when it is installed.
+    
+    orjson rejects a few documents the json module accepts (NaN/Infinity,
+    integers beyond 64 bits), so those are retried with json.loads. Invalid
+    JSON raises json.JSONDecodeError either way.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # Values orjson cannot encode (e.g. non-str keys, very large ints)
+            pass
+    return json.dumps(data).encode("utf-8")
+
 def timer_decorator(func):
     """
     Decorator to measure and log the execution time of a function.
@@ -25,31 +57,37 @@ def timer_decorator(func):
     Returns:
         Wrapped function that logs execution time
     """
-    @functools.wraps(func)
-    async def async_wrapper(*args, **kwargs):
-        start_time = time.time()
-        try:
-            result = await func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            logger.info(f"Function {func.__name__} executed in {execution_time:.4f} seconds")
+    name = func.__name__
+    
+    # Only build the wrapper that matches the function's kind
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_ns = time.perf_counter_ns()
+            try:
+                result = await func(*args, **kwargs)
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.info("Function %s executed in %.4f seconds", name, execution_time)
             
-            # If the result is a dict, add the execution time
-            if isinstance(result, dict):
-                result["execution_time"] = execution_time
+                # If the result is a dict, add the execution time
+                if isinstance(result, dict):
+                    result["execution_time"] = execution_time
                 
-            return result
-        except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(f"Function {func.__name__} failed after {execution_time:.4f} seconds: {str(e)}")
-            raise
-            
+                return result
+            except Exception as e:
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.error("Function %s failed after %.4f seconds: %s", name, execution_time, e)
+                raise
+        
+        return async_wrapper
+    
     @functools.wraps(func)
     def sync_wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            logger.info(f"Function {func.__name__} executed in {execution_time:.4f} seconds")
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+            logger.info("Function %s executed in %.4f seconds", name, execution_time)
             
             # If the result is a dict, add the execution time
             if isinstance(result, dict):
@@ -57,15 +95,11 @@ def timer_decorator(func):
                 
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(f"Function {func.__name__} failed after {execution_time:.4f} seconds: {str(e)}")
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+            logger.error("Function %s failed after %.4f seconds: %s", name, execution_time, e)
             raise
     
-    # Determine if the function is async or not
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper
-    else:
-        return sync_wrapper
+    return sync_wrapper
 
 def retry_decorator(
     max_attempts: int = 3, 
@@ -86,27 +120,32 @@ def retry_decorator(
         Decorator function
     """
     def decorator(func):
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            attempt = 0
-            current_delay = delay
-            last_exception = None
-            
-            while attempt < max_attempts:
-                try:
-                    return await func(*args, **kwargs)
-                except exceptions as e:
-                    attempt += 1
-                    last_exception = e
-                    
-                    if attempt >= max_attempts:
-                        logger.error(f"Function {func.__name__} failed after {max_attempts} attempts: {str(e)}")
-                        raise
+        name = func.__name__
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                attempt = 0
+                current_delay = delay
+                last_exception = None
+                
+                while attempt < max_attempts:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        attempt += 1
+                        last_exception = e
                         
-                    logger.warning(f"Retry {attempt}/{max_attempts} for {func.__name__} after error: {str(e)}")
-                    await asyncio.sleep(current_delay)
-                    current_delay *= backoff
-                    
+                        if attempt >= max_attempts:
+                            logger.error("Function %s failed after %d attempts: %s", name, max_attempts, e)
+                            raise
+                            
+                        logger.warning("Retry %d/%d for %s after error: %s", attempt, max_attempts, name, e)
+                        await asyncio.sleep(current_delay)
+                        current_delay *= backoff
+            
+            return async_wrapper
+        
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
             attempt = 0
@@ -121,17 +160,14 @@ def retry_decorator(
                     last_exception = e
                     
                     if attempt >= max_attempts:
-                        logger.error(f"Function {func.__name__} failed after {max_attempts} attempts: {str(e)}")
+                        logger.error("Function %s failed after %d attempts: %s", name, max_attempts, e)
                         raise
                         
-                    logger.warning(f"Retry {attempt}/{max_attempts} for {func.__name__} after error: {str(e)}")
+                    logger.warning("Retry %d/%d for %s after error: %s", attempt, max_attempts, name, e)
                     time.sleep(current_delay)
                     current_delay *= backoff
         
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
             
     return decorator
 
@@ -139,8 +175,9 @@ def memoize(func):
     """
     Decorator to cache function results.
     
-    Simple in-memory cache for function results based on arguments.
-    Note: This is a simple implementation and doesn't handle complex types.
+    Bounded LRU cache (1024 entries) keyed on the call arguments, which must
+    therefore be hashable. The wrapped function exposes ``cache_info()`` and
+    ``cache_clear()``.
     
     Args:
         func: The function to be decorated
@@ -148,21 +185,7 @@ def memoize(func):
     Returns:
         Wrapped function with caching
     """
-    cache = {}
-    
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        # Create a key based on the function arguments
-        key_args = str(args)
-        key_kwargs = str(sorted(kwargs.items()))
-        key = f"{key_args}:{key_kwargs}"
-        
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
-            
-        return cache[key]
-        
-    return wrapper
+    return functools.lru_cache(maxsize=1024)(func)
 
 def validate_parameters(required_params: list, optional_params: Optional[list] = None):
     """
@@ -178,28 +201,35 @@ def validate_parameters(required_params: list, optional_params: Optional[list] =
     optional_params = optional_params or []
     
     def decorator(func):
+        # Everything derived from the signature is fixed once decorated
+        func_code = func.__code__
+        func_args = func_code.co_varnames[:func_code.co_argcount]
+        
+        # Skip 'self' or 'cls' for methods
+        start_idx = 0
+        if func_args and func_args[0] in ('self', 'cls'):
+            start_idx = 1
+        
+        # Required parameters with the positional count that supplies them
+        # (None when they can only be passed by keyword)
+        required_positions = tuple(
+            (param, func_args.index(param) - start_idx if param in func_args else None)
+            for param in required_params
+        )
+        allowed_params = frozenset(required_params) | frozenset(optional_params)
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Get the parameter names in the function signature
-            func_args = func.__code__.co_varnames[:func.__code__.co_argcount]
-            
-            # Skip 'self' or 'cls' for methods
-            start_idx = 0
-            if func_args and func_args[0] in ('self', 'cls'):
-                start_idx = 1
-                
             # Check that all required parameters are provided
-            for param in required_params:
-                if param not in kwargs:
-                    arg_idx = func_args.index(param) if param in func_args else -1
-                    if arg_idx < 0 or arg_idx >= len(args) + start_idx:
-                        raise ValueError(f"Missing required parameter: {param}")
+            for param, position in required_positions:
+                if param not in kwargs and (position is None or position >= len(args)):
+                    raise ValueError(f"Missing required parameter: {param}")
                         
             # Check that all provided parameters are either required or optional
-            allowed_params = required_params + optional_params
-            for param in kwargs:
-                if param not in allowed_params:
-                    raise ValueError(f"Unknown parameter: {param}")
+            if not allowed_params.issuperset(kwargs):
+                for param in kwargs:
+                    if param not in allowed_params:
+                        raise ValueError(f"Unknown parameter: {param}")
                     
             return func(*args, **kwargs)
             
@@ -5,14 +5,91 @@ This module provides a standardized interface for interacting with
 various language model providers used throughout the system.
 """
 
+import asyncio
+import functools
 import logging
 import os
-from typing import Dict, Any, List, Optional, Union
+import re
+import weakref
+from typing import Dict, Any, List, Optional, Tuple, Union
 import aiohttp
 import json
 
+from app.utils.helpers import json_dumps_bytes, json_loads
+
 logger = logging.getLogger(__name__)
 
+# Characters that matter when delimiting a JSON object inside free text
+_JSON_DELIMITERS_RE = re.compile(r'[{}"\\]')
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} object embedded in text, or None.
+    
+    Braces inside JSON strings (including escaped quotes) are ignored, and the
+    scan jumps between delimiter characters instead of visiting every one.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped_at = -1
+    for match in _JSON_DELIMITERS_RE.finditer(text, start):
+        i = match.start()
+        if i == escaped_at:
+            continue
+        c = text[i]
+        if in_string:
+            if c == "\\":
+                escaped_at = i + 1
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+@functools.lru_cache(maxsize=128)
+def _classify_prompt_prefix(categories: Tuple[str, ...]) -> str:
+    """Classification prompt up to the text being classified, per category set."""
+    return f"""
+        Classify the following text into one of these categories:
+        {', '.join(categories)}
+        
+        Text: """
+
+@functools.lru_cache(maxsize=128)
+def _extract_prompt_prefix(entity_types: Tuple[str, ...]) -> str:
+    """Entity extraction prompt up to the text being analysed, per entity type set."""
+    return f"""
+        Extract the following entity types from the text:
+        {', '.join(entity_types)}
+        
+        Text: """
+
+@functools.lru_cache(maxsize=128)
+def _lowered_categories(categories: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """(category, lowercased category) pairs for case-insensitive matching."""
+    return tuple((category, category.lower()) for category in categories)
+
+# Request body is pre-encoded bytes, so state its type explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Clients that may hold an open HTTP session, closed together on app shutdown
+_open_clients: "weakref.WeakSet[LLMClient]" = weakref.WeakSet()
+
+async def close_llm_clients() -> None:
+    """Close the HTTP sessions of every LLMClient that opened one."""
+    for client in list(_open_clients):
+        await client.close()
+
 class LLMClient:
     """
     Client for making requests to language model APIs.
@@ -32,7 +109,42 @@ class LLMClient:
         self.api_key = api_key or os.environ.get("LLM_API_KEY")
         self.model = model
         self.base_url = os.environ.get("LLM_API_URL", "https://api.example.com/v1")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
         logger.info(f"LLMClient initialized with model: {model}")
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the client's pooled HTTP session, creating it on first use.
+        
+        Reusing one session keeps TCP/TLS connections to the provider alive
+        across calls. Sessions are bound to an event loop, so a new one is
+        opened if the client is used from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._session
+        if session is None or session.closed or self._session_loop is not loop:
+            if session is not None and not session.closed:
+                logger.debug("LLMClient used from a new event loop; opening a new session")
+            session = aiohttp.ClientSession(
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.api_key}"
+                },
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+            self._session = session
+            self._session_loop = loop
+            _open_clients.add(self)
+        return session
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP session, if one is open."""
+        session, self._session = self._session, None
+        self._session_loop = None
+        _open_clients.discard(self)
+        if session is not None and not session.closed:
+            await session.close()
         
     async def generate_text(
         self, 
@@ -69,33 +181,29 @@ class LLMClient:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.api_key}"
-                }
-                
-                async with session.post(
-                    f"{self.base_url}/completions", 
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"LLM API error: {response.status} - {error_text}")
-                        return {
-                            "error": True,
-                            "message": f"LLM API returned status {response.status}",
-                            "details": error_text
-                        }
-                    
-                    result = await response.json()
+            session = await self._get_session()
+            
+            async with session.post(
+                f"{self.base_url}/completions", 
+                data=json_dumps_bytes(payload),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"LLM API error: {response.status} - {error_text}")
                     return {
-                        "generated_text": result.get("choices", [{}])[0].get("text", ""),
-                        "model": self.model,
-                        "usage": result.get("usage", {}),
-                        "raw_response": result
+                        "error": True,
+                        "message": f"LLM API returned status {response.status}",
+                        "details": error_text
                     }
+                
+                result = json_loads(await response.read())
+                return {
+                    "generated_text": result.get("choices", [{}])[0].get("text", ""),
+                    "model": self.model,
+                    "usage": result.get("usage", {}),
+                    "raw_response": result
+                }
         
         except Exception as e:
             logger.exception(f"Error generating text with LLM: {str(e)}")
@@ -124,11 +232,7 @@ class LLMClient:
         parameters = parameters or {}
         
         # Create classification prompt
-        prompt = f"""
-        Classify the following text into one of these categories:
-        {', '.join(categories)}
-        
-        Text: {text}
+        prompt = f"""{_classify_prompt_prefix(tuple(categories))}{text}
         
         Category:
         """
@@ -145,8 +249,11 @@ class LLMClient:
         best_match = None
         best_score = 0.0
         
-        for category in categories:
-            if category.lower() in generated_text.lower():
+        # Categories are tried in the caller's order, so the first listed
+        # category mentioned anywhere in the response wins
+        lowered_text = generated_text.lower()
+        for category, lowered_category in _lowered_categories(tuple(categories)):
+            if lowered_category in lowered_text:
                 # Simple exact match for now
                 best_match = category
                 best_score = 1.0
@@ -183,11 +290,7 @@ class LLMClient:
         parameters = parameters or {}
         
         # Create entity extraction prompt
-        prompt = f"""
-        Extract the following entity types from the text:
-        {', '.join(entity_types)}
-        
-        Text: {text}
+        prompt = f"""{_extract_prompt_prefix(tuple(entity_types))}{text}
         
         Entities (JSON format):
         """
@@ -201,13 +304,11 @@ class LLMClient:
         generated_text = result.get("generated_text", "").strip()
         
         try:
-            # Try to parse as JSON
-            json_start = generated_text.find("{")
-            json_end = generated_text.rfind("}")
+            # Try to parse the first embedded JSON object
+            json_str = _extract_json_object(generated_text)
             
-            if json_start >= 0 and json_end > json_start:
-                json_str = generated_text[json_start:json_end+1]
-                entities = json.loads(json_str)
+            if json_str is not None:
+                entities = json_loads(json_str)
             else:
                 # Fallback: parse as simple key-value pairs
                 entities = {}
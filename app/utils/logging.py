@@ -5,14 +5,19 @@ This module provides consistent logging configuration across all components
 of the Four-Sided Triangle system.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
-import json
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
 
+from app.utils.helpers import json_loads
+
 # Default log format
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
@@ -25,6 +30,66 @@ LOG_LEVEL_MAP = {
     "critical": logging.CRITICAL
 }
 
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that batches writes instead of flushing every record.
+    
+    The file is opened lazily with a large write buffer. Records below WARNING
+    stay buffered and are flushed by a background thread every
+    ``flush_interval`` seconds; warnings and errors are flushed immediately so
+    they are never lost to a crash.
+    """
+    
+    def __init__(self, filename: Union[str, Path], mode: str = "a", encoding: Optional[str] = None,
+                 buffer_size: int = 64 * 1024, flush_interval: float = 0.1):
+        self.buffer_size = buffer_size
+        self._emitting_level: Optional[int] = None
+        super().__init__(filename, mode=mode, encoding=encoding, delay=True)
+        
+        self._stop_flushing = threading.Event()
+        self._flush_interval = flush_interval
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-file-flush", daemon=True)
+        self._flusher.start()
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self._emitting_level = record.levelno
+        try:
+            super().emit(record)
+        finally:
+            self._emitting_level = None
+    
+    def flush(self) -> None:
+        # StreamHandler.emit flushes after every record; only let that through
+        # for warnings and above and leave the rest to the periodic flush
+        level = self._emitting_level
+        if level is None or level >= logging.WARNING:
+            super().flush()
+    
+    def _flush_periodically(self) -> None:
+        while not self._stop_flushing.wait(self._flush_interval):
+            self.flush()
+    
+    def close(self) -> None:
+        self._stop_flushing.set()
+        super().close()
+
+# Background listener that performs file log writes off the calling threads
+_file_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def stop_file_logging() -> None:
+    """Flush queued file log records and close the file handler, if any."""
+    global _file_log_listener
+    listener, _file_log_listener = _file_log_listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+atexit.register(stop_file_logging)
+
 def configure_logging(
     level: Union[str, int] = "info",
     log_format: str = DEFAULT_LOG_FORMAT,
@@ -42,6 +107,8 @@ def configure_logging(
         log_to_console: Whether to log to console
         log_directory: Directory for log files, creates if not exists
     """
+    global _file_log_listener
+    
     # Convert string level to logging constant if needed
     if isinstance(level, str):
         level = LOG_LEVEL_MAP.get(level.lower(), logging.INFO)
@@ -53,6 +120,7 @@ def configure_logging(
     # Remove any existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    stop_file_logging()
     
     # Create formatters
     formatter = logging.Formatter(log_format)
@@ -73,9 +141,14 @@ def configure_logging(
         else:
             log_file_path = Path(log_file)
             
-        file_handler = logging.FileHandler(log_file_path)
+        file_handler = BufferedFileHandler(log_file_path)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        
+        # Callers only enqueue records; a listener thread does the file writes
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _file_log_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _file_log_listener.start()
     
     # Log the configuration
     logging.info(f"Logging configured with level={logging.getLevelName(level)}")
@@ -111,8 +184,8 @@ def load_logging_config(config_file: str) -> Dict[str, Any]:
         FileNotFoundError: If the config file doesn't exist
         json.JSONDecodeError: If the config file isn't valid JSON
     """
-    with open(config_file, 'r') as f:
-        config = json.load(f)
+    with open(config_file, 'rb') as f:
+        config = json_loads(f.read())
     
     return config
 
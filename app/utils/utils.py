@@ -11,6 +11,8 @@ import traceback
 from typing import Dict, Any, Callable, Optional
 from fastapi import HTTPException, status
 
+from app.utils.helpers import json_loads
+
 logger = logging.getLogger(__name__)
 
 def error_handler(func):
@@ -26,6 +28,8 @@ def error_handler(func):
     Returns:
         Wrapped function with error handling
     """
+    name = func.__name__
+    
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
         try:
@@ -35,46 +39,46 @@ def error_handler(func):
             raise
         except ValueError as e:
             # Convert validation errors to 400 Bad Request
-            logger.warning(f"Validation error in {func.__name__}: {str(e)}")
+            logger.warning(f"Validation error in {name}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
                     "error": "validation_error",
                     "message": str(e),
-                    "location": func.__name__
+                    "location": name
                 }
             )
         except KeyError as e:
             # Missing key errors to 400 Bad Request
-            logger.warning(f"Missing key in {func.__name__}: {str(e)}")
+            logger.warning(f"Missing key in {name}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
                     "error": "missing_parameter",
                     "message": f"Missing required parameter: {str(e)}",
-                    "location": func.__name__
+                    "location": name
                 }
             )
         except TimeoutError as e:
             # Timeout errors to 408 Request Timeout
-            logger.error(f"Timeout in {func.__name__}: {str(e)}")
+            logger.error(f"Timeout in {name}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_408_REQUEST_TIMEOUT,
                 detail={
                     "error": "timeout",
                     "message": "Operation timed out",
-                    "location": func.__name__
+                    "location": name
                 }
             )
         except Exception as e:
             # All other exceptions become 500 Internal Server Error
-            logger.exception(f"Unexpected error in {func.__name__}: {str(e)}")
+            logger.exception(f"Unexpected error in {name}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail={
                     "error": "internal_server_error",
                     "message": "An unexpected error occurred",
-                    "location": func.__name__
+                    "location": name
                 }
             )
     
@@ -117,7 +121,7 @@ def parse_json_safely(json_str: str, default: Any = None) -> Any:
         return default
         
     try:
-        return json.loads(json_str)
+        return json_loads(json_str)
     except json.JSONDecodeError as e:
         logger.warning(f"Failed to parse JSON: {str(e)}")
         return default
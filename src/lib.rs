@@ -117,6 +117,7 @@ fn four_sided_triangle_core(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(turbulance::annotation::py_get_annotator_statistics, m)?)?;
     m.add_function(wrap_pyfunction!(turbulance::processor::py_create_turbulance_processor, m)?)?;
     m.add_function(wrap_pyfunction!(turbulance::processor::py_process_turbulance_script, m)?)?;
+    m.add_function(wrap_pyfunction!(turbulance::processor::py_process_turbulance_script_pyobj, m)?)?;
     m.add_function(wrap_pyfunction!(turbulance::processor::py_get_processor_statistics, m)?)?;
     m.add_function(wrap_pyfunction!(turbulance::processor::py_update_processor_config, m)?)?;
     m.add_function(wrap_pyfunction!(turbulance::processor::py_remove_processor, m)?)?;
@@ -39,6 +39,7 @@ pub fn turbulance_dsl(_py: Python, m: &PyModule) -> PyResult<()> {
     
     // Main processor functions
     m.add_function(wrap_pyfunction!(processor::py_process_turbulance_script, m)?)?;
+    m.add_function(wrap_pyfunction!(processor::py_process_turbulance_script_pyobj, m)?)?;
     m.add_function(wrap_pyfunction!(processor::py_get_processor_statistics, m)?)?;
     
     Ok(())
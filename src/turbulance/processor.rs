@@ -11,6 +11,7 @@ use super::orchestrator::TurbulanceOrchestrator;
 use super::annotation::TurbulanceAnnotator;
 use super::annotation::AnnotatedScript;
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::sync::{Arc, Mutex};
@@ -338,6 +339,63 @@ pub fn py_process_turbulance_script(
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Serialization failed: {}", e)))
 }
 
+/// Convert a JSON value into the equivalent Python object tree
+fn json_to_py(py: Python<'_>, value: &serde_json::Value) -> PyResult<PyObject> {
+    Ok(match value {
+        serde_json::Value::Null => py.None(),
+        serde_json::Value::Bool(b) => b.to_object(py),
+        serde_json::Value::Number(n) => {
+            if let Some(i) = n.as_i64() {
+                i.to_object(py)
+            } else if let Some(u) = n.as_u64() {
+                u.to_object(py)
+            } else {
+                n.as_f64().unwrap_or(f64::NAN).to_object(py)
+            }
+        }
+        serde_json::Value::String(s) => s.to_object(py),
+        serde_json::Value::Array(items) => {
+            let list = PyList::empty(py);
+            for item in items {
+                list.append(json_to_py(py, item)?)?;
+            }
+            list.to_object(py)
+        }
+        serde_json::Value::Object(map) => {
+            let dict = PyDict::new(py);
+            for (key, item) in map {
+                dict.set_item(key, json_to_py(py, item)?)?;
+            }
+            dict.to_object(py)
+        }
+    })
+}
+
+/// Process a script and return the result as a Python dict, skipping the
+/// JSON string round-trip of `py_process_turbulance_script`
+#[pyfunction]
+pub fn py_process_turbulance_script_pyobj(
+    py: Python<'_>,
+    processor_id: &str,
+    script_content: &str,
+    protocol_name: &str,
+) -> PyResult<PyObject> {
+    let runtime = tokio::runtime::Runtime::new()
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Failed to create runtime: {}", e)))?;
+    
+    let mut registry = PROCESSOR_REGISTRY.lock().unwrap();
+    let processor = registry.get_mut(processor_id)
+        .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>("Processor not found"))?;
+    
+    let result = runtime.block_on(processor.process_protocol(script_content, protocol_name))
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+    
+    let value = serde_json::to_value(&result)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Serialization failed: {}", e)))?;
+    
+    json_to_py(py, &value)
+}
+
 #[pyfunction]
 pub fn py_get_processor_statistics(processor_id: &str) -> PyResult<String> {
     let registry = PROCESSOR_REGISTRY.lock().unwrap();
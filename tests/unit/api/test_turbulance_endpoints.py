@@ -0,0 +1,81 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, MagicMock
+
+# The endpoints module imports the full model and pipeline stack
+endpoints = pytest.importorskip("app.api.endpoints", exc_type=ImportError)
+
+from app.turbulance.orchestrator import ExecutionResult, ProtocolExecutionResult
+
+
+SCRIPT = (
+    'a = pipeline_stage("query_processor", query="x")\n'
+    'b = pipeline_stage("domain_expert", domain="bio", data=a)\n'
+)
+
+
+@pytest.fixture
+def orchestrator():
+    """Create a mock TurbulanceOrchestrator returning a real execution result."""
+    orchestrator = MagicMock()
+    orchestrator.execute_protocol = AsyncMock(return_value=ProtocolExecutionResult(
+        protocol_name="endpoint_protocol",
+        success=True,
+        execution_time=0.5,
+        step_results=[ExecutionResult(step_id="step_0", success=True, result={"answer": 42}, execution_time=0.1)],
+        annotated_script=SCRIPT,
+        auxiliary_files={"fs": "{}"}
+    ))
+    return orchestrator
+
+
+@pytest.fixture
+def client(orchestrator):
+    """Create a test client for the Turbulance endpoints."""
+    app = FastAPI()
+    app.include_router(endpoints.turbulance_router)
+    app.dependency_overrides[endpoints.get_turbulance_orchestrator] = lambda: orchestrator
+    return TestClient(app)
+
+
+class TestTurbulanceEndpoints:
+
+    def test_parse_returns_parsed_script(self, client):
+        """Test that the parse endpoint serializes the (slotted) parsed script."""
+        response = client.post("/turbulance/parse", json={
+            "script_content": SCRIPT, "protocol_name": "endpoint_protocol"
+        })
+
+        assert response.status_code == 200
+        parsed_script = response.json()["data"]["parsed_script"]
+        assert parsed_script["protocol_name"] == "endpoint_protocol"
+        assert len(parsed_script["pipeline_calls"]) == 2
+
+    def test_compile_returns_compiled_protocol(self, client):
+        """Test that the compile endpoint serializes the (slotted) compiled protocol."""
+        response = client.post("/turbulance/compile", json={
+            "script_content": SCRIPT, "protocol_name": "endpoint_protocol"
+        })
+
+        assert response.status_code == 200
+        compiled_protocol = response.json()["data"]["compiled_protocol"]
+        assert compiled_protocol["protocol_name"] == "endpoint_protocol"
+        assert len(compiled_protocol["execution_steps"]) == 2
+
+    def test_execute_returns_execution_result(self, client):
+        """Test that the execute endpoint serializes the (slotted) execution result."""
+        response = client.post("/turbulance/execute", json={
+            "script_content": SCRIPT, "protocol_name": "endpoint_protocol"
+        })
+
+        assert response.status_code == 200
+        execution_result = response.json()["data"]["execution_result"]
+        assert execution_result["success"] is True
+        assert execution_result["step_results"] == [{
+            "step_id": "step_0",
+            "success": True,
+            "result": {"answer": 42},
+            "execution_time": 0.1,
+            "error_message": None
+        }]
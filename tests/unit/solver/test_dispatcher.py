@@ -0,0 +1,149 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from app.solver.dispatcher import SolverDispatcher
+from app.solver.registry import SolverRegistry
+
+
+class SlowSolver:
+    """Solver that runs in an executor thread and records overlapping use."""
+
+    overlapping_uses = 0
+    running = 0
+    max_running = 0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    async def solve_async(self, problem_definition):
+        SlowSolver.running += 1
+        SlowSolver.max_running = max(SlowSolver.max_running, SlowSolver.running)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._solve, problem_definition)
+        finally:
+            SlowSolver.running -= 1
+
+    def _solve(self, problem_definition):
+        if not self._lock.acquire(blocking=False):
+            SlowSolver.overlapping_uses += 1
+            return {"variables": []}
+        try:
+            time.sleep(problem_definition["duration"])
+        finally:
+            self._lock.release()
+        return {"variables": []}
+
+
+@pytest.fixture
+def dispatcher():
+    """Create a SolverDispatcher instance."""
+    return SolverDispatcher()
+
+
+@pytest.fixture
+def slow_solver_info():
+    """Create dispatch information for SlowSolver."""
+    SlowSolver.overlapping_uses = 0
+    SlowSolver.running = 0
+    SlowSolver.max_running = 0
+    return {
+        "solver_id": "slow",
+        "solver_class": SlowSolver,
+        "has_async": True,
+        "has_configure": False,
+        "has_reset": False
+    }
+
+
+class TestRaceSolvers:
+
+    @pytest.mark.asyncio
+    async def test_race_concurrency_follows_each_context_limit(self, dispatcher, slow_solver_info):
+        """Test that the race bound is not fixed by the first context seen."""
+        candidates = [dict(slow_solver_info, solver_id=f"slow{i}") for i in range(3)]
+        problem = {"duration": 0.05}
+
+        await dispatcher._race_solvers(candidates, problem, {"max_concurrent_solves": 1}, "linear", 0)
+        assert SlowSolver.max_running == 1
+
+        SlowSolver.max_running = 0
+        await dispatcher._race_solvers(candidates, problem, {"max_concurrent_solves": 3}, "linear", 0)
+        assert SlowSolver.max_running == 3
+
+
+class TestSolverPool:
+
+    @pytest.mark.asyncio
+    async def test_finished_attempt_returns_solver_to_pool(self, dispatcher, slow_solver_info):
+        """Test that a completed attempt makes its instance available again."""
+        solution, status = await dispatcher._attempt_solve(slow_solver_info, {"duration": 0}, None)
+
+        assert status == "success"
+        assert len(dispatcher._solver_pool["slow"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_attempt_does_not_pool_running_solver(self, dispatcher, slow_solver_info):
+        """Test that a cancelled attempt's instance is never reused while still running."""
+        task = asyncio.ensure_future(
+            dispatcher._attempt_solve(slow_solver_info, {"duration": 0.3}, None)
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert dispatcher._solver_pool.get("slow", []) == []
+
+        solution, status = await dispatcher._attempt_solve(slow_solver_info, {"duration": 0.1}, None)
+
+        assert status == "success"
+        assert SlowSolver.overlapping_uses == 0
+
+
+class TestDispatcherResults:
+
+    @pytest.mark.asyncio
+    async def test_no_solver_result_is_json_serializable(self, dispatcher):
+        """Test that characteristics in results are plain dicts and lists."""
+        problem = {
+            "variables": [{"name": "x", "type": "integer"}, {"name": "y"}],
+            "constraints": [{"type": "leq"}, {"type": "eq"}],
+            "objective": {"type": "linear"},
+            "metadata": {"problem_type": "linear"}
+        }
+
+        with patch("app.solver.dispatcher.solver_registry", SolverRegistry()):
+            result = await dispatcher.solve(problem)
+
+        assert result["status"] == "error"
+        assert json.loads(json.dumps(result))["characteristics"] == {
+            "size": {"variables": 2, "constraints": 2},
+            "constraints": {"types": ["eq", "leq"]},
+            "objective": {"type": "linear"},
+            "variable_types": ["continuous", "integer"]
+        }
+
+    @pytest.mark.asyncio
+    async def test_candidates_are_truncated_after_reranking(self, dispatcher):
+        """Test that a reliable lower-scored solver can be promoted into the candidates."""
+        candidates = [
+            {"solver_id": f"solver{i}", "compatibility_score": 1.0 - i / 10}
+            for i in range(4)
+        ]
+        for candidate in candidates:
+            dispatcher._update_performance_metrics(
+                candidate["solver_id"], "linear", candidate["solver_id"] == "solver3"
+            )
+
+        with patch("app.solver.dispatcher.solver_registry") as registry, \
+                patch.object(dispatcher, "_solve_with_candidates") as solve_with_candidates:
+            registry.find_solvers_for_problem.return_value = candidates
+            await dispatcher.solve({"metadata": {"problem_type": "linear", "characteristics": {"size": 1}}})
+
+        ranked = solve_with_candidates.call_args[0][0]
+        assert [c["solver_id"] for c in ranked] == ["solver3", "solver0", "solver1"]
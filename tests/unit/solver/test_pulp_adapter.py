@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import patch
+
+from app.solver.adapters.pulp_adapter import PuLPOptimizationSolver
+
+
+def make_problem(objective_coefficients, rhs):
+    """Create a two-variable maximization problem with a fixed structure."""
+    return {
+        "objective": {
+            "sense": "maximize",
+            "coefficients": objective_coefficients,
+            "variables": ["x", "y"]
+        },
+        "variables": [{"name": "x"}, {"name": "y"}],
+        "constraints": [
+            {"name": "total", "type": "leq", "coefficients": [1, 1], "variables": ["x", "y"], "rhs": rhs},
+            {"name": "mix", "type": "leq", "coefficients": [2, 0.5], "variables": ["x", "y"], "rhs": rhs}
+        ],
+        "metadata": {"problem_type": "linear"}
+    }
+
+
+@pytest.fixture
+def solver():
+    """Create a PuLPOptimizationSolver instance."""
+    return PuLPOptimizationSolver()
+
+
+class TestPuLPModelCache:
+
+    def test_structurally_identical_problem_reuses_model(self, solver):
+        """Test that a re-solve updates the cached model with the new data."""
+        first = solver.solve(make_problem([1, 2], 4))
+        second = solver.solve(make_problem([3, 1], 5))
+
+        assert first["status"] == "success"
+        assert first["objective_value"] == pytest.approx(8.0)
+        assert second["status"] == "success"
+        assert second["objective_value"] == pytest.approx(25 / 3, rel=1e-6)
+        assert len(solver._model_cache) == 1
+
+    def test_zeroed_constraint_coefficient_is_removed(self, solver):
+        """Test that coefficients updated to zero are dropped from cached constraints."""
+        solver.solve(make_problem([1, 2], 4))
+        problem = make_problem([1, 2], 4)
+        problem["constraints"][0]["coefficients"] = [1, 0]
+        problem["constraints"][1]["coefficients"] = [2, 0]
+        problem["variables"][1]["upper_bound"] = 10
+
+        result = solver.solve(problem)
+
+        assert result["status"] == "success"
+        assert result["objective_value"] == pytest.approx(22.0)
+
+    def test_failed_update_evicts_cached_model(self, solver):
+        """Test that a model is rebuilt instead of reused when updating it fails."""
+        solver.solve(make_problem([1, 2], 4))
+        (stale_model, _, _), = solver._model_cache.values()
+
+        with patch.object(solver, "_update_model", side_effect=TypeError("not a dict")):
+            result = solver.solve(make_problem([3, 1], 5))
+
+        assert result["status"] == "success"
+        assert result["objective_value"] == pytest.approx(25 / 3, rel=1e-6)
+        (fresh_model, _, _), = solver._model_cache.values()
+        assert fresh_model is not stale_model
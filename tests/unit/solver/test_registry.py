@@ -0,0 +1,75 @@
+import pytest
+from unittest.mock import patch
+
+from app.solver.adapters import register_builtin_solvers
+from app.solver.registry import SolverRegistry
+
+
+class DummySolver:
+    """Minimal solver class for registry tests."""
+
+    def solve(self, problem_definition):
+        return {}
+
+
+@pytest.fixture
+def registry():
+    """Create an empty SolverRegistry instance."""
+    return SolverRegistry()
+
+
+class TestLazySolverRegistration:
+
+    def test_builtin_solvers_register_without_importing_backends(self, registry):
+        """Test that built-in adapters are registered by spec and not imported."""
+        with patch("app.solver.adapters.solver_registry", registry), \
+                patch("app.solver.registry.importlib.import_module") as import_module:
+            register_builtin_solvers()
+
+        import_module.assert_not_called()
+        solvers = registry.list_all_solvers()
+        assert {s["solver_id"] for s in solvers} >= {"scipy_optimization", "pulp_optimization"}
+        assert all(isinstance(s["solver_class"], str) for s in solvers)
+
+    def test_spec_is_resolved_on_first_match(self, registry):
+        """Test that a spec-registered solver is imported when it is selected."""
+        registry.register_solver(
+            "pulp", "app.solver.adapters.pulp_adapter:PuLPOptimizationSolver",
+            {"problem_types": ["linear"]}
+        )
+
+        solvers = registry.find_solvers_for_problem("linear", {})
+
+        assert [s["solver_id"] for s in solvers] == ["pulp"]
+        assert solvers[0]["solver_class"].__name__ == "PuLPOptimizationSolver"
+
+    def test_failed_spec_import_is_attempted_once(self, registry):
+        """Test that a solver whose spec cannot be imported is marked unavailable."""
+        registry.register_solver("missing", "app.solver.no_such_module:Solver", {"problem_types": ["linear"]})
+
+        with patch("app.solver.registry.importlib.import_module",
+                   side_effect=ImportError("No module")) as import_module:
+            assert registry.find_solvers_for_problem("linear", {}) == []
+            assert registry.find_solvers_for_problem("linear", {}) == []
+
+        import_module.assert_called_once()
+
+    def test_reregistering_clears_unavailable_solver(self, registry):
+        """Test that registering a solver again retries it."""
+        registry.register_solver("missing", "app.solver.no_such_module:Solver", {"problem_types": ["linear"]})
+        registry.get_solver("missing")
+
+        registry.register_solver("missing", DummySolver, {"problem_types": ["linear"]})
+
+        assert registry.get_solver("missing") is DummySolver
+
+
+class TestFindSolvers:
+
+    def test_find_solvers_returns_all_matches_by_default(self, registry):
+        """Test that find_solvers_for_problem is not truncated unless asked to be."""
+        for i in range(5):
+            registry.register_solver(f"solver{i}", DummySolver, {"problem_types": ["linear"]})
+
+        assert len(registry.find_solvers_for_problem("linear", {})) == 5
+        assert len(registry.find_solvers_for_problem("linear", {}, limit=2)) == 2
@@ -0,0 +1,166 @@
+import numpy as np
+import pytest
+from scipy import optimize, sparse
+from unittest.mock import patch
+
+from app.solver.adapters.scipy_adapter import ScipyOptimizationSolver
+
+
+def shifted_quadratic(x):
+    """Convex objective with its minimum at (1.047, 5)."""
+    return (x[0] - 1.047) ** 2 + (x[1] - 5) ** 2
+
+
+def periodic_objective(x):
+    """Objective with a stationary point at x0 = 0 and a minimum near x0 = 1.047."""
+    return np.cos(3 * x[0]) + (x[1] - 5) ** 2
+
+
+@pytest.fixture
+def solver():
+    """Create a ScipyOptimizationSolver instance."""
+    return ScipyOptimizationSolver()
+
+
+class TestScipyWarmStart:
+
+    def test_warm_start_is_opt_in(self, solver):
+        """Test that no optimum is remembered unless the problem opts in."""
+        solver.solve({
+            "objective": {"function": shifted_quadratic},
+            "metadata": {"problem_type": "nonlinear"}
+        })
+
+        assert solver._last_x == {}
+
+    def test_unrelated_problem_does_not_override_initial_guess(self, solver):
+        """Test that a same-shape problem with another objective starts from its own guess."""
+        solver.solve({
+            "objective": {"function": shifted_quadratic},
+            "initial_guess": [0.0, 0.0],
+            "warm_start": True,
+            "metadata": {"problem_type": "nonlinear"}
+        })
+
+        result = solver.solve({
+            "objective": {"function": periodic_objective},
+            "initial_guess": [0.0, 0.0],
+            "warm_start": True,
+            "metadata": {"problem_type": "nonlinear"}
+        })
+
+        assert result["variables"] == pytest.approx([0.0, 5.0], abs=1e-4)
+
+    def test_explicit_initial_guess_is_never_overridden(self, solver):
+        """Test that the remembered optimum is ignored when an initial guess is given."""
+        problem = {
+            "objective": {"function": periodic_objective},
+            "initial_guess": [1.0, 0.0],
+            "warm_start": True,
+            "metadata": {"problem_type": "nonlinear"}
+        }
+        solver.solve(problem)
+
+        problem["initial_guess"] = [0.0, 0.0]
+        result = solver.solve(problem)
+
+        assert result["variables"] == pytest.approx([0.0, 5.0], abs=1e-4)
+
+    def test_opted_in_problem_reuses_previous_optimum(self, solver):
+        """Test that repeating an opted-in problem starts from its previous optimum."""
+        problem = {
+            "objective": {"function": shifted_quadratic},
+            "warm_start": True,
+            "metadata": {"problem_type": "nonlinear"}
+        }
+        first = solver.solve(problem)
+        second = solver.solve(problem)
+
+        assert len(solver._last_x) == 1
+        assert second["variables"] == pytest.approx(first["variables"])
+        assert second["iterations"] <= first["iterations"]
+
+
+class TestScipyMinimizeOptions:
+
+    def test_lbfgsb_is_not_given_disp(self, solver):
+        """Test that the default unconstrained method gets no deprecated disp option."""
+        with patch("app.solver.adapters.scipy_adapter.optimize.minimize",
+                   wraps=optimize.minimize) as minimize:
+            result = solver.solve({
+                "objective": {"function": shifted_quadratic},
+                "initial_guess": [0.0, 0.0],
+                "metadata": {"problem_type": "nonlinear"}
+            })
+
+        assert result["solver_details"]["method"] == "L-BFGS-B"
+        assert "disp" not in minimize.call_args.kwargs["options"]
+
+    def test_other_methods_keep_disp(self, solver):
+        """Test that methods other than L-BFGS-B still honour the verbose setting."""
+        with patch("app.solver.adapters.scipy_adapter.optimize.minimize",
+                   wraps=optimize.minimize) as minimize:
+            solver.solve({
+                "objective": {"function": shifted_quadratic},
+                "initial_guess": [0.0, 0.0],
+                "metadata": {"problem_type": "nonlinear", "preferred_method": "SLSQP"}
+            })
+
+        assert minimize.call_args.kwargs["options"]["disp"] is False
+
+
+def linear_problem(rhs):
+    """Create a linear problem: minimize -x - y subject to x + y <= rhs."""
+    return {
+        "objective": {"coefficients": [-1.0, -1.0]},
+        "constraints": [{"type": "inequality", "coefficients": [1.0, 1.0], "rhs": rhs}],
+        "bounds": [{"lower": 0}, {"lower": 0}],
+        "metadata": {"problem_type": "linear"}
+    }
+
+
+class TestScipyBatch:
+
+    def test_batch_solves_in_workers_and_keeps_order(self, solver):
+        """Test that worker results come back in problem order."""
+        results = solver.solve_batch([linear_problem(1.0), linear_problem(2.0)], max_workers=2)
+
+        assert [r["status"] for r in results] == ["success", "success"]
+        assert [r["objective_value"] for r in results] == pytest.approx([-1.0, -2.0])
+
+    def test_unpicklable_problem_is_solved_in_process(self, solver):
+        """Test that only the unpicklable problem falls back to this process."""
+        lambda_problem = {
+            "objective": {"function": lambda x: (x[0] - 2) ** 2},
+            "initial_guess": [0.0],
+            "metadata": {"problem_type": "nonlinear"}
+        }
+
+        with patch.object(solver, "solve", wraps=solver.solve) as solve:
+            results = solver.solve_batch([linear_problem(1.0), lambda_problem], max_workers=2)
+
+        solve.assert_called_once_with(lambda_problem)
+        assert results[0]["objective_value"] == pytest.approx(-1.0)
+        assert results[1]["variables"] == pytest.approx([2.0], abs=1e-4)
+
+
+class TestScipyLinear:
+
+    def test_linear_solve_uses_highs_with_csr_constraints(self, solver):
+        """Test that linprog is called with HiGHS and sparse CSR constraint matrices."""
+        problem = linear_problem(2.0)
+        problem["constraints"].append({"type": "equality", "sparse_coefficients": [(0, 1.0)], "rhs": 0.5})
+
+        with patch("app.solver.adapters.scipy_adapter.optimize.linprog",
+                   wraps=optimize.linprog) as linprog:
+            result = solver.solve(problem)
+
+        kwargs = linprog.call_args.kwargs
+        assert kwargs["method"] == "highs"
+        assert "tol" not in kwargs["options"]
+        assert sparse.isspmatrix_csr(kwargs["A_ub"])
+        assert sparse.isspmatrix_csr(kwargs["A_eq"])
+        assert kwargs["A_ub"].toarray().tolist() == [[1.0, 1.0]]
+        assert kwargs["A_eq"].toarray().tolist() == [[1.0, 0.0]]
+        assert result["objective_value"] == pytest.approx(-2.0)
+        assert result["variables"][0] == pytest.approx(0.5)
@@ -0,0 +1,73 @@
+import json
+import pytest
+
+from app.turbulance.parser import TurbulanceParser
+
+
+SCRIPT = (
+    'a = pipeline_stage("query_processor", ratio=NaN, limit=-Infinity, label="café")\n'
+    'b = pipeline_stage("domain_expert", domain="bio", data=a)\n'
+)
+
+
+@pytest.fixture
+def parser():
+    """Create a TurbulanceParser instance."""
+    return TurbulanceParser()
+
+
+@pytest.fixture
+def script(parser):
+    """Parse a script whose parameters include non-finite and non-ASCII values."""
+    return parser.parse_script(SCRIPT, "aux_protocol")
+
+
+class TestAuxiliaryFiles:
+
+    def test_generated_files_match_json_dumps(self, parser, script):
+        """Test that auxiliary files are byte-identical to json.dumps(indent=2)."""
+        files = parser.generate_auxiliary_files(script)
+
+        assert files["fs"] == json.dumps(parser._build_fs_data(script), indent=2)
+        assert files["ghd"] == json.dumps(parser._build_ghd_data(script), indent=2)
+        assert files["hre"] == json.dumps(parser._build_hre_data(script), indent=2)
+
+    def test_non_finite_and_non_ascii_values_are_preserved(self, parser, script):
+        """Test that NaN, Infinity and non-ASCII text are written like json.dumps does."""
+        fs_content = parser.generate_auxiliary_files(script)["fs"]
+
+        assert '"ratio": NaN' in fs_content
+        assert '"limit": -Infinity' in fs_content
+        assert '"label": "caf\\u00e9"' in fs_content
+
+    def test_files_written_to_paths_match_generated_content(self, parser, script, tmp_path):
+        """Test that the file-writing variant produces the same content."""
+        paths = {name: tmp_path / f"aux.{name}" for name in ("fs", "ghd", "hre")}
+        parser.generate_auxiliary_files_to_paths(
+            script, str(paths["fs"]), str(paths["ghd"]), str(paths["hre"])
+        )
+        files = parser.generate_auxiliary_files(script)
+
+        for name, path in paths.items():
+            assert path.read_text(encoding="utf-8") == files[name]
+
+
+class TestParserStructure:
+
+    def test_pipeline_stages_keep_pipeline_order(self, parser):
+        """Test that pipeline_stages is an ordered sequence."""
+        assert list(parser.pipeline_stages) == [
+            "query_processor", "context_analyzer", "domain_expert",
+            "evidence_synthesizer", "uncertainty_quantifier",
+            "result_interpreter", "quality_assessor", "response_generator"
+        ]
+
+    def test_extract_pipeline_sequence(self, parser, script):
+        """Test that pipeline calls are extracted in script order."""
+        sequence = parser.extract_pipeline_sequence(script)
+
+        assert [(step["variable"], step["stage"], step["line_number"]) for step in sequence] == [
+            ("a", "query_processor", 1),
+            ("b", "domain_expert", 2)
+        ]
+        assert sequence[1]["parameters"]["domain"] == "bio"
@@ -0,0 +1,41 @@
+import pytest
+
+from app.turbulance import TurbulanceProcessor
+
+
+SCRIPT = (
+    'a = pipeline_stage("query_processor", query="x")\n'
+    'b = pipeline_stage("domain_expert", domain="bio", data=a)\n'
+)
+
+
+@pytest.fixture
+def processor():
+    """Create a Python-only TurbulanceProcessor."""
+    return TurbulanceProcessor(use_rust_acceleration=False)
+
+
+class TestTurbulanceProcessorCache:
+
+    def test_parse_results_are_independent(self, processor):
+        """Test that mutating a parse result does not affect the next parse."""
+        first = processor.parse_script(SCRIPT, "cached_protocol")
+        first["pipeline_calls"].clear()
+        first["nodes"][0].parsed_data["stage"] = "mutated"
+
+        second = processor.parse_script(SCRIPT, "cached_protocol")
+
+        assert len(second["pipeline_calls"]) == 2
+        assert second["nodes"][0].parsed_data["stage"] == "query_processor"
+
+    def test_compile_cache_hit_is_isolated_from_callers(self, processor):
+        """Test that mutating a compiled protocol does not affect later cache hits."""
+        first = processor.compile_script(SCRIPT, "cached_protocol")
+        first["execution_steps"][0].parameters["injected"] = True
+        first["execution_steps"].pop()
+
+        second = processor.compile_script(SCRIPT, "cached_protocol")
+
+        assert len(processor._compile_cache) == 1
+        assert len(second["execution_steps"]) == 2
+        assert "injected" not in second["execution_steps"][0].parameters
@@ -0,0 +1,133 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.turbulance.compiler import CompiledProtocol, ExecutionMode, ExecutionStep
+
+# The orchestrator imports every pipeline stage service
+orchestrator_module = pytest.importorskip("app.turbulance.orchestrator", exc_type=ImportError)
+TurbulanceOrchestrator = orchestrator_module.TurbulanceOrchestrator
+
+
+class AsyncService:
+    """Async stage service that records its peak concurrency."""
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+
+    async def process_async(self, stage_input):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        return {"step_id": stage_input["step_id"]}
+
+
+class SyncService:
+    """Synchronous stage service that counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def process(self, stage_input):
+        self.calls += 1
+        return {"calls": self.calls}
+
+
+class EntryPointlessService:
+    """Stage service with neither process nor process_async."""
+
+
+def make_step(step_id, stage_name, cpu=1):
+    """Create an execution step without dependencies."""
+    return ExecutionStep(
+        step_id=step_id,
+        stage_name=stage_name,
+        variable_name=step_id,
+        parameters={},
+        dependencies=[],
+        resource_requirements={"cpu": cpu, "time": 1},
+        line_number=1,
+        annotation_target=step_id
+    )
+
+
+@pytest.fixture
+def services():
+    """Create stage services for the orchestrator."""
+    return {
+        "stage0_query_processor": EntryPointlessService(),
+        "stage2_domain_knowledge": SyncService(),
+        "stage5_scoring": AsyncService()
+    }
+
+
+@pytest.fixture
+def orchestrator(services):
+    """Create a TurbulanceOrchestrator backed by the test services."""
+    with patch.object(TurbulanceOrchestrator, "_shared_services", services):
+        yield TurbulanceOrchestrator(orchestrator=MagicMock())
+    TurbulanceOrchestrator.shutdown_executor()
+
+
+class TestTurbulanceOrchestrator:
+
+    def test_construction_tolerates_services_without_entry_point(self, orchestrator):
+        """Test that construction does not probe stage services."""
+        assert orchestrator._invokers == {}
+
+    @pytest.mark.asyncio
+    async def test_service_without_entry_point_fails_only_its_step(self, orchestrator):
+        """Test that an unusable service fails its own step at execution time."""
+        failed = await orchestrator._execute_step(make_step("q", "stage0_query_processor"))
+        succeeded = await orchestrator._execute_step(make_step("s", "stage5_scoring"))
+
+        assert not failed.success
+        assert "stage0_query_processor" in failed.error_message
+        assert succeeded.success
+
+    @pytest.mark.asyncio
+    async def test_parallel_steps_are_not_limited_by_per_step_cpu(self, orchestrator, services):
+        """Test that PARALLEL mode does not use the per-step CPU maximum as its budget."""
+        steps = [make_step(f"step{i}", "stage5_scoring") for i in range(5)]
+        protocol = CompiledProtocol(
+            protocol_name="parallel_protocol",
+            execution_steps=steps,
+            execution_mode=ExecutionMode.PARALLEL,
+            resource_allocation={"cpu_cores": 1},
+            dependency_graph={},
+            annotation_map={},
+            auxiliary_files={}
+        )
+
+        with patch("app.turbulance.orchestrator.os.cpu_count", return_value=8):
+            results = await orchestrator._execute_compiled_protocol(protocol)
+
+        assert all(result.success for result in results)
+        assert services["stage5_scoring"].peak == 5
+
+    @pytest.mark.asyncio
+    async def test_sync_service_runs_on_shared_instance(self, orchestrator, services):
+        """Test that synchronous services run in-process on the shared service object."""
+        await orchestrator._execute_step(make_step("d1", "stage2_domain_knowledge"))
+        result = await orchestrator._execute_step(make_step("d2", "stage2_domain_knowledge"))
+
+        assert result.result == {"calls": 2}
+        assert services["stage2_domain_knowledge"].calls == 2
+
+    def test_orchestrators_share_one_executor(self, orchestrator, services):
+        """Test that all orchestrators use the same thread pool until it is shut down."""
+        with patch.object(TurbulanceOrchestrator, "_shared_services", services):
+            other = TurbulanceOrchestrator(orchestrator=MagicMock())
+
+        executor = orchestrator._get_executor()
+        assert other._get_executor() is executor
+
+        TurbulanceOrchestrator.shutdown_executor()
+
+        assert TurbulanceOrchestrator._shared_executor is None
+        assert orchestrator._get_executor() is not executor